@@ -0,0 +1,46 @@
+import timeit
+
+from hearthbreaker.engine import card_table, card_lookup
+from hearthbreaker.cards import *
+
+
+def construct_all():
+    for card in card_table.values():
+        card()
+
+
+def lookup_all():
+    for card_name in card_table:
+        card_lookup(card_name)
+
+
+def slowest(create, count=5, number=20):
+    """
+    Returns the cards which take the longest to create with the given function, along with the time each takes in
+    microseconds
+    """
+    times = [(timeit.timeit(lambda: create(card_name), number=number) / number * 1e6, card_name)
+             for card_name in card_table]
+    return sorted(times, reverse=True)[:count]
+
+
+def run(number=20):
+    # Builds the prototypes, so that only the copying is timed
+    lookup_all()
+    print("{} cards".format(len(card_table)))
+    print("{:>12} {:>14} {:>14}".format("", "total (ms)", "per card (us)"))
+    for label, create_all in [("construct", construct_all), ("card_lookup", lookup_all)]:
+        total = timeit.timeit(create_all, number=number) / number
+        print("{:>12} {:>14.2f} {:>14.2f}".format(label, total * 1e3, total / len(card_table) * 1e6))
+
+    print()
+    print("slowest to construct:")
+    for time, card_name in slowest(lambda card_name: card_table[card_name]()):
+        print("{:>40} {:>8.2f} us".format(card_name, time))
+    print("slowest to look up:")
+    for time, card_name in slowest(card_lookup):
+        print("{:>40} {:>8.2f} us".format(card_name, time))
+
+
+if __name__ == "__main__":
+    run()
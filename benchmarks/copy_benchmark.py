@@ -0,0 +1,69 @@
+import random
+import timeit
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.cards.heroes import hero_for_class
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import Game, Deck, card_lookup
+from hearthbreaker.cards import *
+
+
+def load_deck(filename):
+    cards = []
+    character_class = CHARACTER_CLASS.MAGE
+
+    with open(filename, "r") as deck_file:
+        contents = deck_file.read()
+        items = contents.splitlines()
+        for line in items[0:]:
+            parts = line.split(" ", 1)
+            count = int(parts[0])
+            for i in range(0, count):
+                card = card_lookup(parts[1])
+                if card.character_class != CHARACTER_CLASS.ALL:
+                    character_class = card.character_class
+                cards.append(card)
+
+    return Deck(cards, hero_for_class(character_class))
+
+
+def game_at_turn(turns, seed):
+    """
+    Creates a game between the bundled zoo and patron decks, and plays it forward the given number of turns with
+    random agents.  Returns None if the game ended before that many turns were played.
+    """
+    random.seed(seed)
+    game = Game([load_deck("zoo.hsdeck"), load_deck("patron.hsdeck")], [RandomAgent(), RandomAgent()])
+    game.pre_game()
+    game.current_player = game.players[1]
+    for turn in range(turns):
+        game.play_single_turn()
+        if game.game_ended:
+            return None
+    return game
+
+
+def copies_per_second(game, number):
+    return number / timeit.timeit(game.copy, number=number)
+
+
+def rollbacks_per_second(game, number):
+    def checkpoint_and_rollback():
+        game.rollback(game.checkpoint())
+
+    return number / timeit.timeit(checkpoint_and_rollback, number=number)
+
+
+def run(turn_counts=(0, 4, 8, 12, 16), number=200, seed=3):
+    print("{:>6} {:>14} {:>16}".format("turn", "copies/sec", "rollbacks/sec"))
+    for turns in turn_counts:
+        game = game_at_turn(turns, seed)
+        if game is None:
+            print("{:>6} {:>14} {:>16}".format(turns, "game over", ""))
+            continue
+        print("{:>6} {:>14.1f} {:>16.1f}".format(turns, copies_per_second(game, number),
+                                                 rollbacks_per_second(game, number)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,320 @@
+"""
+Times the parts of the engine that simulations spend the most time in, and whole games, and compares the results
+of two runs::
+
+    python -m benchmarks.suite run --output before.json
+    python -m benchmarks.suite run --output after.json
+    python -m benchmarks.suite compare before.json after.json --threshold 0.1
+
+Each benchmark is timed several times, and the median time per call is compared.  ``compare`` lists each benchmark
+which got slower or faster by more than the threshold, and exits with status 1 if any got slower.
+"""
+import argparse
+import fnmatch
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.agents.trade_agent import TradeAgent
+from hearthbreaker.engine import Game, card_lookup, card_table
+from hearthbreaker.game_objects import Bindable
+from hearthbreaker.replay import Replay, playback
+from hearthbreaker.serialization.serialization import serialize, deserialize
+from hearthbreaker.tags.status import ChangeAttack
+from benchmarks.copy_benchmark import load_deck, game_at_turn
+
+# The version of the format results are saved in
+_FORMAT = 1
+
+#: The benchmarks, by name, in the order they are run.  Each is a function which sets the benchmark up and returns
+#: the function to time, along with a description of what one call of it does.
+benchmarks = {}
+
+
+def benchmark(name):
+    def register(setup):
+        benchmarks[name] = setup
+        return setup
+    return register
+
+
+def _crowded_game():
+    game = game_at_turn(0, 0)
+    for player in game.players:
+        for name in ["Stormwind Champion", "Dire Wolf Alpha", "Raid Leader", "Flametongue Totem", "Murloc Warleader",
+                     "Timber Wolf", "Grimscale Oracle"]:
+            card_lookup(name).summon(player, game, len(player.minions))
+    return game
+
+
+@benchmark("micro.game_copy")
+def _game_copy():
+    return game_at_turn(8, 3).copy, "copy a game at turn 8"
+
+
+@benchmark("micro.bindable_trigger")
+def _bindable_trigger():
+    obj = Bindable()
+    for index in range(5):
+        obj.bind("event", lambda value: None)
+
+    def trigger():
+        obj.trigger("event", 1)
+    return trigger, "trigger an event with 5 handlers"
+
+
+@benchmark("micro.calculate_stat")
+def _calculate_stat():
+    game = _crowded_game()
+    minions = [minion for player in game.players for minion in player.minions]
+    auras = sum(len(player.object_auras) for player in game.players)
+
+    def calculate():
+        for minion in minions:
+            minion.calculate_stat(ChangeAttack, minion.base_attack)
+    return calculate, "calculate the attack of {} minions under {} auras".format(len(minions), auras)
+
+
+@benchmark("micro.mana_cost")
+def _mana_cost():
+    game = game_at_turn(6, 3)
+    cards = [card for player in game.players for card in player.hand]
+
+    def mana_cost():
+        for card in cards:
+            card.mana_cost()
+    return mana_cost, "find the mana cost of the {} cards in hand at turn 6".format(len(cards))
+
+
+@benchmark("micro.card_lookup")
+def _card_lookup():
+    card_names = list(card_table)
+
+    def lookup():
+        for card_name in card_names:
+            card_lookup(card_name)
+    lookup()
+    return lookup, "look up each of the {} cards".format(len(card_names))
+
+
+@benchmark("micro.deck_draw")
+def _deck_draw():
+    game = game_at_turn(0, 0)
+    deck = game.players[0].deck
+
+    def draw():
+        copied = deck.copy()
+        while copied.can_draw():
+            copied.draw(game)
+    return draw, "copy a deck and draw every card"
+
+
+@benchmark("micro.serialize")
+def _serialize():
+    game = game_at_turn(8, 3)
+    return lambda: serialize(game), "serialize a game at turn 8"
+
+
+@benchmark("micro.deserialize")
+def _deserialize():
+    saved = serialize(game_at_turn(8, 3))
+    return lambda: deserialize(saved, [RandomAgent(), RandomAgent()]), "deserialize a game at turn 8"
+
+
+@benchmark("micro.replay_playback")
+def _replay_playback():
+    with open("tests/replays/example.hsreplay") as file:
+        text = file.read()
+    # Playing a replay back uses it up, so each call reads it again
+    return lambda: playback(Replay(io.StringIO(text))).start(), "read and play back tests/replays/example.hsreplay"
+
+
+def _games(agent_class, count, decks=("zoo.hsdeck", "patron.hsdeck")):
+    loaded = [load_deck(deck) for deck in decks]
+
+    def play():
+        for seed in range(count):
+            Game([deck.copy() for deck in loaded], [agent_class(), agent_class()], seed=seed).start()
+    return play, "play {} games of {} against {} with {}".format(count, decks[0], decks[1], agent_class.__name__)
+
+
+@benchmark("macro.random_games")
+def _random_games():
+    return _games(RandomAgent, 20)
+
+
+@benchmark("macro.random_games_example")
+def _random_games_example():
+    return _games(RandomAgent, 20, ("example.hsdeck", "zoo.hsdeck"))
+
+
+@benchmark("macro.trade_games")
+def _trade_games():
+    return _games(TradeAgent, 2)
+
+
+def _median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def time_benchmark(setup, repeat=5, min_time=0.2):
+    """
+    Times a benchmark
+
+    :param setup: The function which sets the benchmark up
+    :param int repeat: How many times to time the benchmark
+    :param float min_time: The least time in seconds to spend on each timing.  The benchmark is called as many times
+                           as needed to take this long.
+    :return: The benchmark's description, how many calls each timing made and the time per call of each timing
+    :rtype: dict
+    """
+    function, description = setup()
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+    times = [elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)]
+    return {
+        'description': description,
+        'number': number,
+        'times': times,
+        'median': _median(times),
+        'min': min(times),
+    }
+
+
+def _commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, repeat=5, min_time=0.2, progress=None):
+    """
+    Runs benchmarks
+
+    :param names: Patterns matching the names of the benchmarks to run, such as ``micro.*``, or None for all of them
+    :type names: [str]
+    :param int repeat: How many times to time each benchmark
+    :param float min_time: The least time in seconds to spend on each timing
+    :param progress: Called with the name and result of each benchmark as it finishes
+    :type progress: function
+    :return: The results, in the format saved by ``python -m benchmarks.suite run``
+    :rtype: dict
+    """
+    results = {}
+    for name, setup in benchmarks.items():
+        if names is None or any(fnmatch.fnmatch(name, pattern) for pattern in names):
+            results[name] = time_benchmark(setup, repeat, min_time)
+            if progress:
+                progress(name, results[name])
+    return {
+        'format': _FORMAT,
+        'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'commit': _commit(),
+        'python': platform.python_implementation() + " " + platform.python_version(),
+        'platform': platform.platform(),
+        'benchmarks': results,
+    }
+
+
+def compare(old, new, threshold=0.1):
+    """
+    Compares the results of two runs
+
+    :param dict old: The results of the earlier run
+    :param dict new: The results of the later run
+    :param float threshold: How much slower or faster a benchmark must be, as a fraction of its earlier time, to be
+                            counted as a change
+    :return: The name, earlier median time, later median time and change of each benchmark in both runs, and whether
+             each is a regression, an improvement or neither
+    :rtype: [(str, float, float, float, str)]
+    """
+    rows = []
+    for name, result in new['benchmarks'].items():
+        if name not in old['benchmarks']:
+            continue
+        before = old['benchmarks'][name]['median']
+        after = result['median']
+        change = after / before - 1
+        if change > threshold:
+            verdict = "slower"
+        elif change < -threshold:
+            verdict = "faster"
+        else:
+            verdict = ""
+        rows.append((name, before, after, change, verdict))
+    return rows
+
+
+def _format_time(seconds):
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return "{:.2f} {}".format(seconds / scale, unit)
+    return "{:.2f} ns".format(seconds / 1e-9)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Benchmarks the engine")
+    commands = parser.add_subparsers(dest="command")
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("names", nargs="*", help="patterns matching the benchmarks to run (default: all)")
+    run_parser.add_argument("--output", help="the file to save the results to")
+    run_parser.add_argument("--repeat", type=int, default=5, help="how many times to time each benchmark")
+    run_parser.add_argument("--min-time", type=float, default=0.2,
+                            help="the least time in seconds to spend on each timing")
+    run_parser.add_argument("--list", action="store_true", help="list the benchmarks rather than running them")
+    compare_parser = commands.add_parser("compare", help="compare the results of two runs")
+    compare_parser.add_argument("old", help="the results of the earlier run")
+    compare_parser.add_argument("new", help="the results of the later run")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="the fraction a benchmark must change by to be flagged (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.list:
+            for name in benchmarks:
+                print(name)
+            return 0
+
+        def report(name, result):
+            print("{:<32} {:>12} {:>12}  {}".format(name, _format_time(result['median']), _format_time(result['min']),
+                                                     result['description']))
+
+        print("{:<32} {:>12} {:>12}".format("benchmark", "median", "min"))
+        results = run(args.names or None, args.repeat, args.min_time, report)
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=1)
+        return 0
+    elif args.command == "compare":
+        with open(args.old) as file:
+            old = json.load(file)
+        with open(args.new) as file:
+            new = json.load(file)
+        rows = compare(old, new, args.threshold)
+        print("{:<32} {:>12} {:>12} {:>8}".format("benchmark", "before", "after", "change"))
+        for name, before, after, change, verdict in rows:
+            print("{:<32} {:>12} {:>12} {:>+7.1%}  {}".format(name, _format_time(before), _format_time(after), change,
+                                                             verdict))
+        return 1 if any(row[4] == "slower" for row in rows) else 0
+    else:
+        parser.print_help()
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
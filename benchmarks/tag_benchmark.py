@@ -0,0 +1,126 @@
+import hashlib
+import random
+import time
+import timeit
+import unittest
+
+import hearthbreaker.tags.base
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.engine import Game, card_lookup
+from hearthbreaker.tags.action import Heal
+from hearthbreaker.tags.base import ActionTag
+from hearthbreaker.tags.selector import BothPlayer, CharacterSelector
+from hearthbreaker.serialization.serialization import serialize
+from benchmarks.copy_benchmark import load_deck
+
+
+class _OutcomeResult(unittest.TestResult):
+    """
+    Records the outcome of each test, rather than just whether the run passed
+    """
+    def __init__(self):
+        super().__init__()
+        self.outcomes = {}
+
+    def addSuccess(self, test):
+        self.outcomes[test.id()] = "pass"
+
+    def addFailure(self, test, err):
+        self.outcomes[test.id()] = "fail"
+
+    def addError(self, test, err):
+        self.outcomes[test.id()] = "error"
+
+    def addSkip(self, test, reason):
+        self.outcomes[test.id()] = "skip"
+
+
+def run_card_tests():
+    """
+    Runs the card tests, and returns the outcome of each along with the time taken in seconds
+    """
+    suite = unittest.defaultTestLoader.discover("tests/card_tests", pattern="*_tests.py", top_level_dir=".")
+    result = _OutcomeResult()
+    start = time.perf_counter()
+    suite.run(result)
+    return result.outcomes, time.perf_counter() - start
+
+
+def play_games(count):
+    """
+    Plays the given number of games between random agents, and returns a digest of the state each game finished in,
+    along with the time taken in seconds
+    """
+    digest = hashlib.md5()
+    start = time.perf_counter()
+    for seed in range(count):
+        random.seed(seed)
+        game = Game([load_deck("zoo.hsdeck"), load_deck("patron.hsdeck")], [RandomAgent(), RandomAgent()])
+        game.start()
+        digest.update(serialize(game).encode())
+    return digest.hexdigest(), time.perf_counter() - start
+
+
+def crowded_board(number):
+    """
+    Fills both sides of the board with minions that have auras, and returns how long it takes to match every aura
+    against every minion and to run a tag on every character, in microseconds each
+    """
+    random.seed(0)
+    game = Game([load_deck("zoo.hsdeck"), load_deck("patron.hsdeck")], [RandomAgent(), RandomAgent()])
+    game.pre_game()
+    for player in game.players:
+        for name in ["Stormwind Champion", "Dire Wolf Alpha", "Raid Leader", "Flametongue Totem", "Murloc Warleader",
+                     "Timber Wolf", "Grimscale Oracle"]:
+            card_lookup(name).summon(player, game, len(player.minions))
+    owner = game.players[0].minions[0]
+    auras = [aura for player in game.players for aura in player.object_auras]
+    characters = [character for player in game.players for character in [player.hero] + player.minions]
+    tag = ActionTag(Heal(0), CharacterSelector(players=BothPlayer()))
+
+    def match_all():
+        for aura in auras:
+            for character in characters:
+                aura.match(character)
+
+    match_time = timeit.timeit(match_all, number=number) / number / (len(auras) * len(characters))
+    do_time = timeit.timeit(lambda: tag.do(owner), number=number) / number
+    return match_time * 1e6, do_time * 1e6
+
+
+def run(games=100):
+    """
+    Runs the card tests and a set of games with the tags interpreted and then compiled, checking that both give the
+    same results
+    """
+    print("{:>12} {:>14} {:>14} {:>14} {:>14}".format("", "card tests (s)", "games (s)", "aura match (us)",
+                                                      "heal all (us)"))
+    results = {}
+    use_compiled = hearthbreaker.tags.base.use_compiled
+    for label, compiled in [("interpreted", False), ("compiled", True)]:
+        hearthbreaker.tags.base.use_compiled = compiled
+        outcomes, tests_time = run_card_tests()
+        digest, games_time = play_games(games)
+        match_time, do_time = crowded_board(2000)
+        results[label] = (outcomes, digest)
+        print("{:>12} {:>14.2f} {:>14.2f} {:>14.3f} {:>14.2f}".format(label, tests_time, games_time, match_time,
+                                                                      do_time))
+    hearthbreaker.tags.base.use_compiled = use_compiled
+
+    interpreted_outcomes, interpreted_digest = results["interpreted"]
+    compiled_outcomes, compiled_digest = results["compiled"]
+    print()
+    passed = sum(1 for outcome in compiled_outcomes.values() if outcome == "pass")
+    print("{} card tests, {} passed".format(len(compiled_outcomes), passed))
+    differences = sorted(test for test in interpreted_outcomes
+                         if interpreted_outcomes[test] != compiled_outcomes.get(test))
+    for test in differences:
+        print("{}: {} interpreted, {} compiled".format(test, interpreted_outcomes[test], compiled_outcomes.get(test)))
+    if not differences and interpreted_digest == compiled_digest:
+        print("identical results")
+    else:
+        print("results differ")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,7 +1,6 @@
 import abc
 import copy
 
-import random
 from hearthbreaker.cards.base import Card
 
 
@@ -106,7 +105,7 @@ class RandomAgent(DoNothingAgent):
             else:
                 possible_actions = len(attack_minions) + len(playable_cards)
             if possible_actions > 0:
-                action = random.randint(0, possible_actions - 1)
+                action = player.game.rng.randint(0, possible_actions - 1)
                 if player.hero.power.can_use() and action == possible_actions - 1:
                     player.hero.power.use()
                 elif action < len(attack_minions):
@@ -117,11 +116,11 @@ class RandomAgent(DoNothingAgent):
                 return
 
     def choose_target(self, targets):
-        return targets[random.randint(0, len(targets) - 1)]
+        return targets[targets[0].player.game.rng.randint(0, len(targets) - 1)]
 
     def choose_index(self, card, player):
-        return random.randint(0, len(player.minions))
+        return player.game.rng.randint(0, len(player.minions))
 
     def choose_option(self, options, player):
         options = self.filter_options(options, player)
-        return options[random.randint(0, len(options) - 1)]
+        return options[player.game.rng.randint(0, len(options) - 1)]
@@ -30,10 +30,10 @@ class ChooseTargetMixin:
 
         targets = self.prune_targets(all_targets, False)
         if len(targets) == 0:
-            return Util.rand_el(all_targets)
+            return Util.rand_el(all_targets, self.player.game.rng)
 
         if not self.current_trade:
-            return Util.rand_prefer_minion(targets)
+            return Util.rand_prefer_minion(targets, self.player.game.rng)
             # raise Exception("No current trade")
 
         for target in targets:
@@ -41,14 +41,14 @@ class ChooseTargetMixin:
                 return target
 
         # raise Exception("Could not find target {}".format(target))
-        return Util.rand_prefer_minion(targets)
+        return Util.rand_prefer_minion(targets, self.player.game.rng)
 
     def choose_target_friendly(self, targets):
         pruned = self.prune_targets(targets, True)
         if len(pruned) == 0:
-            return Util.rand_el(targets)
+            return Util.rand_el(targets, self.player.game.rng)
 
-        return Util.rand_el(pruned)
+        return Util.rand_el(pruned, self.player.game.rng)
 
     def prune_targets(self, targets, get_friendly):
         res = []
@@ -1,3 +1,8 @@
-from hearthbreaker.cards.minions import *
-from hearthbreaker.cards.spells import *
-from hearthbreaker.cards.weapons import *
\ No newline at end of file
+from hearthbreaker.cards.lazy import export_lazily
+from hearthbreaker.cards import minions, spells, weapons
+
+export_lazily(globals(), {
+    "hearthbreaker.cards.minions": minions.__all__,
+    "hearthbreaker.cards.spells": spells.__all__,
+    "hearthbreaker.cards.weapons": weapons.__all__,
+})
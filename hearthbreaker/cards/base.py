@@ -1,7 +1,6 @@
 import abc
-from functools import reduce
 import hearthbreaker.constants
-from hearthbreaker.constants import CARD_RARITY, MINION_TYPE
+from hearthbreaker.constants import CARD_RARITY, MINION_TYPE, TARGET_KIND
 from hearthbreaker.game_objects import Bindable, GameObject, GameException, Hero
 
 
@@ -23,6 +22,8 @@ class Card(Bindable, GameObject):
     In order to play a card, it should be passed to :meth:`Game.play_card`.  Simply calling :meth:`use` will
     cause its effect, but not update the game state.
     """
+    #: The kind of object this is, for working out which auras can affect it
+    target_kind = TARGET_KIND.CARD
 
     def __init__(self, name, mana, character_class, rarity, collectible, target_func=None,
                  filter_func=_is_spell_targetable, overload=0, ref_name=None, effects=None, buffs=None):
@@ -79,6 +80,33 @@ class Card(Bindable, GameObject):
         self.current_target = None
         self.collectible = collectible
 
+    def __copy__(self):
+        cls = self.__class__
+        new_card = cls.__new__(cls)
+        new_card.__dict__ = self.__dict__.copy()
+        return new_card
+
+    def copy(self):
+        """
+        Creates a copy of this card, which is not attached to any player.
+
+        The copy has its own events, effects, auras and buffs, but shares the rest of its definition (battlecries,
+        deathrattles and so on) with this card.
+
+        :rtype: Card
+        """
+        cls = self.__class__
+        new_card = cls.__new__(cls)
+        # Most cards have no effects, auras or buffs, so those lists are only rebuilt when there is something to clone
+        attributes = self.__dict__.copy()
+        attributes['events'] = {}
+        attributes['effects'] = [effect.clone() for effect in self.effects] if self.effects else []
+        attributes['auras'] = [aura.clone() for aura in self.auras] if self.auras else []
+        attributes['buffs'] = [buff.clone() for buff in self.buffs] if self.buffs else []
+        attributes['_attached'] = False
+        new_card.__dict__ = attributes
+        return new_card
+
     def can_choose(self, player):
         """
         Verifies if this card can be chosen from a list of options (i.e. in Tracking)
@@ -116,15 +144,15 @@ class Card(Bindable, GameObject):
         from hearthbreaker.tags.status import ManaChange
         # Mana appears to be calculated in reverse order from other stats (auras first, then buffs)
 
-        mana = reduce(lambda a, b: b.update(self, a), [aura.status
-                                                       for p in self.player.game.players
-                                                       for aura in p.object_auras
-                                                       if aura.match(self) and isinstance(aura.status, ManaChange)],
-                      self.mana)
-        mana = reduce(lambda a, b: b.update(self, a), [buff.status for buff in self.buffs
-                                                       if isinstance(buff.status, ManaChange) and
-                                                       (not buff.condition or buff.condition.evaluate(self, self))],
-                      mana)
+        mana = self.mana
+        for player in self.player.game.players:
+            if player.object_auras:
+                for aura in player.auras_for(ManaChange, TARGET_KIND.CARD):
+                    if aura.match(self):
+                        mana = aura.status.update(self, mana)
+        for buff in self.buffs:
+            if isinstance(buff.status, ManaChange) and (not buff.condition or buff.condition.evaluate(self, self)):
+                mana = buff.status.update(self, mana)
 
         return mana
 
@@ -492,22 +520,35 @@ class SecretCard(Card, metaclass=abc.ABCMeta):
         super().use(player, game)
         player.secrets.append(self)
         self.player = player
+        self.activate(player)
 
     def reveal(self):
         self.player.trigger("secret_revealed", self)
         self.player.secrets.remove(self)
         self.deactivate(self.player)
 
+    def _respond(self, *args):
+        # Secrets stay bound for as long as they are in play, but can only be revealed during the opponent's turn
+        game = self.player.game
+        if game._secrets_active and self.player is game.other_player:
+            self._reveal(*args)
+
     @abc.abstractmethod
     def _reveal(self, *args):
         pass
 
     @abc.abstractmethod
     def activate(self, player):
+        """
+        Binds :meth:`_respond` to the events which could reveal this secret.  Called when the secret is put into play.
+        """
         pass
 
     @abc.abstractmethod
     def deactivate(self, player):
+        """
+        Unbinds what :meth:`activate` bound.  Called when the secret leaves play.
+        """
         pass
 
     @staticmethod
@@ -0,0 +1,41 @@
+import importlib
+import sys
+
+
+def export_lazily(namespace, exports):
+    """
+    Makes the classes listed in ``exports`` attributes of a package, without importing the modules they are defined in
+    until one of their classes is first asked for.  ``from package import *`` imports them all.
+
+    Modules can only look up missing attributes from Python 3.7 on.  On earlier versions, every module is imported
+    straight away.
+
+    :param dict namespace: The ``globals()`` of the package
+    :param dict exports: The names of the classes to export, as a list keyed by the module they are in
+    """
+    modules = {}
+    for module, names in exports.items():
+        for name in names:
+            modules[name] = module
+    namespace['__all__'] = list(modules)
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        module = modules.get(name)
+        if module is None:
+            if not name.startswith('_'):
+                # Subpackages are attributes of their package once imported
+                try:
+                    return importlib.import_module(package + "." + name)
+                except ImportError:
+                    pass
+            raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    if sys.version_info < (3, 7):
+        for name in modules:
+            __getattr__(name)
+    else:
+        namespace['__getattr__'] = __getattr__
@@ -0,0 +1,70 @@
+"""
+Regenerates :mod:`hearthbreaker.cards.manifest`, which :data:`hearthbreaker.engine.card_table` uses to find each
+card's class without importing every card module.  Run this after adding a card or changing a card's name::
+
+    python -m hearthbreaker.cards.make_manifest
+
+or check that the manifest is up to date with::
+
+    python -m hearthbreaker.cards.make_manifest --check
+
+Cards which aren't in the manifest still work, but every card module is imported the first time one is looked up.
+"""
+import importlib
+import os
+import pkgutil
+import pprint
+import sys
+
+import hearthbreaker.cards
+from hearthbreaker.cards.base import WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard
+
+
+def build_manifest():
+    """
+    Finds the module and class name of every card, by importing every module in :mod:`hearthbreaker.cards` and
+    constructing each card in them.
+
+    Cards already in the manifest keep their place, so that the order of the card table doesn't change.  New cards are
+    added at the end.
+
+    :return: The module and class name of each card, keyed by reference name
+    :rtype: dict
+    """
+    from hearthbreaker.cards.manifest import card_classes
+    for module in pkgutil.walk_packages(hearthbreaker.cards.__path__, hearthbreaker.cards.__name__ + "."):
+        importlib.import_module(module.name)
+
+    found = {}
+    for card_type in [WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard]:
+        for card_class in card_type.__subclasses__():
+            if card_class.__module__.startswith(hearthbreaker.cards.__name__ + "."):
+                found[card_class().ref_name] = (card_class.__module__, card_class.__name__)
+
+    manifest = {ref_name: found.pop(ref_name) for ref_name in card_classes if ref_name in found}
+    manifest.update(sorted(found.items(), key=lambda item: item[1]))
+    return manifest
+
+
+def write_manifest(path, manifest):
+    with open(path, "w") as file:
+        file.write('# Generated by "python -m hearthbreaker.cards.make_manifest".  Do not edit by hand.\n')
+        file.write("\n")
+        file.write("#: The module and class name of every card, keyed by reference name, in the order of the card "
+                   "table\n")
+        file.write("card_classes = {\n")
+        for ref_name, (module, class_name) in manifest.items():
+            file.write("    {}: ({}, {}),\n".format(pprint.pformat(ref_name), pprint.pformat(module),
+                                                    pprint.pformat(class_name)))
+        file.write("}\n")
+
+
+if __name__ == "__main__":
+    from hearthbreaker.cards.manifest import card_classes
+    manifest = build_manifest()
+    if "--check" in sys.argv[1:]:
+        if list(manifest.items()) != list(card_classes.items()):
+            print("hearthbreaker/cards/manifest.py is out of date.  Run python -m hearthbreaker.cards.make_manifest")
+            sys.exit(1)
+    else:
+        write_manifest(os.path.join(os.path.dirname(__file__), "manifest.py"), manifest)
@@ -1,230 +1,225 @@
-from hearthbreaker.cards.spells.neutral import (
-    ArmorPlating,
-    EmergencyCoolant,
-    FinickyCloakfield,
-    ReversingSwitch,
-    RustyHorn,
-    TimeRewinder,
-    WhirlingBlades,
-    TheCoin
-)
+from hearthbreaker.cards.lazy import export_lazily
 
-from hearthbreaker.cards.spells.druid import (
-    Innervate,
-    Moonfire,
-    Claw,
-    Naturalize,
-    Savagery,
-    MarkOfTheWild,
-    PowerOfTheWild,
-    WildGrowth,
-    Wrath,
-    HealingTouch,
-    MarkOfNature,
-    SavageRoar,
-    Bite,
-    SoulOfTheForest,
-    Swipe,
-    Nourish,
-    Starfall,
-    ForceOfNature,
-    Starfire,
-    PoisonSeeds,
-    DarkWispers,
-    Recycle,
-    TreeOfLife,
-    AstralCommunion,
-)
-
-from hearthbreaker.cards.spells.hunter import (
-    HuntersMark,
-    ArcaneShot,
-    BestialWrath,
-    Flare,
-    Tracking,
-    ExplosiveTrap,
-    FreezingTrap,
-    Misdirection,
-    Snipe,
-    DeadlyShot,
-    MultiShot,
-    ExplosiveShot,
-    KillCommand,
-    UnleashTheHounds,
-    AnimalCompanion,
-    SnakeTrap,
-    CallPet,
-    CobraShot,
-    FeignDeath,
-    QuickShot,
-    BearTrap,
-    Powershot,
-)
-
-from hearthbreaker.cards.spells.mage import (
-    ArcaneMissiles,
-    IceLance,
-    MirrorImage,
-    ArcaneExplosion,
-    Frostbolt,
-    ArcaneIntellect,
-    FrostNova,
-    Counterspell,
-    IceBarrier,
-    IceBlock,
-    MirrorEntity,
-    Spellbender,
-    Vaporize,
-    ConeOfCold,
-    Fireball,
-    Polymorph,
-    Blizzard,
-    Flamestrike,
-    Pyroblast,
-    Duplicate,
-    Flamecannon,
-    EchoOfMedivh,
-    UnstablePortal,
-    DragonsBreath,
-    ArcaneBlast,
-)
-
-from hearthbreaker.cards.spells.paladin import (
-    AvengingWrath,
-    BlessedChampion,
-    BlessingOfKings,
-    BlessingOfMight,
-    BlessingOfWisdom,
-    Consecration,
-    DivineFavor,
-    Equality,
-    HammerOfWrath,
-    HandOfProtection,
-    HolyLight,
-    HolyWrath,
-    Humility,
-    LayOnHands,
-    EyeForAnEye,
-    NobleSacrifice,
-    Redemption,
-    Repentance,
-    Avenge,
-    SealOfLight,
-    MusterForBattle,
-    SolemnVigil,
-)
-
-from hearthbreaker.cards.spells.priest import (
-    CircleOfHealing,
-    DivineSpirit,
-    HolyFire,
-    HolyNova,
-    HolySmite,
-    InnerFire,
-    MassDispel,
-    MindBlast,
-    MindControl,
-    MindVision,
-    Mindgames,
-    PowerWordShield,
-    ShadowMadness,
-    ShadowWordDeath,
-    ShadowWordPain,
-    Shadowform,
-    Silence,
-    Thoughtsteal,
-    VelensChosen,
-    Lightbomb,
-    LightOfTheNaaru,
-    Resurrect,
-)
-
-from hearthbreaker.cards.spells.rogue import (
-    Assassinate,
-    Backstab,
-    Betrayal,
-    BladeFlurry,
-    ColdBlood,
-    Conceal,
-    DeadlyPoison,
-    Eviscerate,
-    FanOfKnives,
-    Headcrack,
-    Preparation,
-    Sap,
-    Shadowstep,
-    Shiv,
-    SinisterStrike,
-    Sprint,
-    Vanish,
-    TinkersSharpswordOil,
-    Sabotage,
-    GangUp,
-)
-
-from hearthbreaker.cards.spells.shaman import (
-    AncestralHealing,
-    AncestralSpirit,
-    Bloodlust,
-    EarthShock,
-    FarSight,
-    FeralSpirit,
-    ForkedLightning,
-    FrostShock,
-    Hex,
-    LavaBurst,
-    LightningBolt,
-    LightningStorm,
-    RockbiterWeapon,
-    TotemicMight,
-    Windfury,
-    Reincarnate,
-    Crackle,
-    AncestorsCall,
-    LavaShock,
-    AncestralKnowledge,
-)
-
-from hearthbreaker.cards.spells.warlock import (
-    MortalCoil,
-    Hellfire,
-    ShadowBolt,
-    DrainLife,
-    Soulfire,
-    TwistingNether,
-    Demonfire,
-    SacrificialPact,
-    SiphonSoul,
-    SenseDemons,
-    BaneOfDoom,
-    Shadowflame,
-    Corruption,
-    PowerOverwhelming,
-    Darkbomb,
-    Demonheart,
-    Implosion,
-    Demonwrath,
-    FistOfJaraxxus,
-)
-
-from hearthbreaker.cards.spells.warrior import (
-    BattleRage,
-    Brawl,
-    Charge,
-    Cleave,
-    CommandingShout,
-    Execute,
-    HeroicStrike,
-    InnerRage,
-    MortalStrike,
-    Rampage,
-    ShieldBlock,
-    ShieldSlam,
-    Slam,
-    Upgrade,
-    Whirlwind,
-    BouncingBlade,
-    Crush,
-    BurrowingMine,
-    Revenge,
-)
+export_lazily(globals(), {
+    "hearthbreaker.cards.spells.neutral": [
+        "ArmorPlating",
+        "EmergencyCoolant",
+        "FinickyCloakfield",
+        "ReversingSwitch",
+        "RustyHorn",
+        "TimeRewinder",
+        "WhirlingBlades",
+        "TheCoin",
+    ],
+    "hearthbreaker.cards.spells.druid": [
+        "Innervate",
+        "Moonfire",
+        "Claw",
+        "Naturalize",
+        "Savagery",
+        "MarkOfTheWild",
+        "PowerOfTheWild",
+        "WildGrowth",
+        "Wrath",
+        "HealingTouch",
+        "MarkOfNature",
+        "SavageRoar",
+        "Bite",
+        "SoulOfTheForest",
+        "Swipe",
+        "Nourish",
+        "Starfall",
+        "ForceOfNature",
+        "Starfire",
+        "PoisonSeeds",
+        "DarkWispers",
+        "Recycle",
+        "TreeOfLife",
+        "AstralCommunion",
+    ],
+    "hearthbreaker.cards.spells.hunter": [
+        "HuntersMark",
+        "ArcaneShot",
+        "BestialWrath",
+        "Flare",
+        "Tracking",
+        "ExplosiveTrap",
+        "FreezingTrap",
+        "Misdirection",
+        "Snipe",
+        "DeadlyShot",
+        "MultiShot",
+        "ExplosiveShot",
+        "KillCommand",
+        "UnleashTheHounds",
+        "AnimalCompanion",
+        "SnakeTrap",
+        "CallPet",
+        "CobraShot",
+        "FeignDeath",
+        "QuickShot",
+        "BearTrap",
+        "Powershot",
+    ],
+    "hearthbreaker.cards.spells.mage": [
+        "ArcaneMissiles",
+        "IceLance",
+        "MirrorImage",
+        "ArcaneExplosion",
+        "Frostbolt",
+        "ArcaneIntellect",
+        "FrostNova",
+        "Counterspell",
+        "IceBarrier",
+        "IceBlock",
+        "MirrorEntity",
+        "Spellbender",
+        "Vaporize",
+        "ConeOfCold",
+        "Fireball",
+        "Polymorph",
+        "Blizzard",
+        "Flamestrike",
+        "Pyroblast",
+        "Duplicate",
+        "Flamecannon",
+        "EchoOfMedivh",
+        "UnstablePortal",
+        "DragonsBreath",
+        "ArcaneBlast",
+    ],
+    "hearthbreaker.cards.spells.paladin": [
+        "AvengingWrath",
+        "BlessedChampion",
+        "BlessingOfKings",
+        "BlessingOfMight",
+        "BlessingOfWisdom",
+        "Consecration",
+        "DivineFavor",
+        "Equality",
+        "HammerOfWrath",
+        "HandOfProtection",
+        "HolyLight",
+        "HolyWrath",
+        "Humility",
+        "LayOnHands",
+        "EyeForAnEye",
+        "NobleSacrifice",
+        "Redemption",
+        "Repentance",
+        "Avenge",
+        "SealOfLight",
+        "MusterForBattle",
+        "SolemnVigil",
+    ],
+    "hearthbreaker.cards.spells.priest": [
+        "CircleOfHealing",
+        "DivineSpirit",
+        "HolyFire",
+        "HolyNova",
+        "HolySmite",
+        "InnerFire",
+        "MassDispel",
+        "MindBlast",
+        "MindControl",
+        "MindVision",
+        "Mindgames",
+        "PowerWordShield",
+        "ShadowMadness",
+        "ShadowWordDeath",
+        "ShadowWordPain",
+        "Shadowform",
+        "Silence",
+        "Thoughtsteal",
+        "VelensChosen",
+        "Lightbomb",
+        "LightOfTheNaaru",
+        "Resurrect",
+    ],
+    "hearthbreaker.cards.spells.rogue": [
+        "Assassinate",
+        "Backstab",
+        "Betrayal",
+        "BladeFlurry",
+        "ColdBlood",
+        "Conceal",
+        "DeadlyPoison",
+        "Eviscerate",
+        "FanOfKnives",
+        "Headcrack",
+        "Preparation",
+        "Sap",
+        "Shadowstep",
+        "Shiv",
+        "SinisterStrike",
+        "Sprint",
+        "Vanish",
+        "TinkersSharpswordOil",
+        "Sabotage",
+        "GangUp",
+    ],
+    "hearthbreaker.cards.spells.shaman": [
+        "AncestralHealing",
+        "AncestralSpirit",
+        "Bloodlust",
+        "EarthShock",
+        "FarSight",
+        "FeralSpirit",
+        "ForkedLightning",
+        "FrostShock",
+        "Hex",
+        "LavaBurst",
+        "LightningBolt",
+        "LightningStorm",
+        "RockbiterWeapon",
+        "TotemicMight",
+        "Windfury",
+        "Reincarnate",
+        "Crackle",
+        "AncestorsCall",
+        "LavaShock",
+        "AncestralKnowledge",
+    ],
+    "hearthbreaker.cards.spells.warlock": [
+        "MortalCoil",
+        "Hellfire",
+        "ShadowBolt",
+        "DrainLife",
+        "Soulfire",
+        "TwistingNether",
+        "Demonfire",
+        "SacrificialPact",
+        "SiphonSoul",
+        "SenseDemons",
+        "BaneOfDoom",
+        "Shadowflame",
+        "Corruption",
+        "PowerOverwhelming",
+        "Darkbomb",
+        "Demonheart",
+        "Implosion",
+        "Demonwrath",
+        "FistOfJaraxxus",
+    ],
+    "hearthbreaker.cards.spells.warrior": [
+        "BattleRage",
+        "Brawl",
+        "Charge",
+        "Cleave",
+        "CommandingShout",
+        "Execute",
+        "HeroicStrike",
+        "InnerRage",
+        "MortalStrike",
+        "Rampage",
+        "ShieldBlock",
+        "ShieldSlam",
+        "Slam",
+        "Upgrade",
+        "Whirlwind",
+        "BouncingBlade",
+        "Crush",
+        "BurrowingMine",
+        "Revenge",
+    ],
+})
@@ -105,10 +105,10 @@ class Counterspell(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("card_played", self._reveal)
+        player.opponent.bind("card_played", self._respond)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("card_played", self._reveal)
+        player.opponent.unbind("card_played", self._respond)
 
 
 class IceBarrier(SecretCard):
@@ -122,10 +122,10 @@ class IceBarrier(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self._respond)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self._respond)
 
 
 class MirrorEntity(SecretCard):
@@ -142,11 +142,11 @@ class MirrorEntity(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("minion_played", self._reveal)
+        player.opponent.bind("minion_played", self._respond)
         self.player = player
 
     def deactivate(self, player):
-        player.game.current_player.unbind("minion_played", self._reveal)
+        player.opponent.unbind("minion_played", self._respond)
         self.player = None
 
 
@@ -164,11 +164,11 @@ class Spellbender(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("card_played", self._reveal)
+        player.opponent.bind("card_played", self._respond)
         self.player = player
 
     def deactivate(self, player):
-        player.game.current_player.unbind("card_played", self._reveal)
+        player.opponent.unbind("card_played", self._respond)
         self.player = None
 
 
@@ -183,10 +183,10 @@ class Vaporize(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self._respond)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self._respond)
 
 
 class IceBlock(SecretCard):
@@ -202,10 +202,10 @@ class IceBlock(SecretCard):
                 super().reveal()
 
     def activate(self, player):
-        player.bind("pre_damage", self._reveal)
+        player.bind("pre_damage", self._respond)
 
     def deactivate(self, player):
-        player.unbind("pre_damage", self._reveal)
+        player.unbind("pre_damage", self._respond)
 
 
 class ConeOfCold(SpellCard):
@@ -294,11 +294,11 @@ class Duplicate(SecretCard):
         self.player = None
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self._respond)
         self.player = player
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self._respond)
         self.player = None
 
     def _reveal(self, minion, by):
@@ -198,10 +198,10 @@ class Avenge(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self._respond)
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self._respond)
 
 
 class EyeForAnEye(SecretCard):
@@ -214,10 +214,10 @@ class EyeForAnEye(SecretCard):
         super().reveal()
 
     def activate(self, player):
-        player.bind("character_damaged", self._reveal)
+        player.bind("character_damaged", self._respond)
 
     def deactivate(self, player):
-        player.unbind("character_damaged", self._reveal)
+        player.unbind("character_damaged", self._respond)
 
 
 class NobleSacrifice(SecretCard):
@@ -234,10 +234,10 @@ class NobleSacrifice(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self._respond)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self._respond)
 
 
 class Redemption(SecretCard):
@@ -251,10 +251,10 @@ class Redemption(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self._respond)
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self._respond)
 
 
 class Repentance(SecretCard):
@@ -267,10 +267,10 @@ class Repentance(SecretCard):
         super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("minion_played", self._reveal)
+        player.opponent.bind("minion_played", self._respond)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("minion_played", self._reveal)
+        player.opponent.unbind("minion_played", self._respond)
 
 
 class SealOfLight(SpellCard):
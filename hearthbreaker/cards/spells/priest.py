@@ -159,8 +159,8 @@ class Mindgames(SpellCard):
     def use(self, player, game):
         super().use(player, game)
 
-        minion_card = game.random_draw(game.other_player.deck.cards,
-                                       lambda c: not c.drawn and isinstance(c, MinionCard))
+        minion_card = game.random_draw(game.other_player.deck.undrawn_cards(),
+                                       lambda c: isinstance(c, MinionCard))
         if not minion_card:
             minion_card = ShadowOfNothing()
         else:
@@ -275,7 +275,8 @@ class Thoughtsteal(SpellCard):
     def use(self, player, game):
         super().use(player, game)
         for i in range(0, 2):
-            new_card = game.random_draw(game.other_player.deck.cards, lambda c: not c.drawn)
+            undrawn_cards = game.other_player.deck.undrawn_cards()
+            new_card = game.random_choice(undrawn_cards) if undrawn_cards else None
             if new_card:
                 new_card = copy.copy(new_card)
                 new_card.drawn = True
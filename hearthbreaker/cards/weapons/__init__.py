@@ -1,33 +1,33 @@
-from hearthbreaker.cards.weapons.hunter import (
-    EaglehornBow,
-    GladiatorsLongbow,
-    Glaivezooka,
-)
+from hearthbreaker.cards.lazy import export_lazily
 
-from hearthbreaker.cards.weapons.paladin import (
-    LightsJustice,
-    SwordOfJustice,
-    TruesilverChampion,
-    Coghammer,
-    ArgentLance,
-)
-
-from hearthbreaker.cards.weapons.rogue import (
-    AssassinsBlade,
-    PerditionsBlade,
-    CogmastersWrench,
-)
-
-from hearthbreaker.cards.weapons.shaman import (
-    Doomhammer,
-    StormforgedAxe,
-    Powermace,
-)
-
-from hearthbreaker.cards.weapons.warrior import (
-    FieryWarAxe,
-    ArcaniteReaper,
-    Gorehowl,
-    DeathsBite,
-    OgreWarmaul,
-)
+export_lazily(globals(), {
+    "hearthbreaker.cards.weapons.hunter": [
+        "EaglehornBow",
+        "GladiatorsLongbow",
+        "Glaivezooka",
+    ],
+    "hearthbreaker.cards.weapons.paladin": [
+        "LightsJustice",
+        "SwordOfJustice",
+        "TruesilverChampion",
+        "Coghammer",
+        "ArgentLance",
+    ],
+    "hearthbreaker.cards.weapons.rogue": [
+        "AssassinsBlade",
+        "PerditionsBlade",
+        "CogmastersWrench",
+    ],
+    "hearthbreaker.cards.weapons.shaman": [
+        "Doomhammer",
+        "StormforgedAxe",
+        "Powermace",
+    ],
+    "hearthbreaker.cards.weapons.warrior": [
+        "FieryWarAxe",
+        "ArcaniteReaper",
+        "Gorehowl",
+        "DeathsBite",
+        "OgreWarmaul",
+    ],
+})
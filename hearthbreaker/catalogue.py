@@ -0,0 +1,334 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from hearthbreaker.cards.base import MinionCard, SecretCard, WeaponCard, HeroCard, ChoiceCard
+from hearthbreaker.constants import CARD_TYPE, KEYWORD, MINION_TYPE
+from hearthbreaker.tags.status import Taunt, Charge, DivineShield, Stealth, Windfury, SpellDamage
+
+# The catalogue of every card in card_table, loaded the first time it is asked for
+_catalogue = None
+
+#: Where the catalogue of every card is kept between runs
+DATABASE_PATH = os.path.join(os.path.dirname(__file__), "cards", "cards.db")
+
+# The start of a card database file: a marker, the version of the format, the hash of the sources it was built from
+# and the number of cards in it.  Bump the version whenever the layout changes.
+_HEADER = struct.Struct("<8sI40sI")
+_MAGIC = b"HBCARDDB"
+_VERSION = 1
+
+# The single byte columns, in the order they are stored
+_BYTE_COLUMNS = ["mana", "character_class", "rarity", "card_type", "minion_type", "collectible", "attack", "health"]
+
+# The keywords which minions are given as buffs
+_buff_keywords = [(Taunt, KEYWORD.TAUNT), (Charge, KEYWORD.CHARGE), (DivineShield, KEYWORD.DIVINE_SHIELD),
+                  (Stealth, KEYWORD.STEALTH), (Windfury, KEYWORD.WINDFURY), (SpellDamage, KEYWORD.SPELL_DAMAGE)]
+
+
+def get_catalogue():
+    """
+    Finds the catalogue of every card in :data:`hearthbreaker.engine.card_table`.  It is built the first time it is
+    asked for, and shared from then on.
+
+    :rtype: CardCatalogue
+    """
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = load_catalogue()
+    return _catalogue
+
+
+def build_catalogue():
+    """
+    Builds the catalogue of every card in :data:`hearthbreaker.engine.card_table`, by making each card.  This imports
+    every card module.
+
+    :rtype: CardCatalogue
+    """
+    from hearthbreaker.engine import card_table, card_lookup
+    return CardCatalogue([card_lookup(card_name) for card_name in card_table])
+
+
+def source_hash():
+    """
+    Finds the hash of everything the catalogue is built from: the source of every module in
+    :mod:`hearthbreaker.cards`, of this one, of the modules whose values it stores, :mod:`hearthbreaker.constants`
+    and :mod:`hearthbreaker.tags.status`, and of the modules which turn a card's arguments into what is stored,
+    :mod:`hearthbreaker.game_objects` and :mod:`hearthbreaker.tags.base`.  A card database built from different
+    sources is out of date.
+
+    :return: The hash, as 40 hex digits
+    :rtype: str
+    """
+    digest = hashlib.sha1(sys.byteorder.encode())
+    package_dir = os.path.dirname(__file__)
+    cards_dir = os.path.join(package_dir, "cards")
+    paths = [__file__] + [os.path.join(package_dir, *path) for path in [("constants.py",), ("game_objects.py",),
+                                                                          ("tags", "base.py"), ("tags", "status.py")]]
+    for directory, dirs, files in os.walk(cards_dir):
+        dirs.sort()
+        paths.extend(os.path.join(directory, file) for file in sorted(files) if file.endswith(".py"))
+    for path in paths:
+        digest.update(os.path.relpath(path, cards_dir).encode())
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def load_catalogue(path=DATABASE_PATH):
+    """
+    Loads the catalogue of every card from the card database at ``path``.  If the database is missing or out of date,
+    the catalogue is built from the cards, and the database is written again for next time.  If it can't be written,
+    the catalogue which was built is used anyway.
+
+    :param str path: The path of the card database
+    :rtype: CardCatalogue
+    """
+    digest = source_hash()
+    catalogue = CardCatalogue.open(path, digest)
+    if catalogue is None:
+        catalogue = build_catalogue()
+        try:
+            catalogue.save(path, digest)
+        except OSError:
+            pass
+    return catalogue
+
+
+def _card_type(card):
+    if isinstance(card, MinionCard):
+        return CARD_TYPE.MINION
+    if isinstance(card, SecretCard):
+        return CARD_TYPE.SECRET
+    if isinstance(card, WeaponCard):
+        return CARD_TYPE.WEAPON
+    if isinstance(card, HeroCard):
+        return CARD_TYPE.HERO
+    if isinstance(card, ChoiceCard):
+        return CARD_TYPE.CHOICE
+    return CARD_TYPE.SPELL
+
+
+def _keywords(card, obj):
+    keywords = 0
+    if card.overload:
+        keywords |= KEYWORD.OVERLOAD
+    if getattr(card, 'battlecry', None):
+        keywords |= KEYWORD.BATTLECRY
+    if getattr(card, 'combo', None):
+        keywords |= KEYWORD.COMBO
+    if getattr(card, 'choices', None):
+        keywords |= KEYWORD.CHOOSE
+    if obj is not None:
+        if obj.deathrattle:
+            keywords |= KEYWORD.DEATHRATTLE
+        for buff in obj.buffs:
+            for status_class, keyword in _buff_keywords:
+                if isinstance(buff.status, status_class):
+                    keywords |= keyword
+        if getattr(obj, 'enrage', None):
+            keywords |= KEYWORD.ENRAGE
+    return keywords
+
+
+class CardCatalogue:
+    """
+    The static attributes of a set of cards: those which are the same for every copy of a card, and don't change as
+    the game is played.  They are kept in columns, with one entry for each card, so that questions about the cards can
+    be answered without making any of them.
+
+    Each card is identified by its position in the columns, its id.  Ids are given to the cards in the order they were
+    passed in, and :meth:`select` returns them in that order.
+
+    For cards which aren't minions or weapons, ``attack`` is 0.  ``health`` is a minion's health, a weapon's
+    durability, a hero's health and 0 for anything else.  ``minion_type`` is :const:`MINION_TYPE.NONE` for cards
+    which aren't minions.
+    """
+
+    def __init__(self, cards):
+        """
+        Records the attributes of the given cards.  Minions and weapons are created from their cards, to find their
+        attack, health and keywords.
+
+        :param cards: The cards to record
+        :type cards: [:class:`hearthbreaker.cards.base.Card`]
+        """
+        #: The reference name of each card
+        self.ref_names = []
+        #: The name of each card, in English
+        self.names = []
+        #: The base mana cost of each card
+        self.mana = array('b')
+        #: Each card's :class:`hearthbreaker.constants.CHARACTER_CLASS`
+        self.character_class = array('b')
+        #: Each card's :class:`hearthbreaker.constants.CARD_RARITY`
+        self.rarity = array('b')
+        #: Each card's :class:`hearthbreaker.constants.CARD_TYPE`
+        self.card_type = array('b')
+        #: Each card's :class:`hearthbreaker.constants.MINION_TYPE`
+        self.minion_type = array('b')
+        #: 1 for each card which is collectible, 0 otherwise
+        self.collectible = array('b')
+        #: The base attack of each card's minion or weapon
+        self.attack = array('b')
+        #: The base health of each card's minion or hero, or the durability of its weapon
+        self.health = array('b')
+        #: Each card's :class:`hearthbreaker.constants.KEYWORD` flags
+        self.keywords = array('H')
+        self._ids = {}
+        for card in cards:
+            self._add(card)
+
+    @classmethod
+    def open(cls, path, digest):
+        """
+        Opens a catalogue saved with :meth:`save`.  The file is mapped into memory, and the columns of numbers are read
+        from it directly, rather than being copied.
+
+        :param str path: The path the catalogue was saved to
+        :param str digest: The :func:`source_hash` the catalogue must have been built from
+        :return: The catalogue, or None if there is no catalogue at ``path``, or it is from a different version or
+                 different sources
+        :rtype: CardCatalogue
+        """
+        try:
+            with open(path, "rb") as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(data) < _HEADER.size or _HEADER.unpack_from(data)[:3] != (_MAGIC, _VERSION, digest.encode()):
+            data.close()
+            return None
+        count = _HEADER.unpack_from(data)[3]
+
+        view = memoryview(data)
+        catalogue = cls([])
+        offset = _HEADER.size
+        for name in _BYTE_COLUMNS:
+            setattr(catalogue, name, view[offset:offset + count].cast('b'))
+            offset += count
+        offset += offset % 2
+        catalogue.keywords = view[offset:offset + 2 * count].cast('H')
+        offset += 2 * count
+        strings = bytes(view[offset:]).decode("utf-8").split("\n")
+        catalogue.ref_names = strings[:count]
+        catalogue.names = strings[count:]
+        catalogue._ids = {ref_name: card_id for card_id, ref_name in enumerate(catalogue.ref_names)}
+        return catalogue
+
+    def save(self, path, digest):
+        """
+        Saves the catalogue, so that it can be opened again with :meth:`open`
+
+        :param str path: The path to save to
+        :param str digest: The :func:`source_hash` of the sources the catalogue was built from
+        """
+        count = len(self.ref_names)
+        parts = [_HEADER.pack(_MAGIC, _VERSION, digest.encode(), count)]
+        parts.extend(bytes(getattr(self, name)) for name in _BYTE_COLUMNS)
+        parts.append(b"\0" * ((_HEADER.size + len(_BYTE_COLUMNS) * count) % 2))
+        parts.append(bytes(self.keywords))
+        parts.append("\n".join(self.ref_names + self.names).encode("utf-8"))
+        # Write to a new file and then replace the old one, in case it is open somewhere else
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(b"".join(parts))
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _add(self, card):
+        card_type = _card_type(card)
+        if card_type == CARD_TYPE.MINION:
+            obj = card.create_minion(None)
+            attack, health = obj.base_attack, obj.base_health
+        elif card_type == CARD_TYPE.WEAPON:
+            obj = card.create_weapon(None)
+            attack, health = obj.base_attack, obj.durability
+        elif card_type == CARD_TYPE.HERO:
+            obj = None
+            attack, health = 0, card.health
+        else:
+            obj = None
+            attack, health = 0, 0
+        self._ids[card.ref_name] = len(self.ref_names)
+        self.ref_names.append(card.ref_name)
+        self.names.append(card.name)
+        self.mana.append(card.mana)
+        self.character_class.append(card.character_class)
+        self.rarity.append(card.rarity)
+        self.card_type.append(card_type)
+        self.minion_type.append(card.minion_type if card_type == CARD_TYPE.MINION else MINION_TYPE.NONE)
+        self.collectible.append(1 if card.collectible else 0)
+        self.attack.append(attack)
+        self.health.append(health)
+        self.keywords.append(_keywords(card, obj))
+
+    def __len__(self):
+        return len(self.ref_names)
+
+    def id_of(self, ref_name):
+        """
+        Finds the id of a card
+
+        :param str ref_name: The reference name of the card
+        :return: The card's id, or None if it isn't in the catalogue
+        :rtype: int
+        """
+        return self._ids.get(ref_name)
+
+    def select(self, collectible=None, character_class=None, card_type=None, mana=None, rarity=None,
+               minion_type=None, keywords=0, ids=None):
+        """
+        Finds the cards with the given attributes.  Any attribute which is None isn't checked.  Apart from
+        ``keywords``, each attribute can be given as a set of values, any of which the cards can have.
+
+        :param bool collectible: Whether the cards are collectible
+        :param int character_class: The :class:`hearthbreaker.constants.CHARACTER_CLASS` of the cards
+        :param int card_type: The :class:`hearthbreaker.constants.CARD_TYPE` of the cards
+        :param int mana: The base mana cost of the cards
+        :param int rarity: The :class:`hearthbreaker.constants.CARD_RARITY` of the cards
+        :param int minion_type: The :class:`hearthbreaker.constants.MINION_TYPE` of the cards
+        :param int keywords: :class:`hearthbreaker.constants.KEYWORD` flags which the cards must all have
+        :param ids: The ids of the cards to choose from, or None for every card
+        :type ids: [int]
+        :return: The ids of the cards found, in order
+        :rtype: [int]
+        """
+        if ids is None:
+            ids = range(len(self.ref_names))
+        for column, value in [(self.collectible, collectible), (self.character_class, character_class),
+                              (self.card_type, card_type), (self.mana, mana), (self.rarity, rarity),
+                              (self.minion_type, minion_type)]:
+            if isinstance(value, (set, frozenset)):
+                ids = [card_id for card_id in ids if column[card_id] in value]
+            elif value is not None:
+                value = int(value)
+                ids = [card_id for card_id in ids if column[card_id] == value]
+        if keywords:
+            column = self.keywords
+            ids = [card_id for card_id in ids if column[card_id] & keywords == keywords]
+        return list(ids)
+
+    def cards(self, ids):
+        """
+        Makes the cards with the given ids
+
+        :param ids: The ids of the cards to make
+        :type ids: [int]
+        :rtype: [:class:`hearthbreaker.cards.base.Card`]
+        """
+        from hearthbreaker.engine import card_lookup
+        return [card_lookup(self.ref_names[card_id]) for card_id in ids]
+
+
+if __name__ == "__main__":
+    # Rebuilds the card database: python -m hearthbreaker.catalogue
+    build_catalogue().save(DATABASE_PATH, source_hash())
@@ -95,3 +95,59 @@ class MINION_TYPE:
     def to_str(minion_number):
         types = dict(zip(MINION_TYPE.__types.values(), MINION_TYPE.__types.keys()))
         return types[minion_number].capitalize()
+
+
+class TARGET_KIND:
+    """
+    The kinds of object which an aura can affect
+    """
+    MINION = 1
+    HERO = 2
+    WEAPON = 3
+    CARD = 4
+
+    ALL = (MINION, HERO, WEAPON, CARD)
+
+
+class BOARD_DEPENDENCY:
+    """
+    How much of the board can change whether a condition or selector matches a minion, when another minion joins or
+    leaves it.  Used to avoid checking every aura against every minion each time the board changes.
+    """
+    #: Only the minion joining or leaving the board
+    NONE = 0
+    #: That minion, and the minions next to where it joins or leaves the board
+    ADJACENT = 1
+    #: Any minion on the board
+    ALL = 2
+
+
+class CARD_TYPE:
+    """
+    The kinds of card, as recorded by :class:`hearthbreaker.catalogue.CardCatalogue`
+    """
+    MINION = 1
+    SPELL = 2
+    SECRET = 3
+    WEAPON = 4
+    HERO = 5
+    CHOICE = 6
+
+
+class KEYWORD:
+    """
+    Flags for the keywords a card has, as recorded by :class:`hearthbreaker.catalogue.CardCatalogue`.  A card's
+    keywords are these flags or'd together.
+    """
+    TAUNT = 1
+    CHARGE = 2
+    DIVINE_SHIELD = 4
+    STEALTH = 8
+    WINDFURY = 16
+    SPELL_DAMAGE = 32
+    BATTLECRY = 64
+    DEATHRATTLE = 128
+    COMBO = 256
+    CHOOSE = 512
+    OVERLOAD = 1024
+    ENRAGE = 2048
@@ -0,0 +1,287 @@
+"""
+Rebuilds the table in ``docs/death_times.csv`` of how many turns a deck made of nothing but one card takes to end the
+game, for every collectible card::
+
+    python -m hearthbreaker.death_speed --workers 8
+
+Each card's deck is played against a deck of Wisps which does nothing, by an agent which plays every card it can and
+attacks the enemy hero with everything that can attack, but never uses its hero power.  The game is played up to
+``--runs`` times, and the lowest number of turns is taken, so that cards with random effects are shown at their best.
+Most cards take the same number of turns every time, so a card's games stop early once its lowest number of turns
+hasn't changed for ``--patience`` games in a row.
+
+Each card's games have their own seeds, derived from the seed of the table and the card's name, so the table comes out
+the same however many workers it is spread across.  The results are kept in a cache, keyed by the source of each card's
+class, so only cards whose implementation has changed are played again.  ``--rebuild`` ignores the cache, which is
+needed after a change to the engine rather than to the cards.
+"""
+import argparse
+import copy
+import csv
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent, PredictableAgent
+from hearthbreaker.engine import Game, card_lookup, card_table, derive_seed
+from hearthbreaker.sim import make_deck
+
+#: The table of death times in the documentation
+TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs", "death_times.csv")
+
+#: Where the death time of each card is kept between runs
+CACHE_PATH = os.path.join(os.path.dirname(TABLE_PATH), "death_times_cache.json")
+
+# The card the opponent's deck is made of.  It never plays them.
+_OPPONENT_CARD = "Wisp"
+
+# The source of each top level class of each card module which has been read, keyed by module name and class name
+_class_sources = {}
+
+
+class CardOnlyAgent(PredictableAgent):
+    """
+    Plays each card it can, then attacks with its hero and minions.  Unlike :class:`PredictableAgent`, it never uses
+    its hero power, so that a deck is only as fast as its cards, and it aims its cards at the enemy.
+    """
+
+    def choose_target(self, targets):
+        # The enemy hero first, then the enemy's minions, so that damage is only dealt to this deck's own side when
+        # nothing else can be chosen, such as for a buff which only targets minions
+        enemy = targets[0].player.game.other_player
+        return min(targets, key=lambda target: (target.player is not enemy, target is not enemy.hero))
+
+    def do_turn(self, player):
+        done_something = True
+        while done_something:
+            done_something = False
+            for card in player.hand:
+                if card.can_use(player, player.game):
+                    player.game.play_card(card)
+                    done_something = True
+                    break
+
+        if player.hero.can_attack():
+            player.hero.attack()
+
+        for minion in copy.copy(player.minions):
+            if minion.can_attack():
+                minion.attack()
+
+
+def collectible_cards():
+    """
+    :return: The name of every collectible card, in alphabetical order
+    :rtype: [str]
+    """
+    return sorted(name for name in card_table if card_lookup(name).collectible)
+
+
+def _class_source(cls):
+    # inspect.getsource parses the whole module to find each class, so split each module into its classes only once
+    module = sys.modules[cls.__module__]
+    if module.__name__ not in _class_sources:
+        sources = {}
+        name = None
+        for line in inspect.getsource(module).splitlines(True):
+            if line.startswith("class "):
+                name = line[6:].split("(")[0].split(":")[0].strip()
+                sources[name] = []
+            elif line.strip() and not line[0].isspace() and not line.startswith(")"):
+                name = None
+            if name is not None:
+                sources[name].append(line)
+        _class_sources[module.__name__] = {name: "".join(lines) for name, lines in sources.items()}
+    source = _class_sources[module.__name__].get(cls.__name__)
+    return inspect.getsource(cls) if source is None else source
+
+
+def card_key(card_name, runs, patience, seed):
+    """
+    Makes the key a card's death time is cached under, which changes when the card's implementation or the way its
+    death time is found changes
+
+    :param str card_name: The name of the card
+    :param int runs: The most games played with the card
+    :param int patience: How many games in a row the lowest number of turns must stay the same for to stop early
+    :param int seed: The seed of the table
+    :rtype: str
+    """
+    digest = hashlib.sha1(_class_source(type(card_lookup(card_name))).encode("utf-8"))
+    digest.update(_class_source(CardOnlyAgent).encode("utf-8"))
+    digest.update(json.dumps([card_name, runs, patience, seed]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def death_time(card_name, runs=30, patience=10, seed=0):
+    """
+    Works out how many turns a deck of nothing but one card takes to end the game
+
+    :param str card_name: The name of the card
+    :param int runs: The most games to play
+    :param int patience: Stop once the lowest number of turns hasn't changed for this many games in a row
+    :param int seed: The seed of the table, from which the seed of each game is derived
+    :return: The lowest number of turns any game took, or None if every game raised an error, and how many games were
+             played
+    :rtype: (int, int)
+    """
+    card_seed = derive_seed(seed, card_name)
+    decks = [make_deck([card_name] * 30), make_deck([_OPPONENT_CARD] * 30)]
+    lowest = None
+    unchanged = 0
+    for run in range(runs):
+        game = Game([deck.copy() for deck in decks], [CardOnlyAgent(), DoNothingAgent()],
+                    seed=derive_seed(card_seed, run))
+        try:
+            game.start()
+        except Exception:
+            continue
+        if lowest is None or game._turns_passed < lowest:
+            lowest = game._turns_passed
+            unchanged = 0
+        else:
+            unchanged += 1
+            if unchanged >= patience:
+                return lowest, run + 1
+    return lowest, runs
+
+
+def _time_card(task):
+    card_name, runs, patience, seed = task
+    return (card_name,) + death_time(card_name, runs, patience, seed)
+
+
+def load_cache(path):
+    """
+    :param str path: The cache file
+    :return: The cached key, death time and number of games of each card, by name.  The cache is empty if the file
+             doesn't exist or can't be read.
+    :rtype: dict
+    """
+    try:
+        with open(path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    """
+    Saves the cache, replacing the file all at once so that an interrupted save doesn't lose it
+
+    :param str path: The cache file
+    :param dict cache: The cached results, as returned by :func:`load_cache`
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as cache_file:
+        json.dump(cache, cache_file, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def death_times(card_names, runs=30, patience=10, seed=0, workers=None, cache=None, progress=None):
+    """
+    Works out the death time of each of a list of cards, spreading them across several processes
+
+    :param card_names: The names of the cards
+    :type card_names: [str]
+    :param int runs: The most games to play with each card
+    :param int patience: Stop once the lowest number of turns hasn't changed for this many games in a row
+    :param int seed: The seed of the table
+    :param int workers: How many processes to play the games in, by default one for each CPU
+    :param dict cache: Results from earlier runs, as returned by :func:`load_cache`.  Cards whose key hasn't changed
+                       aren't played again, and the results of the cards which are played are added to it.
+    :param progress: Called with the name, death time and number of games of each card which is played, as it finishes
+    :type progress: function
+    :return: The death time of each card, by name, or None for cards whose every game raised an error
+    :rtype: dict
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if cache is None:
+        cache = {}
+    times = {}
+    keys = {}
+    tasks = []
+    for card_name in card_names:
+        keys[card_name] = card_key(card_name, runs, patience, seed)
+        cached = cache.get(card_name)
+        if cached and cached['key'] == keys[card_name]:
+            times[card_name] = cached['turns']
+        else:
+            tasks.append((card_name, runs, patience, seed))
+
+    def add(card_name, turns, games):
+        times[card_name] = turns
+        cache[card_name] = {'key': keys[card_name], 'turns': turns, 'games': games}
+        if progress:
+            progress(card_name, turns, games)
+
+    if workers == 1:
+        for task in tasks:
+            add(*_time_card(task))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for result in pool.imap_unordered(_time_card, tasks):
+                add(*result)
+    return times
+
+
+def write_table(path, times):
+    """
+    Writes the death times as a CSV table, fastest first
+
+    :param str path: The file to write
+    :param dict times: The death time of each card, by name.  Cards without one are left out.
+    """
+    with open(path, "w", newline="") as table_file:
+        writer = csv.writer(table_file, lineterminator="\n")
+        writer.writerow(["card", "turns"])
+        for card_name, turns in sorted(((name, turns) for name, turns in times.items() if turns is not None),
+                                       key=lambda row: (row[1], row[0])):
+            writer.writerow([card_name, turns])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hearthbreaker.death_speed",
+                                     description="Rebuilds the table of how fast a deck of each card ends the game")
+    parser.add_argument("--output", default=TABLE_PATH, help="the table to write (default: docs/death_times.csv)")
+    parser.add_argument("--cache", default=CACHE_PATH,
+                        help="the file the results are kept in between runs (default: docs/death_times_cache.json)")
+    parser.add_argument("--rebuild", action="store_true", help="play every card again, rather than using the cache")
+    parser.add_argument("--workers", type=int, help="how many processes to play in (default: one per CPU)")
+    parser.add_argument("--runs", type=int, default=30, help="the most games to play with each card (default: 30)")
+    parser.add_argument("--patience", type=int, default=10,
+                        help="stop once a card's lowest number of turns hasn't changed for this many games "
+                             "(default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the table (default: 0)")
+    args = parser.parse_args(argv)
+
+    card_names = collectible_cards()
+    cache = {} if args.rebuild else load_cache(args.cache)
+    played = []
+    start_time = time.perf_counter()
+
+    def report(card_name, turns, games):
+        played.append(card_name)
+        if turns is None:
+            sys.stderr.write("\n{}: every game raised an error\n".format(card_name))
+        sys.stderr.write("\r{} cards played".format(len(played)))
+        sys.stderr.flush()
+
+    try:
+        times = death_times(card_names, args.runs, args.patience, args.seed, args.workers, cache, report)
+    finally:
+        save_cache(args.cache, cache)
+    sys.stderr.write("\n")
+    write_table(args.output, times)
+    print("{} cards, {} played and {} from the cache, in {:.1f}s".format(len(card_names), len(played),
+                                                                          len(card_names) - len(played),
+                                                                          time.perf_counter() - start_time))
+
+
+if __name__ == "__main__":
+    main()
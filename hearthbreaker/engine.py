@@ -1,54 +1,170 @@
+import bisect
+import collections.abc
 import copy
+import hashlib
+import importlib
 import random
 from hearthbreaker.cards.heroes import hero_from_name
+from hearthbreaker.cards.manifest import card_classes
+import hearthbreaker.catalogue
 import hearthbreaker.constants
-from hearthbreaker.game_objects import Bindable, GameException, Minion, Hero, Weapon
+import hearthbreaker.journal
+from hearthbreaker.game_objects import Bindable, GameException, Minion, Hero, Weapon, invalidate_stats
 import hearthbreaker.tags
 from hearthbreaker.tags.base import Effect, AuraUntil
 import hearthbreaker.targeting
 
 
-card_table = {}
-
-
-def __create_card_table():
-    from hearthbreaker.cards.base import WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard
+class CardTable(collections.abc.Mapping):
+    """
+    The class of every card, keyed by reference name, in the order of :mod:`hearthbreaker.cards.manifest`.  A card's
+    module is only imported the first time its class is asked for, so a process only loads the cards it uses.
 
-    def __card_lookup_rec(card_type):
-        subclasses = card_type.__subclasses__()
-        for sc in subclasses:
-            c = sc()
-            card_table[c.ref_name] = sc
+    A card in :mod:`hearthbreaker.cards` which isn't in the manifest is found by importing every card module and
+    constructing the cards which aren't listed, then added to the end of the table.
+    """
 
-    for card_class in [WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard]:
-        __card_lookup_rec(card_class)
+    def __init__(self, manifest):
+        self._manifest = dict(manifest)
+        self._classes = {}
+        self._searched = False
+
+    def __getitem__(self, ref_name):
+        card_class = self._classes.get(ref_name)
+        if card_class is None:
+            if ref_name not in self._manifest and not self._searched:
+                self._find_unlisted()
+            module, class_name = self._manifest[ref_name]
+            card_class = getattr(importlib.import_module(module), class_name)
+            self._classes[ref_name] = card_class
+        return card_class
+
+    def __iter__(self):
+        return iter(self._manifest)
+
+    def __len__(self):
+        return len(self._manifest)
+
+    def _find_unlisted(self):
+        self._searched = True
+        from hearthbreaker.cards.base import WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard
+        import hearthbreaker.cards
+        for name in hearthbreaker.cards.__all__:
+            getattr(hearthbreaker.cards, name)
+        listed = set(self._manifest.values())
+        for card_type in [WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard]:
+            for sc in card_type.__subclasses__():
+                if sc.__module__.startswith("hearthbreaker.cards.") and (sc.__module__, sc.__name__) not in listed:
+                    ref_name = sc().ref_name
+                    self._manifest[ref_name] = (sc.__module__, sc.__name__)
+                    self._classes[ref_name] = sc
+
+
+card_table = CardTable(card_classes)
+# One instance of each card, keyed by ref_name, which card_lookup copies rather than constructing a new card
+card_prototypes = {}
 
 
 def card_lookup(card_name):
     """
     Given a the name of a card as a string, return an object corresponding to that card
 
+    Each card is only constructed once.  The card returned is a copy of that prototype, which shares its battlecries,
+    deathrattles and so on, but has its own events, effects, auras and buffs.
+
     :param str card_name: A string representing the name of the card in English
     :return: An instance of a subclass of Card corresponding to the given card name or None if no Card
              by that name exists.
     :rtype: hearthbreaker.game_objects.Card
     """
 
-    card = card_table[card_name]
-    if card is not None:
-        return card()
-    return None
+    prototype = card_prototypes.get(card_name)
+    if prototype is None:
+        card = card_table[card_name]
+        if card is None:
+            return None
+        prototype = card()
+        card_prototypes[card_name] = prototype
+    return prototype.copy()
 
 
 def get_cards():
-    card_list = filter(lambda c: c.collectible,
-                       [card() for card in card_table.values()])
-    return card_list
+    catalogue = hearthbreaker.catalogue.get_catalogue()
+    return catalogue.cards(catalogue.select(collectible=True))
+
+
+class EventRouter(Bindable):
+    """
+    Holds the handlers bound to the events of the players in a game.  Handlers are indexed by the name of the event and
+    the player it was bound on, so triggering an event on one player only looks at the handlers bound on that player,
+    and the players don't each need their own events.
+
+    Handlers are bound and triggered through :meth:`Player.bind`, :meth:`Player.trigger` and so on, rather than on the
+    router directly.
+    """
+
+    def player_events(self, player):
+        """
+        Finds the handlers bound on a player
+
+        :param Player player: The player to find the handlers of
+        :return: The lists of handlers bound on the player, keyed by event name
+        :rtype: dict
+        """
+        return {key[0]: handlers for key, handlers in self.events.items() if key[1] is player}
+
+
+def derive_seed(seed, index):
+    """
+    Derives a new seed from a seed and an index, such as the seed of one game in a batch of games.  The same seed and
+    index always give the same result, in any process.
+
+    :param int seed: The seed to derive from
+    :param int index: Which of the derived seeds to find
+    :return: A 64 bit seed
+    :rtype: int
+    """
+    digest = hashlib.sha256("{}/{}".format(seed, index).encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class GlobalRandom:
+    """
+    The random number generator of a game without a seed.  It passes everything through to the global :mod:`random`
+    module, and unlike the module, can be copied and pickled along with the game.
+    """
+
+    def __getattr__(self, name):
+        return getattr(random, name)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
 
 class Game(Bindable):
-    def __init__(self, decks, agents):
+    _journal = None
+
+    def __init__(self, decks, agents, seed=None):
+        """
+        Sets up a game between two players
+
+        :param decks: The deck of each player
+        :type decks: [:class:`Deck`]
+        :param agents: The agent which makes the decisions for each player
+        :type agents: [:class:`hearthbreaker.agents.basic_agents.DoNothingAgent`]
+        :param int seed: The seed for the game's random number generator.  Every random decision in the game, including
+                         those the bundled agents make, comes from this generator, so the same seed and decks give the
+                         same game in any process.  If None, the game uses the global :mod:`random` module.
+        """
         super().__init__()
+        self.seed = seed
+        #: The source of every random number in the game.  Anything with the methods of :class:`random.Random` can be
+        #: used instead.
+        self.rng = GlobalRandom() if seed is None else random.Random(seed)
+        self.router = EventRouter()
         self.delayed_minions = set()
         self.first_player = self._generate_random_between(0, 1)
         if self.first_player is 0:
@@ -68,6 +184,8 @@ class Game(Bindable):
         self._has_turn_ended = True
         self._all_cards_played = []
         self._turns_passed = 0
+        # Whether the secrets of the player whose turn it isn't can be revealed
+        self._secrets_active = False
         self.selected_card = None
 
     def random_draw(self, cards, requirement):
@@ -83,7 +201,21 @@ class Game(Bindable):
         return self._generate_random_between(minimum, maximum)
 
     def _generate_random_between(self, lowest, highest):
-        return random.randint(lowest, highest)
+        return self.rng.randint(lowest, highest)
+
+    def child_seed(self, index):
+        """
+        Finds a seed for a game derived from this one, such as a copy to simulate from.  The same seed and index
+        always give the same child seed, and drawing one doesn't change this game's random numbers.  A game without a
+        seed draws the child seed from its generator instead.
+
+        :param int index: Which child to find the seed of
+        :return: A 64 bit seed
+        :rtype: int
+        """
+        if self.seed is None:
+            return self.rng.getrandbits(64)
+        return derive_seed(self.seed, index)
 
     def check_delayed(self):
         sorted_minions = sorted(self.delayed_minions, key=lambda m: m.born)
@@ -140,6 +272,8 @@ class Game(Bindable):
         self._start_turn()
         self.current_player.agent.do_turn(self.current_player)
         self._end_turn()
+        if self.game_ended:
+            self.trigger("game_ended")
 
     def _start_turn(self):
         if not self._has_turn_ended:  # when a game is copied, the turn isn't ended before the next one starts
@@ -151,6 +285,7 @@ class Game(Bindable):
             self.current_player = self.players[0]
             self.other_player = self.players[1]
             self._turns_passed += 1
+        invalidate_stats()
         if self._turns_passed >= 50:
             self.players[0].hero.dead = True
             self.players[1].hero.dead = True
@@ -158,7 +293,11 @@ class Game(Bindable):
         if self.current_player.max_mana < 10:
             self.current_player.max_mana += 1
 
+        self._secrets_active = True
+        # Secrets are revealed after any other handler bound before the turn started, even one bound after the secret
+        # was played, so each is moved to the end of the handlers of its events
         for secret in self.other_player.secrets:
+            secret.deactivate(self.other_player)
             secret.activate(self.other_player)
         for minion in self.current_player.minions:
             minion.attacks_performed = 0
@@ -196,40 +335,94 @@ class Game(Bindable):
         for aura in copy.copy(self.current_player.object_auras):
             if aura.expires:
                 self.current_player.object_auras.remove(aura)
+                self.current_player._aura_index = {}
                 aura.unapply()
 
-        for secret in self.other_player.secrets:
-            secret.deactivate(self.other_player)
+        self._secrets_active = False
+        invalidate_stats()
 
         self.check_delayed()
         self._has_turn_ended = True
 
-    def copy(self):
-        copied_game = copy.copy(self)
-        copied_game.events = {}
-        copied_game._all_cards_played = []
-        copied_game.players = [player.copy(copied_game) for player in self.players]
-        if self.current_player is self.players[0]:
-            copied_game.current_player = copied_game.players[0]
-            copied_game.other_player = copied_game.players[1]
-        else:
-            copied_game.current_player = copied_game.players[1]
-            copied_game.other_player = copied_game.players[0]
-
-        copied_game.current_player.opponent = copied_game.other_player
-        copied_game.other_player.opponent = copied_game.current_player
-        copied_game._has_turn_ended = self._has_turn_ended
-
-        for player in copied_game.players:
-            player.hero.attach(player.hero, player)
-            if player.weapon:
-                player.weapon.attach(player.hero, player)
-            for minion in player.minions:
-                minion.attach(minion, player)
-
-        for secret in copied_game.other_player.secrets:
-            secret.activate(copied_game.other_player)
-        return copied_game
+    def copy(self, seed=None):
+        """
+        Copies this game, so that it can be played on without changing this one.
+
+        :param int seed: A seed for the copy's random number generator, such as one from :meth:`child_seed`.  If None,
+                         the copy carries on from the same point in the same random numbers as this game, or shares
+                         the global :mod:`random` module with it if this game has no seed.
+        :rtype: Game
+        """
+        with hearthbreaker.journal.suspended():
+            copied_game = copy.copy(self)
+            if seed is not None:
+                copied_game.seed = seed
+                copied_game.rng = random.Random(seed)
+            else:
+                copied_game.rng = copy.copy(self.rng)
+            copied_game.events = {}
+            copied_game.router = EventRouter()
+            copied_game._journal = None
+            copied_game.delayed_minions = set()
+            copied_game._all_cards_played = []
+            copied_game.players = [player.copy(copied_game) for player in self.players]
+            if self.current_player is self.players[0]:
+                copied_game.current_player = copied_game.players[0]
+                copied_game.other_player = copied_game.players[1]
+            else:
+                copied_game.current_player = copied_game.players[1]
+                copied_game.other_player = copied_game.players[0]
+
+            copied_game.current_player.opponent = copied_game.other_player
+            copied_game.other_player.opponent = copied_game.current_player
+            copied_game._has_turn_ended = self._has_turn_ended
+
+            for player in copied_game.players:
+                player.hero.attach(player.hero, player)
+                if player.weapon:
+                    player.weapon.attach(player.hero, player)
+                for minion in player.minions:
+                    minion.attach(minion, player)
+                for secret in player.secrets:
+                    secret.activate(player)
+
+            return copied_game
+
+    def checkpoint(self):
+        """
+        Opens a checkpoint, which the game can later be rolled back to.  This is a cheaper alternative to
+        :meth:`copy` for trying out a sequence of actions and then undoing them.  Checkpoints can be nested.
+
+        While a checkpoint is open, no other game should be played.  See :class:`hearthbreaker.journal.Journal` for
+        what is recorded.
+
+        :return: A token identifying the checkpoint, to pass to :meth:`rollback` or :meth:`commit`
+        :rtype: int
+        """
+        if self._journal is None:
+            self._journal = hearthbreaker.journal.Journal(self)
+        return self._journal.checkpoint()
+
+    def rollback(self, token):
+        """
+        Reverts the game to the state it was in when the checkpoint was opened.  The checkpoint, and any opened
+        after it, are closed.
+
+        :param int token: The token returned by :meth:`checkpoint`
+        """
+        if self._journal is None:
+            raise GameException("There is no open checkpoint {0}".format(token))
+        self._journal.rollback(token)
+
+    def commit(self, token):
+        """
+        Keeps the changes made since the checkpoint was opened.  The checkpoint, and any opened after it, are closed.
+
+        :param int token: The token returned by :meth:`checkpoint`
+        """
+        if self._journal is None:
+            raise GameException("There is no open checkpoint {0}".format(token))
+        self._journal.commit(token)
 
     def play_card(self, card):
         if self.game_ended:
@@ -255,6 +448,7 @@ class Game(Bindable):
             card._placeholder.index = index
             card._placeholder.card = card
             card._placeholder.player = self.current_player
+        invalidate_stats()
         self.current_player.trigger("card_played", card, card_index)
 
         if not card.cancel:
@@ -288,10 +482,13 @@ class Game(Bindable):
         new_game._turns_passed = d['turn_count']
         new_game.delayed_minions = set()
         new_game.game_ended = False
-        new_game.random_func = random.randint
+        new_game.seed = None
+        new_game.rng = GlobalRandom()
         new_game.events = {}
+        new_game.router = EventRouter()
         new_game.players = [Player.__from_json__(pd, new_game, None) for pd in d["players"]]
         new_game._has_turn_ended = False
+        new_game._secrets_active = False
         if d["active_player"] == 1:
             new_game.current_player = new_game.players[0]
             new_game.other_player = new_game.players[1]
@@ -319,13 +516,15 @@ class Game(Bindable):
                 minion.attach(minion, player)
                 if minion.health != minion.calculate_max_health():
                     minion.enraged = True
+            for secret in player.secrets:
+                secret.activate(player)
             index += 1
         return new_game
 
 
 class Player(Bindable):
     def __init__(self, name, deck, agent, game):
-        super().__init__()
+        # A player's handlers are kept by the game's router, rather than in events of its own
         self.game = game
         self.hero = deck.hero.create_hero(self)
         self.hero.card = deck.hero
@@ -338,6 +537,9 @@ class Player(Bindable):
         self.graveyard = []
         self.hand = []
         self.object_auras = []
+        # The object auras which could affect each kind of object, split up by status class.  Filled in as they are
+        # asked for, and replaced whenever object_auras changes
+        self._aura_index = {}
         self.player_auras = []
         self.fatigue = 0
         self.agent = agent
@@ -358,15 +560,30 @@ class Player(Bindable):
     def __str__(self):  # pragma: no cover
         return "Player: " + self.name
 
+    @property
+    def events(self):
+        return self.game.router.player_events(self)
+
+    def bind(self, event, function):
+        self.game.router.bind((event, self), function)
+
+    def bind_once(self, event, function):
+        self.game.router.bind_once((event, self), function)
+
+    def unbind(self, event, function):
+        self.game.router.unbind((event, self), function)
+
+    def trigger(self, event, *args):
+        self.game.router.trigger((event, self), *args)
+
     def copy(self, new_game):
         copied_player = Player(self.name, self.deck.copy(), self.agent, new_game)
 
         copied_player.hero = self.hero.copy(copied_player)
         copied_player.graveyard = copy.copy(self.graveyard)
         copied_player.minions = [minion.copy(copied_player, new_game) for minion in self.minions]
-        copied_player.hand = [copy.copy(card) for card in self.hand]
+        copied_player.hand = [card.copy() for card in self.hand]
         for card in copied_player.hand:
-            card._attached = False
             card.attach(card, copied_player)
         copied_player.spell_damage = self.spell_damage
         copied_player.mana = self.mana
@@ -377,19 +594,18 @@ class Player(Bindable):
         if self.weapon:
             copied_player.weapon = self.weapon.copy(copied_player)
         for effect in self.effects:
-            effect = copy.copy(effect)
-            copied_player.add_effect(effect)
+            copied_player.add_effect(effect.clone())
         copied_player.secrets = []
         for secret in self.secrets:
-            new_secret = type(secret)()
+            new_secret = secret.copy()
             new_secret.player = copied_player
             copied_player.secrets.append(new_secret)
         for aura in filter(lambda a: isinstance(a, AuraUntil), self.player_auras):
-            aura = copy.deepcopy(aura)
+            aura = aura.clone()
             aura.owner = copied_player.hero
             copied_player.add_aura(aura)
         for aura in filter(lambda a: isinstance(a, AuraUntil), self.object_auras):
-            aura = copy.deepcopy(aura)
+            aura = aura.clone()
             aura.owner = copied_player.hero
             copied_player.add_aura(aura)
         copied_player.effect_count = dict()
@@ -453,9 +669,11 @@ class Player(Bindable):
             self.player_auras.append(aura)
         else:
             self.object_auras.append(aura)
+            self._aura_index = {}
         if not aura.owner:
             aura.set_owner(self.hero)
         aura.apply()
+        invalidate_stats()
 
     def remove_aura(self, aura):
         if isinstance(aura.selector, hearthbreaker.tags.selector.PlayerSelector):
@@ -464,9 +682,29 @@ class Player(Bindable):
             for an_aura in self.object_auras:
                 if an_aura.eq(aura):
                     self.object_auras.remove(an_aura)
+                    self._aura_index = {}
                     aura = an_aura
                     break
         aura.unapply()
+        invalidate_stats()
+
+    def auras_for(self, status_class, target_kind):
+        """
+        Finds the object auras of this player which have a status of the given class, and which could affect objects
+        of the given kind.  Whether an aura actually affects a particular object still needs to be checked with
+        :meth:`hearthbreaker.tags.base.Aura.match`.
+
+        :param type status_class: The class of :class:`hearthbreaker.tags.base.Status` to look for
+        :param int target_kind: The kind of object, from :class:`hearthbreaker.constants.TARGET_KIND`
+        :return: The auras, in the order they were added.  The list must not be changed.
+        :rtype: list[hearthbreaker.tags.base.Aura]
+        """
+        auras = self._aura_index.get((status_class, target_kind))
+        if auras is None:
+            auras = [aura for aura in self.object_auras
+                     if isinstance(aura.status, status_class) and target_kind in aura.selector.target_kinds()]
+            self._aura_index[status_class, target_kind] = auras
+        return auras
 
     def choose_target(self, targets):
         return self.agent.choose_target(targets)
@@ -545,41 +783,66 @@ class Deck:
         for card in cards:
             card.drawn = False
         self.left = 30
+        # The positions in cards of the cards which haven't been drawn, in order.  Keeping them in the order of the
+        # deck means a random index picks out the same card as filtering the whole deck would, so replays still match
+        self._undrawn = list(range(30))
 
     def copy(self):
-        def copy_card(card):
-            new_card = type(card)()
-            new_card.drawn = card.drawn
-            return new_card
         new_deck = Deck.__new__(Deck)
-        new_deck.cards = [copy_card(card) for card in self.cards]
+        new_deck.cards = [card.copy() for card in self.cards]
         new_deck.hero = self.hero
         new_deck.left = self.left
+        new_deck._undrawn = list(self._undrawn)
         return new_deck
 
     def can_draw(self):
         return self.left > 0
 
+    def _undrawn_positions(self):
+        # A card can also be taken out of the deck by setting its drawn flag and left directly, which is caught here
+        if len(self._undrawn) != self.left:
+            self._undrawn = [position for position, card in enumerate(self.cards) if not card.drawn]
+        return self._undrawn
+
+    def undrawn_cards(self):
+        """
+        Returns the cards which haven't been drawn from this deck yet, in the order they appear in the deck.
+
+        :rtype: [:class:`hearthbreaker.cards.base.Card`]
+        """
+        cards = self.cards
+        return [cards[position] for position in self._undrawn_positions()]
+
     def draw(self, game):
         if not self.can_draw():
             raise GameException("Cannot draw more than 30 cards")
-        card = game.random_draw(self.cards, lambda c: not c.drawn)
+        undrawn = self._undrawn_positions()
+        card = self.cards[undrawn.pop(game.random_amount(0, len(undrawn) - 1))]
         card.drawn = True
         self.left -= 1
         return card
 
+    def remove_card(self, card):
+        """
+        Removes a card which hasn't been drawn from the deck, without drawing it.
+
+        :param hearthbreaker.cards.base.Card card: The card to remove, which must be one of :meth:`undrawn_cards`
+        """
+        self._undrawn_positions().remove(self.cards.index(card))
+        card.drawn = True
+        self.left -= 1
+
     def put_back(self, card):
         if not card:
             raise TypeError("Expected a card, not None")
-        for deck_card in self.cards:
-            if deck_card == card:
-                if not card.drawn:
-                    raise GameException("Tried to put back a card that hadn't been used yet")
-                deck_card.drawn = False
-                self.left += 1
-                return
+        if card in self.cards:
+            if not card.drawn:
+                raise GameException("Tried to put back a card that hadn't been used yet")
+            bisect.insort(self._undrawn_positions(), self.cards.index(card))
+        else:
+            self._undrawn_positions().append(len(self.cards))
+            self.cards.append(card)
         card.drawn = False
-        self.cards.append(card)
         self.left += 1
 
     def __to_json__(self):
@@ -608,7 +871,6 @@ class Deck:
         deck.used = used
         deck.left = left
         deck.hero = hero
+        deck._undrawn = [position for position in range(len(used)) if not used[position]]
         return deck
 
-
-__create_card_table()
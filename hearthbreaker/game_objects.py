@@ -1,15 +1,33 @@
 import abc
 import copy
-from functools import reduce
 import hearthbreaker.constants
+from hearthbreaker.constants import TARGET_KIND, BOARD_DEPENDENCY
 
-from hearthbreaker.tags.base import Aura, AuraUntil, Effect, Buff, BuffUntil, Deathrattle
+from hearthbreaker.tags.base import Aura, AuraUntil, Effect, Buff, BuffUntil, Deathrattle, Status
 from hearthbreaker.tags.event import TurnEnded
 from hearthbreaker.tags.selector import CurrentPlayer
 from hearthbreaker.tags.status import Stealth, ChangeAttack, ChangeHealth, SetAttack, Charge, Taunt, DivineShield, \
     Windfury, NoSpellTarget, SpellDamage, MinimumHealth, CanAttack
 import hearthbreaker.targeting
 
+# Incremented whenever something happens which could change the result of :meth:`Character.calculate_stat`.  A cached
+# stat is only used while the version it was calculated at is still the current one.
+_stat_version = 0
+
+#: If True, each stat read from the cache is checked against a full calculation, and a :class:`GameException` raised if
+#: they differ.  For finding places where the cache should be invalidated but isn't.
+check_stat_cache = False
+
+
+def invalidate_stats():
+    """
+    Marks every stat cached by :meth:`Character.calculate_stat` as out of date.  This is done automatically when an
+    event is triggered, when buffs and auras are added or removed, when minions join or leave the board and when the
+    turn changes.  Anything else which changes what a stat depends upon must call this.
+    """
+    global _stat_version
+    _stat_version += 1
+
 
 class GameException(Exception):
     """
@@ -89,10 +107,7 @@ class Bindable:
         :see: :class:`Bindable`
         """
 
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append((function, False))
+        self._add_handler(event, (function, False))
 
     def bind_once(self, event, function):
         """
@@ -105,10 +120,7 @@ class Bindable:
         :see: :class:`Bindable`
         """
 
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append((function, True))
+        self._add_handler(event, (function, True))
 
     def trigger(self, event, *args):
         """
@@ -120,13 +132,15 @@ class Bindable:
         :param list args: The arguments to pass to the bound function
         :see: :class:`Bindable`
         """
-        if event in self.events:
-            for handler in copy.copy(self.events[event]):
+        global _stat_version
+        _stat_version += 1
+        handlers = self.events.get(event)
+        if handlers:
+            # The list is never changed, only replaced, so handlers bound or unbound by the handlers being called
+            # don't change which are called this time, just as if the list had been copied
+            for handler in handlers:
                 if handler[1]:
-                    self.events[event].remove(handler)
-                    # tidy up the events dict so we don't have entries for events with no handlers
-                    if len(self.events[event]) is 0:
-                        del(self.events[event])
+                    self._remove_handler(event, handler)
                 handler[0](*args)
 
     def unbind(self, event, function):
@@ -143,6 +157,26 @@ class Bindable:
             if len(self.events[event]) is 0:
                 del (self.events[event])
 
+    # The lists of handlers are replaced rather than changed in place whenever a handler is added or removed, so that
+    # trigger can run through a list without copying it first.  Events are triggered far more often than handlers
+    # are bound to them, and most have no more than a handful of handlers.
+    def _add_handler(self, event, handler):
+        handlers = self.events.get(event)
+        if handlers:
+            self.events[event] = handlers + [handler]
+        else:
+            self.events[event] = [handler]
+
+    def _remove_handler(self, event, handler):
+        handlers = self.events.get(event)
+        if handlers and handler in handlers:
+            index = handlers.index(handler)
+            if len(handlers) == 1:
+                # tidy up the events dict so we don't have entries for events with no handlers
+                del self.events[event]
+            else:
+                self.events[event] = handlers[:index] + handlers[index + 1:]
+
 
 class GameObject:
     """
@@ -182,22 +216,23 @@ class GameObject:
                 aura.set_owner(obj)
                 player.add_aura(aura)
             self._attached = True
+            invalidate_stats()
 
     def calculate_stat(self, stat_class, starting_value=0):
         """
         Calculates the amount of a particular stat this :class:`GameObject` has at current time.
         """
 
-        # Add together all the attack amounts from buffs
-        stat = reduce(lambda a, b: b.update(self, a), [buff.status for buff in self.buffs
-                                                       if isinstance(buff.status, stat_class) and
-                                                       (not buff.condition or buff.condition.evaluate(self, self))],
-                      starting_value)
-        stat = reduce(lambda a, b: b.update(self, a), [aura.status
-                                                       for player in self.player.game.players
-                                                       for aura in player.object_auras
-                                                       if aura.match(self) and isinstance(aura.status, stat_class)],
-                      stat)
+        stat = starting_value
+        # Apply the buffs on this object, and then the auras which affect it
+        for buff in self.buffs:
+            if isinstance(buff.status, stat_class) and (not buff.condition or buff.condition.evaluate(self, self)):
+                stat = buff.status.update(self, stat)
+        for player in self.player.game.players:
+            if player.object_auras:
+                for aura in player.auras_for(stat_class, self.target_kind):
+                    if aura.match(self):
+                        stat = aura.status.update(self, stat)
 
         return max(0, stat)
 
@@ -309,6 +344,7 @@ class GameObject:
         effect.set_owner(self)
         effect.apply()
         self.effects.append(effect)
+        invalidate_stats()
 
     def add_aura(self, aura):
         if not isinstance(aura, Aura):
@@ -316,6 +352,7 @@ class GameObject:
         self.auras.append(aura)
         aura.set_owner(self)
         self.player.add_aura(aura)
+        invalidate_stats()
 
     def remove_aura(self, aura):
         for an_aura in self.auras:
@@ -323,6 +360,7 @@ class GameObject:
                 self.auras.remove(an_aura)
                 break
         self.player.remove_aura(aura)
+        invalidate_stats()
 
     def add_buff(self, buff):
         if not isinstance(buff, Buff):
@@ -330,6 +368,7 @@ class GameObject:
         self.buffs.append(buff)
         buff.set_owner(self)
         buff.apply()
+        invalidate_stats()
 
     def remove_buff(self, buff):
         for a_buff in self.buffs:
@@ -337,6 +376,7 @@ class GameObject:
                 self.buffs.remove(a_buff)
                 break
         buff.unapply()
+        invalidate_stats()
 
     def unattach(self):
         if self._attached:
@@ -350,6 +390,7 @@ class GameObject:
                 buff.unapply()
             self.buffs = []
             self._attached = False
+            invalidate_stats()
 
 
 class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
@@ -406,6 +447,8 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         self.enrage = enrage if enrage else []
         #: The character that this minion is attacking, while it is carrying out its attack
         self.current_target = None
+        # The stats calculated for this character, keyed by stat class and starting value
+        self._stat_cache = {}
 
     def _remove_stealth(self):
         if self.stealth:
@@ -413,6 +456,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
                 if isinstance(buff.status, Stealth):
                     buff.unapply()
             self.buffs = [buff for buff in self.buffs if not isinstance(buff.status, Stealth)]
+            invalidate_stats()
 
     def attack(self):
         """
@@ -474,12 +518,21 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
 
     def calculate_stat(self, stat_class, starting_value=0):
         """
-        Calculates the amount of attack this :class:`Character` has, including the base attack, any temporary attack
-        bonuses for this turn
-        """
-        stat = starting_value
-
-        return super().calculate_stat(stat_class, stat)
+        Calculates the amount of a particular stat this :class:`Character` has at current time.  The result is cached
+        until the next call to :func:`invalidate_stats`, so asking for the same stat again is cheap.
+        """
+        key = (stat_class, starting_value)
+        cached = self._stat_cache.get(key)
+        if cached is not None and cached[0] == _stat_version:
+            if check_stat_cache:
+                stat = GameObject.calculate_stat(self, stat_class, starting_value)
+                if stat != cached[1]:
+                    raise GameException("Cached {0} was {1}, but should be {2}"
+                                        .format(stat_class.__name__, cached[1], stat))
+            return cached[1]
+        stat = GameObject.calculate_stat(self, stat_class, starting_value)
+        self._stat_cache[key] = (_stat_version, stat)
+        return stat
 
     def calculate_attack(self):
         """
@@ -562,6 +615,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
                 attacker._remove_stealth()
             else:
                 self.health -= amount
+            invalidate_stats()
             min_health = self.calculate_stat(MinimumHealth, 0)
             if self.health < min_health:
                 self.health = min_health
@@ -628,6 +682,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         :param new_attack: An integer specifying what this character's new attack should be
         """
         self.buffs.append(Buff(SetAttack(new_attack)))
+        invalidate_stats()
 
     def set_health_to(self, new_health):
         """
@@ -638,8 +693,8 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         diff = new_health - (self.base_health + self.health_delta)
 
         for player in self.game.players:
-            for aura in player.object_auras:
-                if aura.match(self) and isinstance(aura.status, ChangeHealth):
+            for aura in player.auras_for(ChangeHealth, self.target_kind):
+                if aura.match(self):
                     diff += aura.status.amount
         if diff > 0:
             self.increase_health(diff)
@@ -693,6 +748,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         self.auras = []
         self.buffs = []
         self.enrage = []
+        invalidate_stats()
         if self.calculate_max_health() < self.health or health_full:
             self.health = self.calculate_max_health()
         self.trigger("silenced")
@@ -745,6 +801,8 @@ class Weapon(Bindable, GameObject):
     Represents a Hearthstone weapon.  All weapons have attack power and durability.  The logic for handling the
     attacks is handled by :class:`Hero`, but it can be modified through the use of events.
     """
+    #: The kind of object this is, for working out which auras can affect it
+    target_kind = TARGET_KIND.WEAPON
 
     def __init__(self, attack_power, durability, deathrattle=None,
                  effects=None, auras=None, buffs=None):
@@ -770,8 +828,9 @@ class Weapon(Bindable, GameObject):
         self.card = None
 
     def copy(self, new_owner):
-        new_weapon = Weapon(self.base_attack, self.durability, copy.deepcopy(self.deathrattle),
-                            copy.deepcopy(self.effects), copy.deepcopy(self.auras), copy.deepcopy(self.buffs))
+        new_weapon = Weapon(self.base_attack, self.durability, self.deathrattle,
+                            [effect.clone() for effect in self.effects], [aura.clone() for aura in self.auras],
+                            [buff.clone() for buff in self.buffs])
         new_weapon.player = new_owner
         return new_weapon
 
@@ -826,6 +885,9 @@ class Weapon(Bindable, GameObject):
 
 
 class Minion(Character):
+    #: The kind of object this is, for working out which auras can affect it
+    target_kind = TARGET_KIND.MINION
+
     def __init__(self, attack, health,
                  deathrattle=None, taunt=False, charge=False, spell_damage=0, divine_shield=False, stealth=False,
                  windfury=False, spell_targetable=True, effects=None, auras=None, buffs=None,
@@ -861,27 +923,63 @@ class Minion(Character):
         if spell_damage:
             self.buffs.append(Buff(SpellDamage(spell_damage)))
 
+    def _board_dependency(self, aura, index):
+        """
+        Works out which of this minion's friends an aura might start or stop affecting when this minion joins or leaves
+        the board at the given index.
+
+        :rtype: int
+        :see: :class:`hearthbreaker.constants.BOARD_DEPENDENCY`
+        """
+        dependency = aura.board_dependency()
+        if dependency == BOARD_DEPENDENCY.ADJACENT:
+            # Only the neighbours of index change for an aura belonging to another minion on the same side of the
+            # board.  Otherwise, the owner's own position might be changing, so every minion is checked.
+            owner = aura.owner
+            minions = self.player.minions
+            if owner is self or owner.is_card() or not owner.is_minion() or owner.player is not self.player or \
+                    not 0 <= index <= len(minions) or not 0 <= owner.index < len(minions) or \
+                    minions[owner.index] is not owner:
+                return BOARD_DEPENDENCY.ALL
+        return dependency
+
     def add_to_board(self, index):
+        minions = self.player.minions
+        # Each aura is only checked against the minions whose match could be changed by this minion joining the board
         aura_affects = {}
         for player in self.game.players:
-            for aura in player.object_auras:
-                aura_affects[aura] = set()
-                for minion in self.player.minions:
-                    if aura.match(minion):
-                        aura_affects[aura].add(minion)
+            for aura in player.auras_for(Status, TARGET_KIND.MINION):
+                dependency = self._board_dependency(aura, index)
+                if dependency == BOARD_DEPENDENCY.NONE:
+                    checked = []
+                elif dependency == BOARD_DEPENDENCY.ADJACENT:
+                    checked = minions[max(index - 1, 0):index + 1]
+                else:
+                    checked = minions
+                # Keyed by id, since auras which compare equal can both be in effect.  The aura is kept alongside, so
+                # that its id can't be reused by an aura created in the meantime.
+                aura_affects[id(aura)] = (aura, dependency, {minion for minion in checked if aura.match(minion)})
         self.game.minion_counter += 1
-        self.player.minions.insert(index, self)
+        minions.insert(index, self)
         self.born = self.game.minion_counter
-        for minion in self.player.minions[index + 1:]:
+        for minion in minions[index + 1:]:
             minion.index += 1
         self.index = index
+        invalidate_stats()
         self.health += self.calculate_max_health() - self.base_health - self.health_delta
         self.attach(self, self.player)
         for player in self.game.players:
-            for aura in player.object_auras:
-                for minion in self.player.minions:
-                    if aura in aura_affects:
-                        is_in = minion in aura_affects[aura]
+            for aura in player.auras_for(Status, TARGET_KIND.MINION):
+                if id(aura) in aura_affects:
+                    aura, dependency, affected = aura_affects[id(aura)]
+                    if dependency == BOARD_DEPENDENCY.NONE:
+                        checked = [self]
+                    elif dependency == BOARD_DEPENDENCY.ADJACENT:
+                        checked = minions[max(index - 1, 0):index + 2]
+                    else:
+                        checked = minions
+                    for minion in checked:
+                        is_in = minion in affected
                         if not is_in and aura.match(minion):
                             aura.status.act(aura.owner, minion)
                         elif is_in and not aura.match(minion):
@@ -908,25 +1006,40 @@ class Minion(Character):
 
     def remove_from_board(self):
         if not self.removed:
+            minions = self.player.minions
+            index = self.index
             aura_affects = {}
-            for aura in self.player.object_auras:
-                aura_affects[aura] = set()
-                for minion in self.player.minions:
-                    if aura.match(minion):
-                        aura_affects[aura].add(minion)
-            for minion in self.player.minions:
-                if minion.index > self.index:
+            for aura in self.player.auras_for(Status, TARGET_KIND.MINION):
+                dependency = self._board_dependency(aura, index)
+                if dependency == BOARD_DEPENDENCY.NONE:
+                    checked = []
+                elif dependency == BOARD_DEPENDENCY.ADJACENT:
+                    checked = minions[max(index - 1, 0):index + 2]
+                else:
+                    checked = minions
+                aura_affects[id(aura)] = (aura, dependency, {minion for minion in checked if aura.match(minion)})
+            for minion in minions:
+                if minion.index > index:
                     minion.index -= 1
-            self.player.minions.remove(self)
+            minions.remove(self)
             self.player.trigger("minion_removed", self)
             self.removed = True
-            for aura in self.player.object_auras:
-                for minion in self.player.minions:
-                    is_in = minion in aura_affects[aura]
-                    if not is_in and aura.match(minion):
-                        aura.status.act(aura.owner, minion)
-                    elif is_in and not aura.match(minion):
-                        aura.status.unact(aura.owner, minion)
+            for aura in self.player.auras_for(Status, TARGET_KIND.MINION):
+                if id(aura) in aura_affects:
+                    aura, dependency, affected = aura_affects[id(aura)]
+                    if dependency == BOARD_DEPENDENCY.NONE:
+                        checked = []
+                    elif dependency == BOARD_DEPENDENCY.ADJACENT:
+                        checked = minions[max(index - 1, 0):index + 1]
+                    else:
+                        checked = minions
+                    for minion in checked:
+                        is_in = minion in affected
+                        if not is_in and aura.match(minion):
+                            aura.status.act(aura.owner, minion)
+                        elif is_in and not aura.match(minion):
+                            aura.status.unact(aura.owner, minion)
+            invalidate_stats()
 
     def replace(self, new_minion):
         """
@@ -945,7 +1058,7 @@ class Minion(Character):
             raise ValueError("Attempting to replace minion with invalid index")
         self.player.minions[self.index] = new_minion
         new_minion.attach(new_minion, self.player)
-        for aura in self.player.object_auras:
+        for aura in self.player.auras_for(Status, TARGET_KIND.MINION):
             if aura.match(new_minion):
                 aura.status.act(self, new_minion)
         new_minion.health += new_minion.calculate_max_health() - new_minion.base_health
@@ -1011,11 +1124,11 @@ class Minion(Character):
 
     def copy(self, new_owner, new_game=None):
         new_minion = Minion(self.base_attack, self.base_health,
-                            effects=copy.deepcopy(self.effects),
-                            auras=copy.deepcopy(self.auras),
-                            buffs=copy.deepcopy(self.buffs),
-                            deathrattle=copy.deepcopy(self.deathrattle),
-                            enrage=copy.deepcopy(self.enrage))
+                            effects=[effect.clone() for effect in self.effects],
+                            auras=[aura.clone() for aura in self.auras],
+                            buffs=[buff.clone() for buff in self.buffs],
+                            deathrattle=list(self.deathrattle),
+                            enrage=[aura.clone() for aura in self.enrage])
         new_minion.health = self.base_health - (self.calculate_max_health() - self.health)
         new_minion.enraged = self.enraged
         new_minion.immune = self.immune
@@ -1023,8 +1136,7 @@ class Minion(Character):
         new_minion.attacks_performed = self.attacks_performed
         new_minion.exhausted = self.exhausted
         new_minion.born = self.born
-        card_type = type(self.card)
-        new_minion.card = card_type()
+        new_minion.card = self.card.copy()
         new_minion.player = new_owner
         if new_game:
             new_minion.game = new_game
@@ -1082,6 +1194,9 @@ class Minion(Character):
 
 
 class Hero(Character):
+    #: The kind of object this is, for working out which auras can affect it
+    target_kind = TARGET_KIND.HERO
+
     def __init__(self, health, character_class, power, player):
         super().__init__(0, health)
         self.armor = 0
@@ -1107,16 +1222,16 @@ class Hero(Character):
         return super().calculate_stat(stat_class, starting_value)
 
     def copy(self, new_owner):
-        new_hero = Hero(self.base_health, self.character_class, self.power, new_owner)
+        new_hero = Hero(self.base_health, self.character_class, copy.copy(self.power), new_owner)
         new_hero.health = self.health
         new_hero.armor = self.armor
         new_hero.used_windfury = False
         new_hero.attacks_performed = self.attacks_performed
 
-        new_hero.effects = copy.deepcopy(self.effects)
-        new_hero.auras = copy.deepcopy(self.auras)
-        new_hero.buffs = copy.deepcopy(self.buffs)
-        new_hero.card = type(self.card)()
+        new_hero.effects = [effect.clone() for effect in self.effects]
+        new_hero.auras = [aura.clone() for aura in self.auras]
+        new_hero.buffs = [buff.clone() for buff in self.buffs]
+        new_hero.card = self.card
 
         return new_hero
 
@@ -1166,7 +1281,7 @@ class Hero(Character):
         self.player.hero = new_hero
         new_hero.power.hero = new_hero
         new_hero.attach(new_hero, self.player)
-        for aura in self.player.object_auras:
+        for aura in self.player.auras_for(Status, TARGET_KIND.HERO):
             if aura.match(new_hero):
                 aura.status.act(self, new_hero)
 
@@ -0,0 +1,251 @@
+"""
+Counts and times the calls the engine spends most of its time in, to find out where the time in a slow batch of games
+goes::
+
+    with instrumentation.enabled():
+        game.start()
+    print(instrumentation.counters().table())
+
+The calls counted are :meth:`Bindable.trigger <hearthbreaker.game_objects.Bindable.trigger>` by event name,
+:meth:`Action.act <hearthbreaker.tags.base.Action.act>`, :meth:`Condition.evaluate
+<hearthbreaker.tags.base.Condition.evaluate>` and :meth:`Selector.get_targets
+<hearthbreaker.tags.base.Selector.get_targets>` by class, and :meth:`calculate_stat
+<hearthbreaker.game_objects.GameObject.calculate_stat>` by the class of the stat.  Times include the time spent in any
+calls made from the one timed.  A method which calls the method it overrides on the same object is only counted
+once, but a method which calls itself again, such as an event triggered by a handler of the same event, is counted
+each time.
+
+The methods are replaced with timed versions while instrumentation is enabled, and put back when it is disabled, so
+that nothing is paid for it otherwise.  Only the classes which have been imported when it is enabled are timed, and
+tags which have been compiled by :mod:`hearthbreaker.tags.compiler` don't call the methods at all.
+"""
+import contextlib
+import json
+import time
+
+from hearthbreaker.game_objects import Bindable, GameObject, GameException
+
+# The counters being added to, if instrumentation is enabled
+_counters = None
+
+# The class, method name and original function of each method which has been replaced
+_replaced = []
+
+
+class Counters:
+    """
+    The number of calls made and the time spent in them, for each kind of call.  Calls are identified by a category,
+    such as ``"trigger"`` or ``"act"``, and a name within that category, such as an event name or a class name.
+    """
+
+    def __init__(self):
+        #: The number of calls and the total time in seconds of each kind of call, keyed by (category, name)
+        self.calls = {}
+
+    def add(self, category, name, seconds):
+        """
+        Counts a call
+
+        :param str category: The category of the call
+        :param str name: The name of the call within its category
+        :param float seconds: How long the call took
+        """
+        entry = self.calls.get((category, name))
+        if entry is None:
+            self.calls[(category, name)] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def merge(self, other):
+        """
+        Adds the calls counted by another set of counters to these
+
+        :param Counters other: The counters to add
+        """
+        for key, (count, seconds) in other.calls.items():
+            entry = self.calls.get(key)
+            if entry is None:
+                self.calls[key] = [count, seconds]
+            else:
+                entry[0] += count
+                entry[1] += seconds
+
+    def rows(self):
+        """
+        :return: The category, name, number of calls and total seconds of each kind of call, slowest first
+        :rtype: [(str, str, int, float)]
+        """
+        return sorted(((category, name, count, seconds) for (category, name), (count, seconds) in self.calls.items()),
+                      key=lambda row: (-row[3], row[0], row[1]))
+
+    def table(self, limit=None):
+        """
+        Lays the counters out as a table, slowest first
+
+        :param int limit: How many rows to include, or None for all of them
+        :rtype: str
+        """
+        lines = ["{:<16} {:<40} {:>10} {:>12} {:>12}".format("category", "name", "calls", "total (ms)", "mean (us)")]
+        for category, name, count, seconds in self.rows()[:limit]:
+            lines.append("{:<16} {:<40} {:>10} {:>12.2f} {:>12.2f}".format(category, name, count, seconds * 1e3,
+                                                                          seconds / count * 1e6))
+        return "\n".join(lines)
+
+    def __to_json__(self):
+        return [{'category': category, 'name': name, 'calls': count, 'seconds': seconds}
+                for category, name, count, seconds in self.rows()]
+
+    @staticmethod
+    def from_json(rows):
+        counters = Counters()
+        for row in rows:
+            counters.calls[(row['category'], row['name'])] = [row['calls'], row['seconds']]
+        return counters
+
+    def dump(self, path):
+        """
+        Saves the counters as JSON
+
+        :param str path: The file to save to
+        """
+        with open(path, "w") as file:
+            json.dump(self.__to_json__(), file, indent=1)
+
+
+def _timed(function, klass, category, name_of, current):
+    # current is the stack of the object and class of each implementation of the method being run, shared by every
+    # implementation of it
+    perf_counter = time.perf_counter
+
+    def timed(self, *args, **kwargs):
+        current.append((self, klass))
+        if len(current) > 1:
+            outer, outer_class = current[-2]
+            if outer is self and outer_class is not klass and issubclass(outer_class, klass):
+                # An overriding method has called this one, and is already being timed
+                try:
+                    return function(self, *args, **kwargs)
+                finally:
+                    current.pop()
+        start = perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            current.pop()
+            _counters.add(category, name_of(self, args), seconds)
+    timed.__wrapped__ = function
+    return timed
+
+
+def _event_name(obj, args):
+    event = args[0]
+    # The events of players are bound on the game's router, keyed by event name and player
+    return event[0] if isinstance(event, tuple) else event
+
+
+def _class_name(obj, args):
+    return type(obj).__name__
+
+
+def _stat_name(obj, args):
+    return args[0].__name__
+
+
+def _subclasses(cls):
+    # A class with more than one base is found once through each of them
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        classes.extend(subclass for subclass in _subclasses(subclass) if subclass not in classes)
+    return classes
+
+
+def _replace(classes, method, category, name_of):
+    current = []
+    for klass in [klass for klass in classes if method in klass.__dict__]:
+        function = klass.__dict__[method]
+        _replaced.append((klass, method, function))
+        setattr(klass, method, _timed(function, klass, category, name_of, current))
+
+
+def enable():
+    """
+    Starts counting calls, adding to any counted since instrumentation was last reset.  This can't be done while a
+    game has a checkpoint open.
+    """
+    global _counters
+    import hearthbreaker.journal
+    import hearthbreaker.profiler
+    import hearthbreaker.tags.action
+    import hearthbreaker.tags.condition
+    import hearthbreaker.tags.selector
+    from hearthbreaker.tags.base import Action, Condition, Selector
+    if _replaced:
+        return
+    if hearthbreaker.journal._active is not None:
+        raise GameException("Instrumentation can't be enabled while a game has a checkpoint open")
+    if hearthbreaker.profiler.is_enabled():
+        raise GameException("Instrumentation can't be enabled while the profiler is enabled")
+    if _counters is None:
+        _counters = Counters()
+    # Players pass their events on to the game's router, which is where they are counted
+    _replace([Bindable], "trigger", "trigger", _event_name)
+    _replace(_subclasses(Action), "act", "act", _class_name)
+    _replace(_subclasses(Condition), "evaluate", "evaluate", _class_name)
+    _replace(_subclasses(Selector), "get_targets", "get_targets", _class_name)
+    _replace(_subclasses(GameObject), "calculate_stat", "calculate_stat", _stat_name)
+
+
+def disable():
+    """
+    Stops counting calls.  The calls counted so far are kept until :func:`reset` is called.
+    """
+    import hearthbreaker.journal
+    if hearthbreaker.journal._active is not None:
+        raise GameException("Instrumentation can't be disabled while a game has a checkpoint open")
+    while _replaced:
+        cls, method, function = _replaced.pop()
+        setattr(cls, method, function)
+
+
+def is_enabled():
+    """
+    :return: Whether calls are being counted
+    :rtype: bool
+    """
+    return bool(_replaced)
+
+
+@contextlib.contextmanager
+def enabled():
+    """
+    Counts calls for the duration of a ``with`` block
+    """
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def counters():
+    """
+    :return: The calls counted since instrumentation was last reset
+    :rtype: Counters
+    """
+    return _counters or Counters()
+
+
+def reset():
+    """
+    Forgets the calls counted so far, and returns them
+
+    :rtype: Counters
+    """
+    global _counters
+    counted = counters()
+    _counters = Counters() if is_enabled() else None
+    return counted
@@ -0,0 +1,260 @@
+import contextlib
+from itertools import chain
+
+from hearthbreaker.game_objects import Bindable, Character, Weapon, GameException, invalidate_stats
+from hearthbreaker.powers import Power
+
+# The journal which is currently recording changes, if any.  Only one game can have checkpoints open at a time,
+# since the recording is done by hooks installed on the game object classes themselves.
+_active = None
+
+_bind = Bindable.bind
+_bind_once = Bindable.bind_once
+_unbind = Bindable.unbind
+_trigger = Bindable.trigger
+
+# The kinds of entry in the undo log.  Each entry is a tuple of (kind, target, key, value)
+_ATTRIBUTE = 0  # target is an object's __dict__, value is what target[key] held before it was written
+_LISTS = 1  # target is a list of lists, value is a list of copies of their items
+_CONTENTS = 2  # target is a set or dict, value is a copy of its contents
+_CARDS = 3  # target is a list of cards' __dict__s, value is a list of copies of them
+
+
+def _journaled_setattr(obj, name, value):
+    attributes = obj.__dict__
+    # An attribute which didn't exist before the checkpoint is left in place by a rollback.  Nothing reads such an
+    # attribute before setting it, and skipping them keeps newly created objects out of the log entirely.
+    if name in attributes:
+        _active.log.append((_ATTRIBUTE, attributes, name, attributes[name]))
+    object.__setattr__(obj, name, value)
+
+
+def _journaled_bind(obj, event, function):
+    _active.save_events(obj)
+    _bind(obj, event, function)
+
+
+def _journaled_bind_once(obj, event, function):
+    _active.save_events(obj)
+    _bind_once(obj, event, function)
+
+
+def _journaled_unbind(obj, event, function):
+    _active.save_events(obj)
+    _unbind(obj, event, function)
+
+
+def _journaled_trigger(obj, event, *args):
+    invalidate_stats()
+    handlers = obj.events.get(event)
+    if handlers:
+        # Triggering only changes the events when there are handlers bound with bind_once
+        for handler in handlers:
+            if handler[1]:
+                _active.save_events(obj)
+                break
+        _trigger(obj, event, *args)
+
+
+def _get_drawn(card):
+    return card.__dict__['drawn']
+
+
+def _set_drawn(card, drawn):
+    attributes = card.__dict__
+    if drawn and not attributes.get('drawn', True):
+        _active.save_cards([card])
+    attributes['drawn'] = drawn
+
+
+# Installed on Card while a checkpoint is open, so that a card is recorded as it leaves the deck
+_journaled_drawn = property(_get_drawn, _set_drawn)
+
+
+def _copy_card(attributes):
+    saved = attributes.copy()
+    # Cards aren't journaled attribute by attribute, so their lists are saved as copies in place of the originals
+    saved['effects'] = attributes['effects'][:]
+    saved['auras'] = attributes['auras'][:]
+    saved['buffs'] = attributes['buffs'][:]
+    return saved
+
+
+class Journal:
+    """
+    Records the changes made to a :class:`hearthbreaker.engine.Game` so that they can be undone.  This allows an
+    agent to try out an action on a game and then revert it, rather than trying it out on a copy of the game.
+
+    A journal is used through :meth:`hearthbreaker.engine.Game.checkpoint`,
+    :meth:`hearthbreaker.engine.Game.rollback` and :meth:`hearthbreaker.engine.Game.commit`, rather than directly.
+
+    While a checkpoint is open, the following are recorded:
+
+    * Writes to attributes of characters, weapons, hero powers, players, decks and the game itself.  These are
+      recorded by a hook on ``__setattr__``, which is only installed while a checkpoint is open, so that nothing is
+      paid for the journal otherwise.
+    * Handlers being bound and unbound, recorded the first time after each checkpoint that an object's events change.
+    * The contents of the lists belonging to the game, the players and the characters, and the cards in the players'
+      hands, secrets and on the board.  These are copied when the checkpoint is opened, as card code changes them in
+      place all over.
+    * Cards leaving a deck, which are copied as they are drawn.  Cards still in a deck are otherwise not recorded.
+
+    The state of the random number generator and of the agents is not recorded, nor is any state held by the tags.
+    While a checkpoint is open, no other game should be played, as its changes would be recorded too.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        #: The undo log.  Each entry records the state of part of the game before it was changed
+        self.log = []
+        self._checkpoints = []
+        self._saved_events = set()
+
+    def checkpoint(self):
+        """
+        Opens a new checkpoint.
+
+        :return: A token identifying the checkpoint, to pass to :meth:`rollback` or :meth:`commit`
+        :rtype: int
+        """
+        if not self._checkpoints:
+            self._start()
+        self._checkpoints.append(len(self.log))
+        self._saved_events = set()
+        self._save_containers()
+        return len(self._checkpoints) - 1
+
+    def rollback(self, token):
+        """
+        Undoes every change made since the checkpoint was opened, and closes it along with any checkpoints opened
+        after it.
+
+        :param int token: The token returned by :meth:`checkpoint`
+        """
+        position = self._close(token)
+        log = self.log
+        while len(log) > position:
+            kind, target, key, value = log.pop()
+            if kind is _ATTRIBUTE:
+                target[key] = value
+            elif kind is _LISTS:
+                for items, saved in zip(target, value):
+                    items[:] = saved
+            elif kind is _CARDS:
+                for attributes, saved in zip(target, value):
+                    attributes.clear()
+                    attributes.update(saved)
+            else:
+                target.clear()
+                target.update(value)
+        self._saved_events = set()
+        invalidate_stats()
+        if not self._checkpoints:
+            self._stop()
+
+    def commit(self, token):
+        """
+        Keeps the changes made since the checkpoint was opened, and closes it along with any checkpoints opened after
+        it.  The changes can still be undone by rolling back a checkpoint opened before this one.
+
+        :param int token: The token returned by :meth:`checkpoint`
+        """
+        self._close(token)
+        if not self._checkpoints:
+            self.log = []
+            self._stop()
+
+    def save_events(self, obj):
+        """
+        Records the events of a :class:`hearthbreaker.game_objects.Bindable`, if they haven't been recorded since the
+        last checkpoint was opened.
+        """
+        if id(obj) not in self._saved_events:
+            self._saved_events.add(id(obj))
+            # The lists of handlers are replaced rather than changed, so they don't need copying
+            self.log.append((_CONTENTS, obj.events, None, dict(obj.events)))
+
+    def _close(self, token):
+        if not isinstance(token, int) or not 0 <= token < len(self._checkpoints):
+            raise GameException("There is no open checkpoint {0}".format(token))
+        position = self._checkpoints[token]
+        del self._checkpoints[token:]
+        return position
+
+    def save_cards(self, cards):
+        """
+        Records the state of the given cards
+        """
+        attributes = [card.__dict__ for card in cards]
+        self.log.append((_CARDS, attributes, None, [_copy_card(card) for card in attributes]))
+
+    def _save_containers(self):
+        game = self.game
+        lists = [game._all_cards_played]
+        cards = []
+        for player in game.players:
+            lists.extend([player.minions, player.hand, player.secrets, player.object_auras, player.player_auras,
+                          player.effects, player.graveyard, player.dead_this_turn, player.deck.cards,
+                          player.deck._undrawn])
+            for character in chain([player.hero], player.minions):
+                lists.extend([character.effects, character.auras, character.buffs, character.enrage,
+                              character.delayed])
+            for minion in player.minions:
+                lists.append(minion.deathrattle)
+                if minion.card:
+                    cards.append(minion.card)
+            if player.weapon:
+                lists.extend([player.weapon.effects, player.weapon.auras, player.weapon.buffs])
+            cards.extend(player.hand)
+            cards.extend(player.secrets)
+        self.log.append((_CONTENTS, game.delayed_minions, None, set(game.delayed_minions)))
+        self.log.append((_LISTS, lists, None, [items[:] for items in lists]))
+        self.save_cards(cards)
+
+    def _start(self):
+        from hearthbreaker.cards.base import Card
+        from hearthbreaker.engine import Game, Player, Deck
+        global _active, _bind, _bind_once, _unbind, _trigger
+        if _active is not None:
+            raise GameException("Another game already has an open checkpoint")
+        _active = self
+        # Keep whatever methods are in place now, such as those timed by hearthbreaker.instrumentation, to call while
+        # recording and to put back afterwards
+        _bind, _bind_once, _unbind, _trigger = Bindable.bind, Bindable.bind_once, Bindable.unbind, Bindable.trigger
+        for cls in [Character, Weapon, Power, Player, Deck, Game]:
+            cls.__setattr__ = _journaled_setattr
+        Bindable.bind = _journaled_bind
+        Bindable.bind_once = _journaled_bind_once
+        Bindable.unbind = _journaled_unbind
+        Bindable.trigger = _journaled_trigger
+        Card.drawn = _journaled_drawn
+
+    def _stop(self):
+        from hearthbreaker.cards.base import Card
+        from hearthbreaker.engine import Game, Player, Deck
+        global _active
+        for cls in [Character, Weapon, Power, Player, Deck, Game]:
+            del cls.__setattr__
+        Bindable.bind = _bind
+        Bindable.bind_once = _bind_once
+        Bindable.unbind = _unbind
+        Bindable.trigger = _trigger
+        del Card.drawn
+        _active = None
+
+
+@contextlib.contextmanager
+def suspended():
+    """
+    Stops recording changes for the duration of a ``with`` block, for building objects which must not be reverted
+    when a checkpoint is rolled back, such as a copy of the game.
+    """
+    journal = _active
+    if journal is None:
+        yield
+    else:
+        journal._stop()
+        try:
+            yield
+        finally:
+            journal._start()
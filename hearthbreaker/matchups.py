@@ -0,0 +1,435 @@
+"""
+Plays each of a number of decks against each of the others, and reports how often each deck wins each matchup::
+
+    python -m hearthbreaker.matchups zoo.hsdeck patron.hsdeck example.hsdeck --width 0.1 --workers 4
+
+Rather than playing a fixed number of games for each matchup, games are played in batches, and a matchup stops being
+played once the confidence interval of its win rate is narrower than ``--width``, so lopsided matchups are settled
+quickly and close ones are given the games they need.  The next batch always goes to the unsettled matchup which has
+had the fewest games.  A draw counts as half a win for each deck.
+
+The result of each batch is added to a results file as it finishes, and the results already in the file are used when
+the same decks are run again, so an interrupted run carries on where it left off.  The results of a matchup are only
+used again if the cards in both decks, the agents and the seed are the same.
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+from hearthbreaker.agents import registry
+from hearthbreaker.engine import derive_seed
+from hearthbreaker.sim import read_deck, make_deck, play_games, SimulationResult
+
+# The decks and agent of the games played by this worker process, set up when the process starts
+_worker = None
+
+
+def z_score(confidence):
+    """
+    Works out how many standard deviations either side of the mean a normal distribution must be cut off at to cover
+    a given fraction of it
+
+    :param float confidence: The fraction to cover, such as 0.95
+    :rtype: float
+    """
+    low, high = 0.0, 10.0
+    for step in range(60):
+        middle = (low + high) / 2
+        if math.erf(middle / math.sqrt(2)) < confidence:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def wilson_interval(wins, games, z):
+    """
+    Works out the Wilson score interval of a win rate
+
+    :param float wins: How many games were won
+    :param int games: How many games were played
+    :param float z: How many standard deviations either side of the win rate the interval covers
+    :return: The lowest and highest win rate in the interval
+    :rtype: (float, float)
+    """
+    if not games:
+        return 0.0, 1.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    spread = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+class Matchup:
+    """
+    The games played so far between two decks.  Wins are counted from the point of view of the first deck.
+    """
+
+    def __init__(self, first, second, key):
+        """
+        :param int first: The index of the first deck
+        :param int second: The index of the second deck
+        :param str key: Identifies the decks, agents and seed the games were played with, so that results from another
+                        run are only used if they were played the same way
+        """
+        self.decks = (first, second)
+        self.key = key
+        #: How the games played so far went
+        self.result = SimulationResult()
+        #: The number of the next game to play
+        self.next_game = 0
+        #: How many games are being played, but haven't finished yet
+        self.playing = 0
+
+    def add(self, start, count, result):
+        """
+        Adds a finished batch of games
+
+        :param int start: The number of the first game in the batch
+        :param int count: How many games were in the batch
+        :param hearthbreaker.sim.SimulationResult result: How the games went
+        """
+        self.result.merge(result)
+        self.next_game = max(self.next_game, start + count)
+
+    def win_rate(self):
+        """
+        :return: The fraction of the games which the first deck won, counting draws as half a win
+        :rtype: float
+        """
+        if not self.result.games:
+            return 0.5
+        return self.points() / self.result.games
+
+    def points(self):
+        """
+        :return: How many games the first deck won, counting draws as half a win
+        :rtype: float
+        """
+        return self.result.wins[0] + self.result.draws / 2
+
+    def interval(self, z):
+        """
+        :param float z: How many standard deviations either side of the win rate the interval covers
+        :return: The lowest and highest win rate of the first deck within the confidence interval
+        :rtype: (float, float)
+        """
+        return wilson_interval(self.points(), self.result.games, z)
+
+    def settled(self, z, width, min_games, max_games):
+        """
+        :param float z: How many standard deviations either side of the win rate the interval covers
+        :param float width: How narrow the confidence interval must be
+        :param int min_games: The fewest games to play before the interval is checked
+        :param int max_games: The most games to play, whatever the interval
+        :return: Whether no more games need to be played
+        :rtype: bool
+        """
+        if self.result.games + self.result.errors >= max_games:
+            return True
+        if self.result.games < min_games:
+            return False
+        low, high = self.interval(z)
+        return high - low <= width
+
+
+def matchup_key(first_cards, second_cards, agent_names, seed):
+    """
+    Makes the key the results of a matchup are kept under
+
+    :param first_cards: The names of the cards in the first deck
+    :type first_cards: [str]
+    :param second_cards: The names of the cards in the second deck
+    :type second_cards: [str]
+    :param agent_names: The name in :data:`hearthbreaker.agents.registry` of the agent for each deck
+    :type agent_names: [str]
+    :param int seed: The seed of the run
+    :rtype: str
+    """
+    return hashlib.sha1(json.dumps([first_cards, second_cards, agent_names, seed]).encode("utf-8")).hexdigest()
+
+
+def load_results(path):
+    """
+    Reads the batches of games in a results file.  A line which can't be read, such as the last one of a run which
+    was killed while writing it, is skipped.
+
+    :param str path: The results file
+    :return: The key, number of the first game, number of games and result of each batch, or nothing if the file
+             doesn't exist
+    :rtype: [(str, int, int, hearthbreaker.sim.SimulationResult)]
+    """
+    batches = []
+    if not os.path.exists(path):
+        return batches
+    with open(path) as results_file:
+        for line in results_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            result = SimulationResult()
+            result.games = record['games']
+            result.wins = record['wins']
+            result.draws = record['draws']
+            result.errors = record['errors']
+            batches.append((record['key'], record['start'], record['count'], result))
+    return batches
+
+
+def _batch_record(matchup, deck_names, start, count, result):
+    return {
+        'key': matchup.key,
+        'decks': [deck_names[index] for index in matchup.decks],
+        'start': start,
+        'count': count,
+        'games': result.games,
+        'wins': result.wins,
+        'draws': result.draws,
+        'errors': result.errors,
+    }
+
+
+def _start_worker(deck_lists, agent_names):
+    global _worker
+    from hearthbreaker.catalogue import get_catalogue
+    get_catalogue()
+    _worker = ([make_deck(card_names) for card_names in deck_lists], agent_names)
+
+
+def _play_batch(batch):
+    decks, agent_names = _worker
+    first, second, seed, start, count = batch
+    return batch, play_games([decks[first], decks[second]], agent_names, seed, start, count)
+
+
+def run_matchups(deck_names, deck_lists, agent_names, results_path=None, seed=0, width=0.1, confidence=0.95,
+                 min_games=20, max_games=2000, batch_size=10, workers=None, progress=None):
+    """
+    Plays each deck against each of the others, until the win rate of each matchup is known well enough
+
+    :param deck_names: The name of each deck, as written to the results file
+    :type deck_names: [str]
+    :param deck_lists: The names of the cards in each deck
+    :type deck_lists: [[str]]
+    :param agent_names: The name in :data:`hearthbreaker.agents.registry` of the agent to play the first and second
+                        deck of each matchup
+    :type agent_names: [str]
+    :param str results_path: The file to add the result of each batch of games to, and to read the results of an
+                             earlier run from, if any
+    :param int seed: The seed of the run, from which the seed of each game is derived
+    :param float width: How narrow the confidence interval of each matchup's win rate must be before it is settled
+    :param float confidence: How likely the win rate is to be within its confidence interval
+    :param int min_games: The fewest games to play in each matchup
+    :param int max_games: The most games to play in each matchup
+    :param int batch_size: How many games to hand a worker at a time
+    :param int workers: How many processes to play the games in, by default one for each CPU.  With one worker, the
+                        games are played in this process.
+    :param progress: Called with the matchups after each batch of games
+    :type progress: function
+    :return: Each matchup, keyed by the indices of its two decks, with the first lower than the second
+    :rtype: dict
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    z = z_score(confidence)
+    matchups = {}
+    by_key = {}
+    for first in range(len(deck_lists)):
+        for second in range(first + 1, len(deck_lists)):
+            key = matchup_key(deck_lists[first], deck_lists[second], agent_names, seed)
+            matchups[(first, second)] = by_key[key] = Matchup(first, second, key)
+    if results_path:
+        for key, start, count, result in load_results(results_path):
+            if key in by_key:
+                by_key[key].add(start, count, result)
+
+    finished = queue.Queue()
+    if workers == 1:
+        decks = [make_deck(card_names) for card_names in deck_lists]
+
+        def submit(batch):
+            first, second, batch_seed, start, count = batch
+            finished.put((batch, play_games([decks[first], decks[second]], agent_names, batch_seed, start, count)))
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, _start_worker, (deck_lists, agent_names))
+
+        def submit(batch):
+            pool.apply_async(_play_batch, (batch,), callback=finished.put, error_callback=finished.put)
+
+    def next_matchup():
+        unsettled = [matchup for matchup in matchups.values()
+                     if not matchup.settled(z, width, min_games, max_games) and
+                     matchup.result.games + matchup.result.errors + matchup.playing < max_games]
+        if not unsettled:
+            return None
+        return min(unsettled, key=lambda matchup: matchup.result.games + matchup.playing)
+
+    results_file = None
+    if results_path:
+        results_file = open(results_path, "a+")
+        results_file.seek(0, os.SEEK_END)
+        if results_file.tell():
+            results_file.seek(results_file.tell() - 1)
+            if results_file.read(1) != "\n":
+                # The last run was killed while writing a line, so start a new one after it
+                results_file.write("\n")
+    playing = 0
+    try:
+        while True:
+            # Keep every worker busy, with another batch waiting for each
+            while playing < workers * 2:
+                matchup = next_matchup()
+                if matchup is None:
+                    break
+                count = min(batch_size, max_games - matchup.result.games - matchup.result.errors - matchup.playing)
+                first, second = matchup.decks
+                submit((first, second, derive_seed(seed, matchup.key), matchup.next_game, count))
+                matchup.next_game += count
+                matchup.playing += count
+                playing += 1
+            if not playing:
+                break
+            item = finished.get()
+            if isinstance(item, Exception):
+                raise item
+            (first, second, batch_seed, start, count), result = item
+            playing -= 1
+            matchup = matchups[(first, second)]
+            matchup.playing -= count
+            matchup.add(start, count, result)
+            if results_file:
+                results_file.write(json.dumps(_batch_record(matchup, deck_names, start, count, result)) + "\n")
+                results_file.flush()
+            if progress:
+                progress(matchups)
+    finally:
+        if results_file:
+            results_file.close()
+        if pool:
+            pool.terminate()
+            pool.join()
+    return matchups
+
+
+def win_rate_matrix(matchups, decks, z):
+    """
+    Lays the matchups out as a matrix
+
+    :param dict matchups: The matchups, as returned by :func:`run_matchups`
+    :param int decks: How many decks there are
+    :param float z: How many standard deviations either side of the win rate the interval covers
+    :return: The win rate of each deck against each other deck, with the low and high ends of its confidence interval
+             and the number of games played, as a list of rows.  The diagonal is None.
+    :rtype: [[(float, float, float, int)]]
+    """
+    matrix = [[None] * decks for _ in range(decks)]
+    for (first, second), matchup in matchups.items():
+        low, high = matchup.interval(z)
+        rate = matchup.win_rate()
+        matrix[first][second] = (rate, low, high, matchup.result.games)
+        matrix[second][first] = (1 - rate, 1 - high, 1 - low, matchup.result.games)
+    return matrix
+
+
+def format_matrix(matrix, deck_names):
+    """
+    :param matrix: The matrix, as returned by :func:`win_rate_matrix`
+    :param deck_names: The name of each deck
+    :type deck_names: [str]
+    :return: The matrix as a table, with the win rate of the deck on each row against the deck in each column
+    :rtype: str
+    """
+    names = [os.path.splitext(os.path.basename(name))[0] for name in deck_names]
+    name_width = max(len(name) for name in names)
+    cell_width = max(max(len(name) for name in names), 11)
+    lines = [" " * name_width + "".join(" {:>{}}".format(name, cell_width) for name in names)]
+    for name, row in zip(names, matrix):
+        cells = []
+        for cell in row:
+            if cell is None:
+                cells.append("-")
+            else:
+                rate, low, high = cell[:3]
+                cells.append("{:.0%} ±{:.0%}".format(rate, (high - low) / 2))
+        lines.append("{:<{}}".format(name, name_width) + "".join(" {:>{}}".format(cell, cell_width) for cell in cells))
+    return "\n".join(lines)
+
+
+def write_csv(path, matrix, deck_names):
+    """
+    Writes the matrix as CSV, with a row for each deck against each other deck
+
+    :param str path: The file to write
+    :param matrix: The matrix, as returned by :func:`win_rate_matrix`
+    :param deck_names: The name of each deck
+    :type deck_names: [str]
+    """
+    import csv
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerow(["deck", "opponent", "win_rate", "low", "high", "games"])
+        for deck, row in zip(deck_names, matrix):
+            for opponent, cell in zip(deck_names, row):
+                if cell is not None:
+                    writer.writerow([deck, opponent] + ["{:.4f}".format(value) for value in cell[:3]] + [cell[3]])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hearthbreaker.matchups",
+                                     description="Plays each deck against each of the others, and reports the win "
+                                                 "rate of each matchup")
+    parser.add_argument("decks", nargs="+", metavar="deck", help="a deck file")
+    parser.add_argument("--agent", default="Random", choices=registry.get_names(),
+                        help="the agent to play every deck (default: Random)")
+    parser.add_argument("--results", default="matchups.jsonl",
+                        help="the file to keep the results in, and to carry on from (default: matchups.jsonl)")
+    parser.add_argument("--width", type=float, default=0.1,
+                        help="how narrow each win rate's confidence interval must be (default: 0.1)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="how likely each win rate is to be within its interval (default: 0.95)")
+    parser.add_argument("--min-games", type=int, default=20, help="the fewest games per matchup (default: 20)")
+    parser.add_argument("--max-games", type=int, default=2000, help="the most games per matchup (default: 2000)")
+    parser.add_argument("--batch-size", type=int, default=10,
+                        help="how many games to hand a worker at a time (default: 10)")
+    parser.add_argument("--workers", type=int, help="how many processes to play in (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the run (default: 0)")
+    parser.add_argument("--csv", metavar="FILE", help="write the matrix to this file as CSV")
+    args = parser.parse_args(argv)
+    if len(args.decks) < 2:
+        parser.error("at least two decks are needed")
+
+    def report(matchups):
+        settled = sum(matchup.settled(z, args.width, args.min_games, args.max_games) for matchup in matchups.values())
+        games = sum(matchup.result.games + matchup.result.errors for matchup in matchups.values())
+        sys.stderr.write("\r{} games, {} of {} matchups settled".format(games, settled, len(matchups)))
+        sys.stderr.flush()
+
+    z = z_score(args.confidence)
+    start_time = time.perf_counter()
+    matchups = run_matchups(args.decks, [read_deck(deck) for deck in args.decks], [args.agent, args.agent],
+                            args.results, args.seed, args.width, args.confidence, args.min_games, args.max_games,
+                            args.batch_size, args.workers, report)
+    sys.stderr.write("\n")
+
+    matrix = win_rate_matrix(matchups, len(args.decks), z)
+    games = sum(matchup.result.games + matchup.result.errors for matchup in matchups.values())
+    errors = sum(matchup.result.errors for matchup in matchups.values())
+    print("{} games, {} of which raised an error, in {:.1f}s".format(games, errors, time.perf_counter() - start_time))
+    print("Win rate of each row's deck against each column's deck, ± half its {:.0%} confidence interval:"
+          .format(args.confidence))
+    print(format_matrix(matrix, args.decks))
+    if args.csv:
+        write_csv(args.csv, matrix, args.decks)
+
+
+if __name__ == "__main__":
+    main()
@@ -81,17 +81,17 @@ class MindShatter(Power):
 class PaladinPower(Power):
     def use(self):
         super().use()
-        from hearthbreaker.cards.minions.paladin import SilverHandRecruit
+        from hearthbreaker.engine import card_lookup
 
-        recruit_card = SilverHandRecruit()
+        recruit_card = card_lookup("Silver Hand Recruit")
         recruit_card.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
 class RoguePower(Power):
     def use(self):
         super().use()
-        from hearthbreaker.cards.weapons.rogue import WickedKnife
-        wicked_knife = WickedKnife()
+        from hearthbreaker.engine import card_lookup
+        wicked_knife = card_lookup("Wicked Knife")
         knife = wicked_knife.create_weapon(self.hero.player)
         knife.card = wicked_knife
         knife.equip(self.hero.player)
@@ -129,19 +129,19 @@ class ShamanPower(Power):
 
     def use(self):
         super().use()
-        from hearthbreaker.cards.minions.shaman import HealingTotem, SearingTotem, StoneclawTotem, WrathOfAirTotem
+        from hearthbreaker.engine import card_lookup
 
         totems = []
         if not self.healing_totem:
-            totems.append(HealingTotem())
+            totems.append("Healing Totem")
         if not self.searing_totem:
-            totems.append(SearingTotem())
+            totems.append("Searing Totem")
         if not self.stoneclaw_totem:
-            totems.append(StoneclawTotem())
+            totems.append("Stoneclaw Totem")
         if not self.wrath_of_air_totem:
-            totems.append(WrathOfAirTotem())
+            totems.append("Wrath of Air Totem")
 
-        random_totem = self.hero.player.game.random_choice(totems)
+        random_totem = card_lookup(self.hero.player.game.random_choice(totems))
         random_totem.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
@@ -155,9 +155,9 @@ class WarlockPower(Power):
 class JaraxxusPower(Power):
     def use(self):
         super().use()
-        from hearthbreaker.cards.minions.warlock import Infernal
+        from hearthbreaker.engine import card_lookup
 
-        infernal_card = Infernal()
+        infernal_card = card_lookup("Infernal")
         infernal_card.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
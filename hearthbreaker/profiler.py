@@ -0,0 +1,302 @@
+"""
+Works out which cards the engine spends its time on, by attributing the time spent in each card's effects, auras,
+battlecries, deathrattles and spells to the card, along with the events triggered while they run::
+
+    with profiler.enabled():
+        game.start()
+    print(profiler.costs().table())
+
+The code of a card is entered through :meth:`Effect._find_target <hearthbreaker.tags.base.Effect._find_target>`,
+:meth:`ActionTag.do <hearthbreaker.tags.base.ActionTag.do>` (which includes battlecries and deathrattles),
+:meth:`Aura.apply <hearthbreaker.tags.base.Aura.apply>`, ``unapply`` and ``match``, and the ``use`` method of spell
+cards.  Each is timed and attributed to the ``ref_name`` of the card its owner was made from.  When one card's code
+sets off another's, such as a deathrattle which summons a minion that triggers an effect, the second is part of the
+cascade of the first.  Each card is charged its own time, excluding the cards it set off, and its cascade time, which
+includes them.
+
+As with :mod:`hearthbreaker.instrumentation`, the methods are replaced while profiling is enabled, and put back when
+it is disabled.  Because an effect binds its method to an event when it is applied, the profiler should be enabled
+before the games to be profiled are made, and effects applied before then aren't profiled.  Effects applied while it
+was enabled keep calling the replaced method afterwards, which does nothing more than the original once profiling has
+stopped.  The profiler and instrumentation can't be enabled at the same time.
+"""
+import contextlib
+import json
+import time
+
+from hearthbreaker.game_objects import Bindable, GameException
+from hearthbreaker.instrumentation import _subclasses
+
+# The costs being added to, if profiling is enabled
+_costs = None
+
+# The card code being run, innermost last.  Each frame is the owner of the code, the name of its card, the time spent
+# in the cards it set off, and how many events it has triggered.
+_stack = []
+
+# The class, method name and original function of each method which has been replaced
+_replaced = []
+
+
+class CardCosts:
+    """
+    The time spent running the code of each card, and the events it triggered, over a number of games
+    """
+
+    def __init__(self):
+        #: How many games were started while profiling
+        self.games = 0
+        #: The number of calls, own seconds, cascade seconds, events triggered and total cascade depth of each card,
+        #: keyed by the card's ref_name
+        self.cards = {}
+
+    def add(self, name, seconds, cascade_seconds, events, depth):
+        """
+        Counts a call of a card's code
+
+        :param str name: The ref_name of the card
+        :param float seconds: The time spent in the call, excluding any other cards' code it ran
+        :param float cascade_seconds: The time spent in the call, including any other cards' code it ran
+        :param int events: How many events the card's code triggered itself
+        :param int depth: How many cards' code was being run, including this card's.  Code run directly by the engine
+                          has a depth of 1.
+        """
+        entry = self.cards.get(name)
+        if entry is None:
+            self.cards[name] = [1, seconds, cascade_seconds, events, depth]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += cascade_seconds
+            entry[3] += events
+            entry[4] += depth
+
+    def merge(self, other):
+        """
+        Adds the games profiled by another set of costs to these
+
+        :param CardCosts other: The costs to add
+        """
+        self.games += other.games
+        for name, values in other.cards.items():
+            entry = self.cards.get(name)
+            if entry is None:
+                self.cards[name] = list(values)
+            else:
+                for index, value in enumerate(values):
+                    entry[index] += value
+
+    def rows(self):
+        """
+        :return: The ref_name, number of calls, own seconds, cascade seconds, events triggered and mean cascade depth
+                 of each card, most expensive first
+        :rtype: [(str, int, float, float, int, float)]
+        """
+        return sorted(((name, calls, seconds, cascade_seconds, events, depth / calls)
+                       for name, (calls, seconds, cascade_seconds, events, depth) in self.cards.items()),
+                      key=lambda row: (-row[2], row[0]))
+
+    def table(self, limit=None):
+        """
+        Lays the costs out as a table, most expensive card first
+
+        :param int limit: How many cards to include, or None for all of them
+        :rtype: str
+        """
+        games = max(self.games, 1)
+        lines = ["{:<28} {:>10} {:>10} {:>10} {:>12} {:>10} {:>8}".format(
+            "card", "calls/game", "own (ms)", "mean (us)", "cascade (ms)", "events", "depth")]
+        for name, calls, seconds, cascade_seconds, events, depth in self.rows()[:limit]:
+            lines.append("{:<28} {:>10.2f} {:>10.2f} {:>10.2f} {:>12.2f} {:>10.2f} {:>8.2f}".format(
+                name, calls / games, seconds * 1e3, seconds / calls * 1e6, cascade_seconds * 1e3, events / calls,
+                depth))
+        return "\n".join(lines)
+
+    def __to_json__(self):
+        return {
+            'games': self.games,
+            'cards': [{'card': name, 'calls': calls, 'seconds': seconds, 'cascade_seconds': cascade_seconds,
+                       'events': events, 'mean_depth': depth}
+                      for name, calls, seconds, cascade_seconds, events, depth in self.rows()],
+        }
+
+    @staticmethod
+    def from_json(games, cards):
+        costs = CardCosts()
+        costs.games = games
+        for card in cards:
+            costs.cards[card['card']] = [card['calls'], card['seconds'], card['cascade_seconds'], card['events'],
+                                         card['mean_depth'] * card['calls']]
+        return costs
+
+    def dump(self, path):
+        """
+        Saves the costs as JSON
+
+        :param str path: The file to save to
+        """
+        with open(path, "w") as file:
+            json.dump(self.__to_json__(), file, indent=1)
+
+
+def _card_name(owner):
+    card = getattr(owner, "card", None)
+    if card is not None:
+        return card.ref_name
+    # Spells are their own cards, and the auras and effects of players don't belong to any card
+    return getattr(owner, "ref_name", None) or type(owner).__name__
+
+
+def _profiled(function, owner_of):
+    perf_counter = time.perf_counter
+
+    def profiled(*args, **kwargs):
+        if _costs is None or not _replaced:
+            # Effects keep the method they were applied with, so this is still called once profiling has stopped
+            return function(*args, **kwargs)
+        owner = owner_of(args)
+        if _stack and _stack[-1][0] is owner:
+            # The same card's code, such as an effect running its tags, is already being timed
+            return function(*args, **kwargs)
+        name = _card_name(owner)
+        frame = [owner, name, 0.0, 0]
+        _stack.append(frame)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            _stack.pop()
+            depth = len(_stack) + 1
+            if _stack:
+                _stack[-1][2] += seconds
+            # A card which sets itself off only has its outermost call counted in its cascade time
+            cascade_seconds = 0.0 if any(outer[1] == name for outer in _stack) else seconds
+            _costs.add(name, seconds - frame[2], cascade_seconds, frame[3], depth)
+    profiled.__wrapped__ = function
+    return profiled
+
+
+def _counted_trigger(function):
+    def trigger(self, event, *args):
+        if _stack:
+            _stack[-1][3] += 1
+        return function(self, event, *args)
+    trigger.__wrapped__ = function
+    return trigger
+
+
+def _counted_start(function):
+    def start(self):
+        _costs.games += 1
+        return function(self)
+    start.__wrapped__ = function
+    return start
+
+
+def _tag_owner(args):
+    return args[0].owner
+
+
+def _first_argument(args):
+    return args[1]
+
+
+def _card(args):
+    return args[0]
+
+
+def _replace(classes, method, wrap, *wrap_args):
+    for klass in [klass for klass in classes if method in klass.__dict__]:
+        function = klass.__dict__[method]
+        _replaced.append((klass, method, function))
+        setattr(klass, method, wrap(function, *wrap_args))
+
+
+def enable():
+    """
+    Starts profiling, adding to any costs counted since the profiler was last reset.  This can't be done while a game
+    has a checkpoint open, or while instrumentation is enabled.
+    """
+    global _costs
+    import hearthbreaker.cards
+    import hearthbreaker.journal
+    from hearthbreaker import instrumentation
+    from hearthbreaker.cards.base import SpellCard
+    from hearthbreaker.engine import Game
+    from hearthbreaker.tags.base import ActionTag, Aura, Effect
+    if _replaced:
+        return
+    if hearthbreaker.journal._active is not None:
+        raise GameException("The profiler can't be enabled while a game has a checkpoint open")
+    if instrumentation.is_enabled():
+        raise GameException("The profiler can't be enabled while instrumentation is enabled")
+    # Every spell has its own use method, so every card module must be imported to find them
+    for name in hearthbreaker.cards.__all__:
+        getattr(hearthbreaker.cards, name)
+    if _costs is None:
+        _costs = CardCosts()
+    _replace([Bindable], "trigger", _counted_trigger)
+    _replace([Game], "start", _counted_start)
+    _replace(_subclasses(Effect), "_find_target", _profiled, _tag_owner)
+    for method in ["apply", "unapply", "match"]:
+        _replace(_subclasses(Aura), method, _profiled, _tag_owner)
+    # Tags are done with their owner as the first argument, and deathrattles with the minion which died
+    _replace(_subclasses(ActionTag), "do", _profiled, _first_argument)
+    _replace(_subclasses(SpellCard), "use", _profiled, _card)
+
+
+def disable():
+    """
+    Stops profiling.  The costs counted so far are kept until :func:`reset` is called.
+    """
+    import hearthbreaker.journal
+    if hearthbreaker.journal._active is not None:
+        raise GameException("The profiler can't be disabled while a game has a checkpoint open")
+    while _replaced:
+        cls, method, function = _replaced.pop()
+        setattr(cls, method, function)
+    del _stack[:]
+
+
+def is_enabled():
+    """
+    :return: Whether the profiler is counting costs
+    :rtype: bool
+    """
+    return bool(_replaced)
+
+
+@contextlib.contextmanager
+def enabled():
+    """
+    Profiles for the duration of a ``with`` block
+    """
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def costs():
+    """
+    :return: The costs counted since the profiler was last reset
+    :rtype: CardCosts
+    """
+    return _costs or CardCosts()
+
+
+def reset():
+    """
+    Forgets the costs counted so far, and returns them
+
+    :rtype: CardCosts
+    """
+    global _costs
+    counted = costs()
+    _costs = CardCosts() if is_enabled() else None
+    return counted
+
@@ -0,0 +1,350 @@
+"""
+Plays a batch of games between two decks, spread across several processes, and reports how they went::
+
+    python -m hearthbreaker.sim zoo.hsdeck patron.hsdeck --games 10000 --workers 4 --agents Random Trade
+
+The decks are in the same format as for the console application.  Each game has its own seed, derived from the seed
+of the batch and the game's number, so a batch plays out the same however many workers it is spread across, and a game
+which raised an error can be played again on its own from the seed reported for it.
+"""
+import argparse
+import collections
+import multiprocessing
+import sys
+import time
+
+from hearthbreaker import instrumentation, profiler
+from hearthbreaker.agents import registry
+from hearthbreaker.cards.heroes import hero_for_class
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import Game, Deck, card_lookup, derive_seed
+from hearthbreaker.sinks import GameRecorder, JSONLSink, NumpySink
+
+# The decks and agents of the games played by this worker process, set up when the process starts
+_worker = None
+
+
+def read_deck(filename):
+    """
+    Reads a deck file, which has a card name in English on each line, preceded by a number to specify how many.
+
+    :param str filename: The path of the deck file
+    :return: The name of each card in the deck
+    :rtype: [str]
+    """
+    card_names = []
+    with open(filename, "r") as deck_file:
+        for line in deck_file.read().splitlines():
+            if line.strip():
+                count, name = line.split(" ", 1)
+                card_names.extend([name] * int(count))
+    return card_names
+
+
+def make_deck(card_names):
+    """
+    Makes a deck of the named cards.  The hero is of the class of the deck's class cards, or a mage if it has none.
+
+    :param card_names: The name of each card in the deck
+    :type card_names: [str]
+    :rtype: :class:`hearthbreaker.engine.Deck`
+    """
+    cards = [card_lookup(name) for name in card_names]
+    character_class = CHARACTER_CLASS.MAGE
+    for card in cards:
+        if card.character_class != CHARACTER_CLASS.ALL:
+            character_class = card.character_class
+    return Deck(cards, hero_for_class(character_class))
+
+
+class SimulationResult:
+    """
+    How a batch of games went.  Wins are counted by deck, in the order the decks were given, whichever deck went first.
+    """
+
+    #: How many of the games which raised an error are kept the details of
+    MAX_ERRORS = 10
+
+    def __init__(self):
+        #: How many games were played to the end
+        self.games = 0
+        #: How many games each deck won
+        self.wins = [0, 0]
+        #: How many games ended with both heroes dead, including those which reached the turn limit
+        self.draws = 0
+        #: How many games lasted each number of turns
+        self.lengths = collections.Counter()
+        #: How many games raised an error
+        self.errors = 0
+        #: The number, seed and error of the first games to raise an error, as a list of tuples
+        self.error_details = []
+        #: The calls counted while the games were played, if they were instrumented
+        self.counters = None
+        #: The time spent on each card while the games were played, if they were profiled
+        self.card_costs = None
+
+    def add_game(self, game):
+        """
+        Records the outcome of a game which has ended
+
+        :param hearthbreaker.engine.Game game: The game, which was given the decks in the order wins are counted in
+        """
+        dead = [player.hero.dead for player in game.players]
+        if game.first_player == 1:
+            dead.reverse()
+        if dead[0] and dead[1]:
+            self.draws += 1
+        elif dead[1]:
+            self.wins[0] += 1
+        else:
+            self.wins[1] += 1
+        self.lengths[game._turns_passed] += 1
+        self.games += 1
+
+    def add_error(self, index, seed, error):
+        """
+        Records a game which raised an error
+
+        :param int index: The game's number in the batch
+        :param int seed: The game's seed
+        :param Exception error: The error raised
+        """
+        self.errors += 1
+        if len(self.error_details) < self.MAX_ERRORS:
+            self.error_details.append((index, seed, "{}: {}".format(type(error).__name__, error)))
+
+    def merge(self, other):
+        """
+        Adds the games of another result to this one
+
+        :param SimulationResult other: The result to add
+        """
+        self.games += other.games
+        self.wins = [wins + other_wins for wins, other_wins in zip(self.wins, other.wins)]
+        self.draws += other.draws
+        self.lengths.update(other.lengths)
+        self.errors += other.errors
+        self.error_details = sorted(self.error_details + other.error_details)[:self.MAX_ERRORS]
+        if other.counters is not None:
+            if self.counters is None:
+                self.counters = instrumentation.Counters()
+            self.counters.merge(other.counters)
+        if other.card_costs is not None:
+            if self.card_costs is None:
+                self.card_costs = profiler.CardCosts()
+            self.card_costs.merge(other.card_costs)
+
+    def mean_length(self):
+        """
+        :return: The mean number of turns the games lasted, or 0 if none were played to the end
+        :rtype: float
+        """
+        if not self.games:
+            return 0
+        return sum(turns * games for turns, games in self.lengths.items()) / self.games
+
+
+def play_games(decks, agent_names, seed, start, count, records=None):
+    """
+    Plays some of the games in a batch
+
+    :param decks: The two decks to play with.  Each game is given copies of them.
+    :type decks: [:class:`hearthbreaker.engine.Deck`]
+    :param agent_names: The name in :data:`hearthbreaker.agents.registry` of the agent for each deck
+    :type agent_names: [str]
+    :param int seed: The seed of the batch
+    :param int start: The number of the first game to play
+    :param int count: How many games to play
+    :param list records: If given, the record of each game, as made by :class:`hearthbreaker.sinks.GameRecorder`,
+                         is added to this list
+    :rtype: SimulationResult
+    """
+    result = SimulationResult()
+    for index in range(start, start + count):
+        game_seed = derive_seed(seed, index)
+        game = Game([deck.copy() for deck in decks], [registry.create_agent(name) for name in agent_names],
+                    seed=game_seed)
+        recorder = None if records is None else GameRecorder(game, index)
+        try:
+            game.start()
+        except Exception as e:
+            result.add_error(index, game_seed, e)
+            if recorder:
+                records.append(recorder.record(e))
+        else:
+            result.add_game(game)
+            if recorder:
+                records.append(recorder.record())
+    return result
+
+
+def _measure(instrument, profile):
+    # Starts instrumenting or profiling, if asked to
+    if instrument:
+        instrumentation.enable()
+    if profile:
+        profiler.enable()
+
+
+def _collect(result, instrument, profile):
+    # Takes what has been measured since the last chunk of games, and adds it to the chunk's result
+    if instrument:
+        result.counters = instrumentation.reset()
+    if profile:
+        result.card_costs = profiler.reset()
+
+
+def _start_worker(deck_lists, agent_names, recording, instrument, profile):
+    global _worker
+    from hearthbreaker.catalogue import get_catalogue
+    # Load everything the games need up front, rather than in the middle of the first game which uses it
+    get_catalogue()
+    _worker = ([make_deck(card_names) for card_names in deck_lists], agent_names, recording, instrument, profile)
+    _measure(instrument, profile)
+
+
+def _play_chunk(chunk):
+    decks, agent_names, recording, instrument, profile = _worker
+    records = [] if recording else None
+    result = play_games(decks, agent_names, *chunk, records=records)
+    _collect(result, instrument, profile)
+    return result, records
+
+
+def simulate(deck_lists, agent_names, games, workers=None, seed=0, chunk_size=None, progress=None, sinks=(),
+             instrument=False, profile=False):
+    """
+    Plays a batch of games between two decks
+
+    :param deck_lists: The names of the cards in each of the two decks
+    :type deck_lists: [[str]]
+    :param agent_names: The name in :data:`hearthbreaker.agents.registry` of the agent for each deck
+    :type agent_names: [str]
+    :param int games: How many games to play
+    :param int workers: How many processes to play the games in, by default one for each CPU.  With one worker, the
+                        games are played in this process.
+    :param int seed: The seed of the batch, from which each game's seed is derived
+    :param int chunk_size: How many games to hand a worker at a time.  By default, each worker is handed about ten
+                           chunks, of up to 100 games each.
+    :param progress: Called after each chunk of games with the results so far and the number of seconds since the
+                     batch started
+    :type progress: function
+    :param sinks: Sinks to write the record of each game to.  The records of each chunk are sent back from the workers
+                  and written as the chunk finishes, so they are in order within a chunk, but not across chunks.
+    :type sinks: [:class:`hearthbreaker.sinks.ResultSink`]
+    :param bool instrument: Whether to count and time the engine's calls with :mod:`hearthbreaker.instrumentation`
+                            while the games are played.  The counts from every worker are added up in the result's
+                            ``counters``.
+    :param bool profile: Whether to work out the time spent on each card with :mod:`hearthbreaker.profiler` while the
+                         games are played.  The costs from every worker are added up in the result's ``card_costs``.
+                         Games can't be both instrumented and profiled.
+    :rtype: SimulationResult
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if chunk_size is None:
+        chunk_size = max(1, min(100, games // (workers * 10)))
+    chunks = [(seed, start, min(chunk_size, games - start)) for start in range(0, games, chunk_size)]
+    result = SimulationResult()
+    start_time = time.perf_counter()
+
+    def add(chunk_result, records):
+        result.merge(chunk_result)
+        for record in records or ():
+            for sink in sinks:
+                sink.write(record)
+        if progress:
+            progress(result, time.perf_counter() - start_time)
+
+    if workers == 1:
+        decks = [make_deck(card_names) for card_names in deck_lists]
+        was_measuring = instrumentation.is_enabled(), profiler.is_enabled()
+        _measure(instrument, profile)
+        try:
+            for chunk in chunks:
+                records = [] if sinks else None
+                chunk_result = play_games(decks, agent_names, *chunk, records=records)
+                _collect(chunk_result, instrument, profile)
+                add(chunk_result, records)
+        finally:
+            if not was_measuring[0]:
+                instrumentation.disable()
+            if not was_measuring[1]:
+                profiler.disable()
+    else:
+        with multiprocessing.Pool(workers, _start_worker,
+                                  (deck_lists, agent_names, bool(sinks), instrument, profile)) as pool:
+            for chunk_result, records in pool.imap_unordered(_play_chunk, chunks):
+                add(chunk_result, records)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hearthbreaker.sim",
+                                     description="Plays a batch of games between two decks")
+    parser.add_argument("decks", nargs=2, metavar="deck", help="a deck file")
+    parser.add_argument("--agents", nargs=2, default=["Random", "Random"], choices=registry.get_names(),
+                        help="the agent to play each deck (default: Random Random)")
+    parser.add_argument("--games", type=int, default=1000, help="how many games to play (default: 1000)")
+    parser.add_argument("--workers", type=int, help="how many processes to play in (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the batch (default: 0)")
+    parser.add_argument("--chunk-size", type=int, help="how many games to hand a worker at a time")
+    parser.add_argument("--jsonl", metavar="DIRECTORY", help="write the record of each game to JSON lines files here")
+    parser.add_argument("--npy", metavar="DIRECTORY", help="write the record of each game to .npy files here")
+    parser.add_argument("--instrument", action="store_true",
+                        help="count and time the engine's calls, and print the slowest")
+    parser.add_argument("--instrument-json", metavar="FILE",
+                        help="count and time the engine's calls, and save them here")
+    parser.add_argument("--profile-cards", action="store_true",
+                        help="work out the time spent on each card, and print the most expensive")
+    parser.add_argument("--profile-json", metavar="FILE", help="work out the time spent on each card, and save it here")
+    args = parser.parse_args(argv)
+    instrument = args.instrument or bool(args.instrument_json)
+    profile = args.profile_cards or bool(args.profile_json)
+    if instrument and profile:
+        parser.error("games can't be both instrumented and profiled")
+
+    def report(result, elapsed):
+        sys.stderr.write("\r{} games, {:.1f} games/sec".format(result.games + result.errors,
+                                                              (result.games + result.errors) / elapsed))
+        sys.stderr.flush()
+
+    sinks = []
+    if args.jsonl:
+        sinks.append(JSONLSink(args.jsonl))
+    if args.npy:
+        sinks.append(NumpySink(args.npy))
+    start_time = time.perf_counter()
+    try:
+        result = simulate([read_deck(deck) for deck in args.decks], args.agents, args.games, args.workers, args.seed,
+                          args.chunk_size, report, sinks, instrument, profile)
+    finally:
+        for sink in sinks:
+            sink.close()
+    elapsed = time.perf_counter() - start_time
+    sys.stderr.write("\n")
+
+    print("{} games in {:.1f}s ({:.1f} games/sec)".format(args.games, elapsed, args.games / elapsed))
+    for deck, agent, wins in zip(args.decks, args.agents, result.wins):
+        print("{} ({}): {} wins ({:.1%})".format(deck, agent, wins, wins / max(result.games, 1)))
+    print("Draws: {}".format(result.draws))
+    if result.games:
+        print("Length: {:.1f} turns on average, {} to {}".format(result.mean_length(), min(result.lengths),
+                                                                 max(result.lengths)))
+    print("Errors: {}".format(result.errors))
+    for index, seed, error in result.error_details:
+        print("  game {} (seed {}): {}".format(index, seed, error))
+    if args.instrument:
+        print()
+        print(result.counters.table(30))
+    if args.instrument_json:
+        result.counters.dump(args.instrument_json)
+    if args.profile_cards:
+        print()
+        print(result.card_costs.table(30))
+    if args.profile_json:
+        result.card_costs.dump(args.profile_json)
+
+
+if __name__ == "__main__":
+    main()
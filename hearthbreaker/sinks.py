@@ -0,0 +1,238 @@
+"""
+Sinks which the records of simulated games are written to as they are played, so that the results of millions of
+games can be kept without holding them all in memory.
+
+Each game's record is a dict, with the players in the order their decks were given to the game:
+
+* ``game``: the game's number in its batch
+* ``seed``: the game's seed, if it had one
+* ``winner``: 0 or 1 for the player who won, or -1 for a draw or a game which raised an error
+* ``turns``: how many turns the game lasted
+* ``first_player``: 0 or 1 for the player who went first
+* ``damage``: the damage taken by each player's hero and minions
+* ``cards_played``: how many cards each player played
+* ``error``: the error the game raised, as a string, or None
+
+:class:`JSONLSink` writes the records as lines of JSON.  :class:`NumpySink` writes them to ``.npy`` files of fixed
+width records, which can be loaded directly with :func:`numpy.load`.  Both start a new file every so many records.
+"""
+import abc
+import json
+import os
+
+
+class ResultSink(metaclass=abc.ABCMeta):
+    """
+    Somewhere to write the records of games to.  Sinks can be used as context managers, which close them at the end.
+    """
+
+    @abc.abstractmethod
+    def write(self, record):
+        """
+        Writes the record of a game
+
+        :param dict record: The record, as made by :meth:`GameRecorder.record`
+        """
+        pass
+
+    def close(self):
+        """
+        Finishes writing any records which are still buffered, and closes the sink's files
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class GameRecorder:
+    """
+    Follows a game as it is played, so that a record of it can be made once it is over.  The record can be written to a
+    sink as soon as the game ends, or made with :meth:`record`.
+    """
+
+    def __init__(self, game, index=0, seed=None, sink=None):
+        """
+        Starts following a game.  This must be done before the game starts.
+
+        :param hearthbreaker.engine.Game game: The game to follow
+        :param int index: The game's number in its batch
+        :param int seed: The game's seed, by default the seed it was made with
+        :param ResultSink sink: A sink to write the record to when the game ends, if any
+        """
+        self.game = game
+        self.index = index
+        self.seed = game.seed if seed is None else seed
+        # Indexed by position in game.players, which are in the order they take their turns
+        self.damage = [0, 0]
+        self.cards_played = [0, 0]
+        for position, player in enumerate(game.players):
+            player.bind("character_damaged", self._count_damage(position))
+            player.bind("card_played", self._count_card(position))
+        if sink is not None:
+            game.bind_once("game_ended", lambda: sink.write(self.record()))
+
+    def _count_damage(self, position):
+        def count(character, attacker, amount):
+            self.damage[position] += amount
+        return count
+
+    def _count_card(self, position):
+        def count(card, index):
+            self.cards_played[position] += 1
+        return count
+
+    def record(self, error=None):
+        """
+        Makes the record of the game
+
+        :param Exception error: The error the game raised, if it raised one
+        :rtype: dict
+        """
+        game = self.game
+        # The first player was given the deck at position first_player
+        order = [0, 1] if game.first_player == 0 else [1, 0]
+        dead = [game.players[position].hero.dead for position in order]
+        if error is not None or dead[0] == dead[1]:
+            winner = -1
+        else:
+            winner = 1 if dead[0] else 0
+        return {
+            'game': self.index,
+            'seed': self.seed,
+            'winner': winner,
+            'turns': game._turns_passed,
+            'first_player': game.first_player,
+            'damage': [self.damage[position] for position in order],
+            'cards_played': [self.cards_played[position] for position in order],
+            'error': None if error is None else "{}: {}".format(type(error).__name__, error),
+        }
+
+
+class _RotatingSink(ResultSink):
+    # Keeps the records in numbered files, with a new file started whenever the current one is full
+
+    def __init__(self, directory, prefix, extension, records_per_file):
+        if records_per_file < 1:
+            raise ValueError("records_per_file must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.extension = extension
+        self.records_per_file = records_per_file
+        #: The paths of the files written so far, including the one being written
+        self.paths = []
+        self._in_file = records_per_file
+
+    def _next_path(self):
+        path = os.path.join(self.directory, "{}-{:05d}{}".format(self.prefix, len(self.paths), self.extension))
+        self.paths.append(path)
+        self._in_file = 0
+        return path
+
+
+class JSONLSink(_RotatingSink):
+    """
+    Writes each record as a line of JSON, to files named ``<prefix>-00000.jsonl``, ``<prefix>-00001.jsonl`` and so on.
+    """
+
+    def __init__(self, directory, prefix="games", records_per_file=1000000, buffer_size=1 << 20):
+        """
+        :param str directory: The directory to write the files to, which is made if it doesn't exist
+        :param str prefix: The start of the name of each file
+        :param int records_per_file: How many records to write to a file before starting the next one
+        :param int buffer_size: How many bytes to buffer before writing to the file
+        """
+        super().__init__(directory, prefix, ".jsonl", records_per_file)
+        self.buffer_size = buffer_size
+        self._file = None
+
+    def write(self, record):
+        if self._in_file == self.records_per_file:
+            self.close()
+            self._file = open(self._next_path(), "w", encoding="utf-8", buffering=self.buffer_size)
+        self._file.write(json.dumps(record, separators=(',', ':')))
+        self._file.write("\n")
+        self._in_file += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class NumpySink(_RotatingSink):
+    """
+    Writes the records to ``.npy`` files of fixed width records, named ``<prefix>-00000.npy``, ``<prefix>-00001.npy``
+    and so on, which can be loaded with :func:`numpy.load`.  Each file is mapped into memory, and the records are
+    copied into it in blocks.  The last file is cut down to the records written when the sink is closed.
+
+    The records have the fields of :data:`NumpySink.FIELDS`.  The seed of a game without one is written as 0, and only
+    whether a game raised an error is kept, not the error itself.
+
+    NumPy must be installed to use this sink.
+    """
+
+    #: The fields of each record, as a NumPy dtype description
+    FIELDS = [("game", "<i8"), ("seed", "<u8"), ("winner", "i1"), ("turns", "<i2"), ("first_player", "i1"),
+              ("damage", "<i4", (2,)), ("cards_played", "<i2", (2,)), ("error", "?")]
+
+    def __init__(self, directory, prefix="games", records_per_file=1000000, buffer_size=1024):
+        """
+        :param str directory: The directory to write the files to, which is made if it doesn't exist
+        :param str prefix: The start of the name of each file
+        :param int records_per_file: How many records to write to a file before starting the next one
+        :param int buffer_size: How many records to collect before copying them to the file
+        """
+        import numpy
+        import numpy.lib.format
+        self._numpy = numpy
+        self._dtype = numpy.dtype(self.FIELDS)
+        super().__init__(directory, prefix, ".npy", records_per_file)
+        self.buffer_size = buffer_size
+        self._array = None
+        self._buffer = []
+
+    def write(self, record):
+        if self._in_file + len(self._buffer) == self.records_per_file:
+            self._flush()
+            self._finish_file()
+            self._array = self._numpy.lib.format.open_memmap(self._next_path(), mode="w+", dtype=self._dtype,
+                                                             shape=(self.records_per_file,))
+        self._buffer.append((record['game'], record['seed'] or 0, record['winner'], record['turns'],
+                             record['first_player'], record['damage'], record['cards_played'],
+                             record['error'] is not None))
+        if len(self._buffer) == self.buffer_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            end = self._in_file + len(self._buffer)
+            self._array[self._in_file:end] = self._numpy.array(self._buffer, dtype=self._dtype)
+            self._in_file = end
+            self._buffer = []
+
+    def _finish_file(self):
+        if self._array is None:
+            return
+        self._array.flush()
+        if self._in_file < len(self._array):
+            # Copy the records written to a file of the right length, a block at a time
+            path = self.paths[-1]
+            temp_path = path + ".tmp"
+            short = self._numpy.lib.format.open_memmap(temp_path, mode="w+", dtype=self._dtype,
+                                                       shape=(self._in_file,))
+            for start in range(0, self._in_file, self.buffer_size):
+                end = min(start + self.buffer_size, self._in_file)
+                short[start:end] = self._array[start:end]
+            short.flush()
+            del short
+            os.replace(temp_path, path)
+        self._array = None
+
+    def close(self):
+        self._flush()
+        self._finish_file()
@@ -68,7 +68,8 @@ class GiveAura(Action):
 
     def act(self, actor, target, other=None):
         for aura in self.auras:
-            target.add_aura(aura)
+            # The aura is part of a card definition which may be shared, so each target is given its own copy
+            target.add_aura(aura.clone())
 
     def __to_json__(self):
         return {
@@ -96,6 +97,8 @@ class GiveEffect(Action):
 
     def act(self, actor, target, other=None):
         for effect in self.effects:
+            # The effect is part of a card definition which may be shared, so the copy is the one which is changed
+            effect = copy.deepcopy(effect)
             for tag in effect.tags:
                 for action in tag.actions:
                     if hasattr(action, "selector"):
@@ -302,8 +305,7 @@ class Discard(Action, metaclass=Amount):
                     actor.player.trigger("card_discarded", card)
                     card.unattach()
                 else:
-                    card.drawn = True
-                    actor.player.deck.left -= 1
+                    actor.player.deck.remove_card(card)
                     actor.player.trigger("card_discarded", card)
 
     def __to_json__(self):
@@ -406,8 +408,7 @@ class RemoveFromDeck(Action):
         card = self.card.get_card(target, target, actor)
         target.game.selected_card = card
         if card:
-            card.drawn = True
-            target.deck.left -= 1
+            target.deck.remove_card(card)
 
     def __to_json__(self):
         return {
@@ -515,15 +516,13 @@ class ApplySecret(Action):
             target.secrets.append(secret)
             target.game.selected_card = secret
             secret.player = target
-            if target is target.game.other_player:
-                secret.player = target
-                # To allow for Mad Scientist not to be redeemed or duplicated as a result of its death,
-                # but still allow other minions that die during the same cycle to be duplicated.
-                # Based on testing for patch 2.1.0.7785
-                if actor.dead:
-                    target.bind_once("after_death", secret.activate)
-                else:
-                    secret.activate(target)
+            # To allow for Mad Scientist not to be redeemed or duplicated as a result of its death,
+            # but still allow other minions that die during the same cycle to be duplicated.
+            # Based on testing for patch 2.1.0.7785
+            if target is target.game.other_player and actor.dead:
+                target.bind_once("after_death", secret.activate)
+            else:
+                secret.activate(target)
 
     def __to_json__(self):
         return {
@@ -826,8 +825,9 @@ class Joust(Action):
         self.lose_action = lose_action
 
     def act(self, actor, target, other=None):
-        my_card = actor.game.random_draw(actor.player.deck.cards, lambda c: not c.drawn)
-        their_card = actor.game.random_draw(actor.player.opponent.deck.cards, lambda c: not c.drawn and c.is_minion())
+        my_cards = actor.player.deck.undrawn_cards()
+        my_card = actor.game.random_choice(my_cards) if my_cards else None
+        their_card = actor.game.random_draw(actor.player.opponent.deck.undrawn_cards(), lambda c: c.is_minion())
 
         if my_card and (not their_card or my_card.mana > their_card.mana):
             self.win_action.act(actor, target, other)
@@ -1,10 +1,80 @@
 import abc
 import copy
+import importlib
 import json
 import string
 
+from hearthbreaker.constants import TARGET_KIND, BOARD_DEPENDENCY
+
+# Bumped whenever a tag changes its JSON form in place, which makes every cached structure out of date
+_structure_version = 0
+
+#: Whether tags are run through the closures built by :mod:`hearthbreaker.tags.compiler`, rather than by walking
+#: their trees.  Both give the same results.  Compiling pays off for tags which are run many times, such as the auras
+#: on a crowded board, but in a typical game it costs about as much as it saves, so it is off by default.
+use_compiled = False
+
+# The attributes which objects use to cache what they work out from their own state.  These are left out of copies,
+# which are usually changed straight after they are made.
+_CACHES = ("_structure", "_compiled", "_run")
+
+
+def invalidate_structures():
+    """
+    Marks the structures cached by :meth:`JSONObject.structure` as out of date.  Must be called whenever an object
+    changes its JSON form after it has been created, since the structure of every object containing it changes too.
+    """
+    global _structure_version
+    _structure_version += 1
+
+
+def _structure_of(value):
+    if isinstance(value, JSONObject):
+        return value.structure()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _structure_of(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_structure_of(item) for item in value)
+    if isinstance(value, (bool, float)):
+        # Kept apart from the ints they compare equal to, since their JSON differs
+        return type(value).__name__, value
+    if hasattr(value, "__to_json__"):
+        return _structure_of(value.__to_json__())
+    return value
+
 
 class JSONObject(metaclass=abc.ABCMeta):
+    # The kinds of object which from_json creates by name, such as actions and selectors, each set the module their
+    # classes are found in, along with their own dicts of those classes by class name and by the name in the JSON
+    _module = None
+    _classes = None
+    _named = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_classes" not in cls.__dict__ and cls.__module__ == cls._module:
+            cls._classes[cls.__name__] = cls
+
+    @classmethod
+    def _class_named(cls, name, suffix=""):
+        """
+        Finds the class which from_json creates for a name in the JSON, which is the class in this kind's module
+        named for it in CamelCase, followed by suffix.  Each name is only worked out once.
+
+        :param str name: The name in the JSON, such as ``"give_divine_shield"``
+        :param str suffix: The ending shared by the names of this kind of class, such as ``"Selector"``
+        :rtype: type
+        """
+        found = cls._named.get(name)
+        if found is None:
+            # Importing the module fills in the classes, which are registered as they are defined
+            module = importlib.import_module(cls._module)
+            cls_name = string.capwords(name, '_').replace("_", "") + suffix
+            found = cls._classes.get(cls_name)
+            if found is None:
+                found = getattr(module, cls_name)
+            cls._named[name] = found
+        return found
 
     @abc.abstractmethod
     def __to_json__(self):
@@ -18,23 +88,101 @@ class JSONObject(metaclass=abc.ABCMeta):
     def to_instance(self, target):
         return copy.copy(self)
 
+    def clone(self):
+        """
+        Creates a copy of this object for use by another game object, such as a copy of a minion in a copied game.
+
+        Only state which changes while the game is played is copied.  By default there is none, so the object itself
+        is returned and shared between the original and the clone.
+        """
+        return self
+
     def __from_json__(self, **kwargs):
         self.__init__(**kwargs)
         return self
 
+    def structure(self):
+        """
+        Returns the structure of this object: a hashable form of :meth:`__to_json__`, which two objects share exactly
+        when their JSON is the same.  It is worked out once and cached, until :func:`invalidate_structures` is called.
+
+        :rtype: tuple
+        """
+        cached = self.__dict__.get("_structure")
+        if cached is None or cached[0] != _structure_version:
+            structure = _structure_of(self.__to_json__())
+            cached = (_structure_version, structure)
+            self.__dict__["_structure"] = cached
+        return cached[1]
+
     def eq(self, other):
-        return str(self) == str(other)
+        """
+        Checks whether this object has the same JSON form as another.  ``==`` is left comparing identity, as bound
+        methods compare equal when their objects do, and the handlers of one tag must never unbind another's.
+
+        :param JSONObject other: The object to compare with
+        :rtype: bool
+        """
+        return self is other or (isinstance(other, JSONObject) and self.structure() == other.structure())
+
+    def __copy__(self):
+        cls = self.__class__
+        new = cls.__new__(cls)
+        new.__dict__.update(self.__dict__)
+        for cache in _CACHES:
+            new.__dict__.pop(cache, None)
+        return new
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for attribute, value in self.__dict__.items():
+            if attribute not in _CACHES:
+                new.__dict__[attribute] = copy.deepcopy(value, memo)
+        return new
 
     def __str__(self):
         return json.dumps(self.__to_json__(), default=lambda o: o.__to_json__(), sort_keys=True)
 
 
 class Tag(JSONObject):
+    # This tag compiled, once it has been run twice.  Read directly in the methods which run it, as it is quicker than
+    # calling compiled_if_run()
+    _compiled = None
+    # Whether this tag has been run, but not compiled
+    _run = False
+
+    def compiled(self):
+        """
+        Returns this tag compiled by :func:`hearthbreaker.tags.compiler.compile_tag`.  It is compiled the first time
+        it is needed, and then kept.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            from hearthbreaker.tags.compiler import compile_tag
+            compiled = compile_tag(self)
+            self.__dict__["_compiled"] = compiled
+        return compiled
+
+    def compiled_if_run(self):
+        """
+        Returns this tag compiled, if it has been run before.  Otherwise, records that it has been run and returns
+        None, so that it is interpreted instead.  Compiling a tag takes about as long as running it a few times, and
+        many tags, such as the deathrattle of a minion, are only ever run once.
+        """
+        if self._run:
+            return self.compiled()
+        self._run = True
+        return None
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         new = cls.__new__(cls)
         memo[id(self)] = new
         for attribute, value in self.__dict__.items():
+            if attribute in _CACHES:
+                continue
             if attribute != "owner":
                 setattr(new, attribute, copy.deepcopy(value, memo))
             else:
@@ -54,20 +202,49 @@ class Aura(Tag):
         self.owner = owner
 
     def apply(self):
+        if use_compiled:
+            compiled = self._compiled or self.compiled_if_run()
+            if compiled:
+                return compiled[0](self.owner)
         if not self.condition or self.condition.evaluate(self.owner, self.owner):
             targets = self.selector.get_targets(self.owner)
             for target in targets:
                 self.status.act(self.owner, target)
 
     def unapply(self):
+        if use_compiled:
+            compiled = self._compiled or self.compiled_if_run()
+            if compiled:
+                return compiled[1](self.owner)
         targets = self.selector.get_targets(self.owner)
         for target in targets:
             self.status.unact(self.owner, target)
 
     def match(self, obj):
+        if use_compiled:
+            compiled = self._compiled or self.compiled_if_run()
+            if compiled:
+                return compiled[2](self.owner, obj)
         return (not self.condition or self.condition.evaluate(self.owner, self.owner)) and \
             self.selector.match(self.owner, obj)
 
+    def board_dependency(self):
+        """
+        Works out which minions this aura might start or stop affecting when a minion joins or leaves the board.
+
+        :rtype: int
+        :see: :class:`hearthbreaker.constants.BOARD_DEPENDENCY`
+        """
+        if self.condition:
+            return max(self.selector.board_dependency(), self.condition.board_dependency())
+        return self.selector.board_dependency()
+
+    def clone(self):
+        new_aura = copy.copy(self)
+        new_aura.owner = None
+        new_aura.status = self.status.clone()
+        return new_aura
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -115,6 +292,12 @@ class Buff(Tag):
         new_instance.status = self.status.to_instance(target)
         return new_instance
 
+    def clone(self):
+        new_buff = copy.copy(self)
+        new_buff.owner = None
+        new_buff.status = self.status.clone()
+        return new_buff
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -149,6 +332,11 @@ class BuffUntil(Buff):
     def __until__(self, *args):
         self.owner.remove_buff(self)
 
+    def clone(self):
+        new_buff = super().clone()
+        new_buff.until = self.until.clone()
+        return new_buff
+
     def __to_json__(self):
         return {
             'status': self.status,
@@ -178,6 +366,11 @@ class AuraUntil(Aura):
     def __until__(self, *args):
         self.owner.player.remove_aura(self)
 
+    def clone(self):
+        new_aura = super().clone()
+        new_aura.until = self.until.clone()
+        return new_aura
+
     def __to_json__(self):
         return {
             'status': self.status,
@@ -243,6 +436,10 @@ class Picker(JSONObject, metaclass=abc.ABCMeta):
 
 
 class Selector(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.selector"
+    _classes = {}
+    _named = {}
+
     @abc.abstractmethod
     def get_targets(self, source, target=None):
         pass
@@ -254,17 +451,37 @@ class Selector(JSONObject, metaclass=abc.ABCMeta):
     def match(self, source, obj):
         pass
 
+    def target_kinds(self):
+        """
+        Returns the kinds of object which this selector can match.  Objects of any other kind are never matched, so
+        the auras using this selector don't need to be checked against them.
+
+        :rtype: tuple[int]
+        :see: :class:`hearthbreaker.constants.TARGET_KIND`
+        """
+        return TARGET_KIND.ALL
+
+    def board_dependency(self):
+        """
+        Returns how much of the board can change whether this selector matches a minion, when another minion joins
+        or leaves it.
+
+        :rtype: int
+        :see: :class:`hearthbreaker.constants.BOARD_DEPENDENCY`
+        """
+        return BOARD_DEPENDENCY.ALL
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "") + "Selector"
-        cls = getattr(selector_mod, cls_name)
+        cls = Selector._class_named(name, "Selector")
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Action(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.action"
+    _classes = {}
+    _named = {}
 
     @abc.abstractmethod
     def act(self, actor, target, other=None):
@@ -272,15 +489,16 @@ class Action(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.action as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Action._class_named(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Status(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.status"
+    _classes = {}
+    _named = {}
+
     @abc.abstractmethod
     def act(self, actor, target):
         pass
@@ -289,12 +507,12 @@ class Status(JSONObject, metaclass=abc.ABCMeta):
     def unact(self, actor, target):
         pass
 
+    def clone(self):
+        return copy.copy(self)
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.status as status_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(status_mod, cls_name)
+        cls = Status._class_named(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -351,6 +569,10 @@ class Amount(abc.ABCMeta):
 
 
 class Event(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.event"
+    _classes = {}
+    _named = {}
+
     def __init__(self, event_name, condition=None):
         self.event_name = event_name
         self.condition = condition
@@ -369,12 +591,15 @@ class Event(JSONObject, metaclass=abc.ABCMeta):
         if self.condition.evaluate(self.__target__, *args):
             self.__func__(*args)
 
+    def clone(self):
+        new_event = copy.copy(self)
+        new_event.__func__ = None
+        new_event.__target__ = None
+        return new_event
+
     @staticmethod
     def from_json(event_name, **kwargs):
-        import hearthbreaker.tags.event as event_mod
-
-        cls_name = string.capwords(event_name, '_').replace("_", "")
-        cls = getattr(event_mod, cls_name)
+        cls = Event._class_named(event_name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -484,7 +709,17 @@ class Effect(Tag):
     def set_owner(self, owner):
         self.owner = owner
 
+    def clone(self):
+        new_effect = copy.copy(self)
+        new_effect.owner = None
+        new_effect.event = self.event.clone()
+        return new_effect
+
     def _find_target(self, focus=None, other=None, *args):
+        if use_compiled:
+            compiled = self._compiled or self.compiled_if_run()
+            if compiled:
+                return compiled(self.owner, focus, other)
         for tag in self.tags:
             if not tag.do(self.owner, focus, other):
                 break
@@ -503,16 +738,27 @@ class Effect(Tag):
 
 
 class Condition(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.condition"
+    _classes = {}
+    _named = {}
+
     @abc.abstractmethod
     def evaluate(self, target, *args):
         pass
 
+    def board_dependency(self):
+        """
+        Returns how much of the board can change the result of this condition for a minion, when another minion joins
+        or leaves it.  Conditions which don't override this are assumed to depend on the whole board.
+
+        :rtype: int
+        :see: :class:`hearthbreaker.constants.BOARD_DEPENDENCY`
+        """
+        return BOARD_DEPENDENCY.ALL
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.condition as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Condition._class_named(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -531,6 +777,10 @@ class ActionTag(Tag):
         self.condition = condition
 
     def do(self, owner, target=None, other=None):
+        if use_compiled:
+            compiled = self._compiled or self.compiled_if_run()
+            if compiled:
+                return compiled(owner, target, other)
         if self.condition:
             if not self.condition.evaluate(owner, target):
                 return
@@ -639,16 +889,16 @@ class Choice(ActionTag):
 
 
 class Function(JSONObject, metaclass=abc.ABCMeta):
+    _module = "hearthbreaker.tags.selector"
+    _classes = {}
+    _named = {}
 
     def do(self, target, *args):
         pass
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(selector_mod, cls_name)
+        cls = Function._class_named(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -1,9 +1,15 @@
 import abc
 from itertools import chain
 
+from hearthbreaker.constants import CARD_TYPE
 from hearthbreaker.tags.base import CardQuery, Player, Condition, Selector
+from hearthbreaker.tags.condition import IsMinion, IsWeapon, IsSpell, IsSecret, IsType, IsRarity, ManaCost, IsClass
 from hearthbreaker.tags.selector import FriendlyPlayer
 
+# The ids of the collectible cards in the catalogue which have the attributes the conditions of a CollectionSource
+# ask for, keyed by those attributes
+_collection_index = {}
+
 
 class CardSource(CardQuery, metaclass=abc.ABCMeta):
 
@@ -69,9 +75,9 @@ class DeckSource(CardSource):
     def get_list(self, target, player, owner):
         players = self.player.get_players(target)
         if len(players) == 1:
-            return filter(lambda c: not c.drawn, players[0].deck.cards)
+            return players[0].deck.undrawn_cards()
         else:
-            return filter(lambda c: not c.drawn, chain(players[0].deck.cards, players[1].deck.cards))
+            return chain(players[0].deck.undrawn_cards(), players[1].deck.undrawn_cards())
 
     def __to_json__(self):
         return {
@@ -145,10 +151,84 @@ class CardList(CardQuery):
         return CardList([card_lookup(card) for card in cards])
 
 
+def _catalogue_attributes(condition, target):
+    """
+    Works out which attributes in the card catalogue a condition checks, for the given target.
+
+    :return: A list of (attribute, values) pairs, or None if the condition can't be checked against the catalogue
+    """
+    if isinstance(condition, IsMinion):
+        return [('card_type', {CARD_TYPE.MINION})]
+    if isinstance(condition, IsWeapon):
+        return [('card_type', {CARD_TYPE.WEAPON})]
+    if isinstance(condition, IsSecret):
+        return [('card_type', {CARD_TYPE.SECRET})]
+    if isinstance(condition, IsSpell):
+        return [('card_type', {CARD_TYPE.SPELL, CARD_TYPE.SECRET})]
+    if isinstance(condition, IsType):
+        return [('card_type', {CARD_TYPE.MINION}), ('minion_type', {condition.minion_type})]
+    if isinstance(condition, IsRarity):
+        return [('rarity', {condition.rarity})]
+    if isinstance(condition, ManaCost):
+        mana = condition.get_amount(target, target)
+        if isinstance(mana, int):
+            return [('mana', {mana})]
+    elif isinstance(condition, IsClass):
+        character_class = condition.get_amount(target, None)
+        if isinstance(character_class, int):
+            return [('character_class', {character_class})]
+    return None
+
+
 class CollectionSource(CardSource):
+    """
+    Chooses a card from every collectible card.  The conditions which only look at a card's static attributes are
+    looked up in the card catalogue, and only the card chosen is made.  Any other conditions are checked against the
+    cards which pass those.
+    """
     def __init__(self, conditions):
         self.conditions = conditions
 
+    def get_card(self, target, player, owner):
+        from hearthbreaker.engine import card_lookup
+        from hearthbreaker.catalogue import get_catalogue
+        catalogue = get_catalogue()
+        attributes = {}
+        others = []
+        for condition in self.conditions:
+            pairs = _catalogue_attributes(condition, target)
+            if pairs is None:
+                others.append(condition)
+                continue
+            for attribute, values in pairs:
+                attributes[attribute] = attributes.get(attribute, values) & values
+
+        key = tuple(sorted((attribute, tuple(sorted(values))) for attribute, values in attributes.items()))
+        card_ids = _collection_index.get(key)
+        if card_ids is None:
+            card_ids = catalogue.select(collectible=True, **attributes)
+            _collection_index[key] = card_ids
+
+        if others:
+            card_list = catalogue.cards(card_ids)
+            for condition in others:
+                card_list = [card for card in card_list if condition.evaluate(target, card)]
+            card_len = len(card_list)
+            if card_len == 1:
+                return card_list[0]
+            elif card_len == 0:
+                return None
+            else:
+                return player.game.random_choice(card_list)
+
+        card_len = len(card_ids)
+        if card_len == 1:
+            return card_lookup(catalogue.ref_names[card_ids[0]])
+        elif card_len == 0:
+            return None
+        else:
+            return card_lookup(catalogue.ref_names[player.game.random_choice(card_ids)])
+
     def get_list(self, target, player, owner):
         from hearthbreaker.engine import get_cards
         return get_cards()
@@ -0,0 +1,264 @@
+from hearthbreaker.tags.base import ActionTag, Aura, Effect, Selector
+from hearthbreaker.tags.condition import MinionIsNotTarget, Not, And
+from hearthbreaker.tags.selector import FriendlyPlayer, EnemyPlayer, BothPlayer, AllPicker, MinionSelector, \
+    CharacterSelector, HeroSelector, SelfSelector, TargetSelector
+
+
+def compile_tag(tag):
+    """
+    Compiles a tag into closures which do the same as walking its tree of selectors, conditions and actions.  The
+    parts of the tree which are the same every time it is run are worked out once: each selector's players and
+    condition are folded into a single Python expression, and pickers which return every target are skipped.
+
+    Anything the compiler doesn't know how to fold is called through its usual method, so a compiled tag always does
+    exactly what the interpreted one would, in the same order.  Actions and statuses are never compiled, since they
+    can change while the game is played.
+
+    :param hearthbreaker.tags.base.Tag tag: The tag to compile.
+    :return: For an :class:`ActionTag` or :class:`Effect`, a function taking ``(owner, target, other)`` which does
+             the same as :meth:`ActionTag.do` or :meth:`Effect._find_target`.  For an :class:`Aura`, a tuple of
+             ``apply(owner)``, ``unapply(owner)`` and ``match(owner, obj)`` functions.
+    """
+    if isinstance(tag, ActionTag):
+        return compile_action_tag(tag)
+    if isinstance(tag, Effect):
+        return compile_effect(tag)
+    if isinstance(tag, Aura):
+        return compile_aura(tag)
+    raise TypeError("Cannot compile {0}".format(type(tag).__name__))
+
+
+def compile_action_tag(tag):
+    evaluate = compile_condition(tag.condition) if tag.condition else None
+    choose_targets = compiled_selector(tag.selector)[1]
+    acts = [action.act for action in tag.actions]
+
+    if evaluate is None and len(acts) == 1:
+        act = acts[0]
+
+        def do_one(owner, target=None, other=None):
+            found_target = False
+            for t in choose_targets(owner, target):
+                found_target = True
+                if t is owner or t.is_valid():
+                    act(owner, t, other)
+            return found_target
+
+        return do_one
+
+    def do(owner, target=None, other=None):
+        if evaluate is not None and not evaluate(owner, target):
+            return
+        found_target = False
+        for t in choose_targets(owner, target):
+            found_target = True
+            if t is owner or t.is_valid():
+                for act in acts:
+                    act(owner, t, other)
+        return found_target
+
+    return do
+
+
+def compile_effect(effect):
+    dos = [tag.compiled() if isinstance(tag, ActionTag) else tag.do for tag in effect.tags]
+
+    def find_target(owner, focus=None, other=None):
+        for do in dos:
+            if not do(owner, focus, other):
+                break
+
+    return find_target
+
+
+def compile_aura(aura):
+    evaluate = compile_condition(aura.condition) if aura.condition else None
+    get_targets, _, selector_match = compiled_selector(aura.selector)
+    act = aura.status.act
+    unact = aura.status.unact
+
+    def apply(owner):
+        if evaluate is None or evaluate(owner, owner):
+            for target in get_targets(owner):
+                act(owner, target)
+
+    def unapply(owner):
+        for target in get_targets(owner):
+            unact(owner, target)
+
+    if evaluate is None:
+        return apply, unapply, selector_match
+
+    def match(owner, obj):
+        return evaluate(owner, owner) and selector_match(owner, obj)
+
+    return apply, unapply, match
+
+
+def compile_condition(condition):
+    """
+    Compiles a condition into a function taking ``(target, obj)``, with :class:`Not`, :class:`And` and the
+    conditions which only compare their arguments folded into a single expression.
+    """
+    names = {}
+    expression = _condition_expression(condition, "target", "obj", names)
+    return _build("lambda target, obj: " + expression, names)
+
+
+def compiled_selector(selector):
+    """
+    Returns a selector compiled by :func:`compile_selector`.  Selectors are often shared between tags, such as by the
+    copies of a card, so each is compiled the first time it is needed, and then kept.
+    """
+    compiled = selector.__dict__.get("_compiled")
+    if compiled is None:
+        compiled = compile_selector(selector)
+        selector.__dict__["_compiled"] = compiled
+    return compiled
+
+
+def compile_selector(selector):
+    """
+    Compiles a selector, with its players and condition folded into it.
+
+    :return: A tuple of functions in place of :meth:`Selector.get_targets`, :meth:`Selector.choose_targets` and
+             :meth:`Selector.match`, taking ``(source, obj=None)``, ``(source, target=None)`` and ``(source, obj)``
+    :rtype: tuple
+    """
+    get_targets = _compile_get_targets(selector)
+    return get_targets, _compile_choose_targets(selector, get_targets), _compile_match(selector)
+
+
+# The code compiled from each piece of source, which is the same for every tag of the same shape
+_code = {}
+
+
+def _build(source, names):
+    # Turns the source of a lambda, or of a function named compiled, into a function with names as its globals
+    is_lambda = source.startswith("lambda")
+    code = _code.get(source)
+    if code is None:
+        code = compile(source, "<compiled tag>", "eval" if is_lambda else "exec")
+        _code[source] = code
+    namespace = dict(names)
+    if is_lambda:
+        return eval(code, namespace)
+    exec(code, namespace)
+    return namespace["compiled"]
+
+
+def _bind(value, names):
+    # Makes a value available to compiled source, and returns the name it is available under
+    name = "_{0}".format(len(names))
+    names[name] = value
+    return name
+
+
+def _condition_expression(condition, target, obj, names):
+    # Returns an expression which is truthy exactly when condition.evaluate(target, obj) is
+    condition_type = type(condition)
+    if condition_type is MinionIsNotTarget:
+        return "{0} is not {1}".format(obj, target)
+    if condition_type is Not:
+        return "not ({0})".format(_condition_expression(condition.condition, target, obj, names))
+    if condition_type is And:
+        if not condition.conditions:
+            return "True"
+        return " and ".join("({0})".format(_condition_expression(child, target, obj, names))
+                            for child in condition.conditions)
+    return "{0}({1}, {2})".format(_bind(condition.evaluate, names), target, obj)
+
+
+def _players_expression(players, player, names):
+    # Returns an expression for players.get_players(player)
+    players_type = type(players)
+    if players_type is FriendlyPlayer:
+        return "({0},)".format(player)
+    if players_type is EnemyPlayer:
+        return "({0}.opponent,)".format(player)
+    if players_type is BothPlayer:
+        return "({0}.opponent, {0})".format(player)
+    return "{0}({1})".format(_bind(players.get_players, names), player)
+
+
+def _players_match_expression(players, source, obj, names):
+    # Returns an expression which is truthy exactly when players.match(source, obj) is
+    players_type = type(players)
+    if players_type is FriendlyPlayer:
+        return "{0}.player is {1}.player".format(obj, source)
+    if players_type is EnemyPlayer:
+        return "{0}.player is {1}.player.opponent".format(obj, source)
+    if players_type is BothPlayer:
+        return "True"
+    return "{0}({1}, {2})".format(_bind(players.match, names), source, obj)
+
+
+def _match_expression(selector, source, obj, names):
+    # Returns an expression which is truthy exactly when selector.match(source, obj) is, or None if the selector
+    # isn't one which can be compiled
+    selector_type = type(selector)
+    if selector_type is MinionSelector:
+        players = _players_match_expression(selector.players, source, obj, names)
+        if selector.condition:
+            condition = _condition_expression(selector.condition, source, obj, names)
+            return "not {0}.is_card() and {0}.is_minion() and not {0}.dead and ({1}) and ({2})".format(
+                obj, players, condition)
+        return "{0}.is_minion() and ({1}) and not {0}.dead".format(obj, players)
+    if selector_type is CharacterSelector:
+        players = _players_match_expression(selector.players, source, obj, names)
+        if selector.condition:
+            condition = _condition_expression(selector.condition, source, obj, names)
+            return "not {0}.is_card() and not {0}.dead and ({1}) and ({2})".format(obj, players, condition)
+        return "not {0}.is_card() and not {0}.dead and ({1})".format(obj, players)
+    if selector_type is SelfSelector:
+        return "{0} is {1}".format(source, obj)
+    return None
+
+
+def _compile_match(selector):
+    names = {}
+    expression = _match_expression(selector, "source", "obj", names)
+    if expression is None:
+        return selector.match
+    return _build("lambda source, obj: " + expression, names)
+
+
+def _compile_get_targets(selector):
+    selector_type = type(selector)
+    names = {}
+    if selector_type is MinionSelector:
+        return _build("lambda source, obj=None: [minion for player in {0} for minion in player.minions if {1}]".format(
+            _players_expression(selector.players, "source.player", names),
+            _match_expression(selector, "source", "minion", names)), names)
+    if selector_type is CharacterSelector:
+        # The minions come before the heroes, as in CharacterSelector.get_targets
+        return _build("def compiled(source, obj=None):\n"
+                      "    players = {0}\n"
+                      "    return [minion for player in players for minion in player.minions if {1}] + \\\n"
+                      "        [player.hero for player in players if {2}]\n".format(
+                          _players_expression(selector.players, "source.player", names),
+                          _match_expression(selector, "source", "minion", names),
+                          _match_expression(selector, "source", "player.hero", names)), names)
+    if selector_type is HeroSelector:
+        return _build("lambda source, obj=None: [player.hero for player in {0}]".format(
+            _players_expression(selector.players, "(source if source.is_player() else source.player)", names)), names)
+    if selector_type is SelfSelector:
+        return lambda source, obj=None: [source]
+    if selector_type is TargetSelector:
+        if not selector.condition:
+            return lambda source, obj=None: [obj]
+        return _build("lambda source, obj=None: [obj] if {0} else []".format(
+            _condition_expression(selector.condition, "source", "obj", names)), names)
+    return selector.get_targets
+
+
+def _compile_choose_targets(selector, get_targets):
+    selector_type = type(selector)
+    if selector_type is MinionSelector or selector_type is CharacterSelector or selector_type is HeroSelector:
+        if type(selector.picker) is AllPicker:
+            return get_targets
+        pick = selector.picker.pick
+        return lambda source, target=None: pick(source, get_targets(source, target))
+    if selector_type.choose_targets is Selector.choose_targets:
+        return get_targets
+    return selector.choose_targets
@@ -1,5 +1,5 @@
 import hearthbreaker
-from hearthbreaker.constants import MINION_TYPE
+from hearthbreaker.constants import MINION_TYPE, BOARD_DEPENDENCY
 from hearthbreaker.tags.base import Condition, Amount
 
 
@@ -134,6 +134,9 @@ class MinionIsNotTarget(Condition):
     def evaluate(self, target, minion, *args):
         return minion is not target
 
+    def board_dependency(self):
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         return {
             'name': 'minion_is_not_target'
@@ -158,6 +161,9 @@ class Not(Condition):
     def evaluate(self, target, *args):
         return not self.condition.evaluate(target, *args)
 
+    def board_dependency(self):
+        return self.condition.board_dependency()
+
     def __to_json__(self):
         return {
             'name': 'not',
@@ -180,6 +186,9 @@ class And(Condition):
                 return False
         return True
 
+    def board_dependency(self):
+        return max(condition.board_dependency() for condition in self.conditions)
+
     def __to_json__(self):
         return {
             'name': 'and',
@@ -209,6 +218,9 @@ class IsType(Condition):
                 return minion.minion_type == self.minion_type
         return False
 
+    def board_dependency(self):
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         return {
             'name': 'is_type',
@@ -350,6 +362,9 @@ class Adjacent(Condition):
         return minion.player is target.player and \
             (minion.index == target.index - 1) or (minion.index == target.index + 1)
 
+    def board_dependency(self):
+        return BOARD_DEPENDENCY.ADJACENT
+
 
 class TargetAdjacent(Condition):
     def __to_json__(self):
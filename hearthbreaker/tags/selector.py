@@ -1,4 +1,5 @@
 import abc
+from hearthbreaker.constants import TARGET_KIND, BOARD_DEPENDENCY
 from hearthbreaker.tags.base import Selector, Player, Picker, Function, Amount, Condition
 import hearthbreaker.tags.condition
 
@@ -143,6 +144,9 @@ class CardSelector(Selector, metaclass=abc.ABCMeta):
             return obj.is_card() and self.players.match(source, obj) and self.condition.evaluate(source, obj)
         return obj.is_card() and self.players.match(source, obj)
 
+    def target_kinds(self):
+        return (TARGET_KIND.CARD,)
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -205,6 +209,9 @@ class HeroSelector(Selector):
     def match(self, source, obj):
         return obj.is_hero() and self.players.match(source, obj)
 
+    def target_kinds(self):
+        return (TARGET_KIND.HERO,)
+
     def __to_json__(self):
         return {
             'name': 'hero',
@@ -228,6 +235,9 @@ class PlayerSelector(Selector):
     def match(self, source, obj):
         return source.player is obj
 
+    def target_kinds(self):
+        return ()
+
     def __to_json__(self):
         return {
             'name': 'player',
@@ -267,6 +277,16 @@ class MinionSelector(Selector):
         else:
             return obj.is_minion() and self.players.match(source, obj) and not obj.dead
 
+    def target_kinds(self):
+        if self.condition:
+            return (TARGET_KIND.MINION,)
+        return TARGET_KIND.MINION, TARGET_KIND.CARD
+
+    def board_dependency(self):
+        if self.condition:
+            return self.condition.board_dependency()
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -313,6 +333,16 @@ class DeadMinionSelector(Selector):
         else:
             return obj.is_minion() and self.players.match(source, obj)
 
+    def target_kinds(self):
+        if self.condition:
+            return (TARGET_KIND.MINION,)
+        return TARGET_KIND.MINION, TARGET_KIND.CARD
+
+    def board_dependency(self):
+        if self.condition:
+            return self.condition.board_dependency()
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -365,6 +395,14 @@ class CharacterSelector(Selector):
         else:
             return not obj.is_card() and not obj.dead and self.players.match(source, obj)
 
+    def target_kinds(self):
+        return TARGET_KIND.MINION, TARGET_KIND.HERO, TARGET_KIND.WEAPON
+
+    def board_dependency(self):
+        if self.condition:
+            return self.condition.board_dependency()
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -396,6 +434,9 @@ class SelfSelector(Selector):
     def match(self, source, obj):
         return source is obj
 
+    def board_dependency(self):
+        return BOARD_DEPENDENCY.NONE
+
     def __to_json__(self):
         return {
             'name': 'self'
@@ -409,6 +450,12 @@ class ConstantSelector(Selector):
     def match(self, source, obj):
         return obj.is_character() and obj.born in self.targets
 
+    def target_kinds(self):
+        return TARGET_KIND.MINION, TARGET_KIND.HERO
+
+    def board_dependency(self):
+        return BOARD_DEPENDENCY.NONE
+
     def get_targets(self, source, target=None):
         result = []
         for t in self.targets:
@@ -439,6 +486,9 @@ class TargetSelector(Selector):
     def match(self, source, obj):
         return False
 
+    def target_kinds(self):
+        return ()
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -467,6 +517,9 @@ class WeaponSelector(Selector):
     def match(self, source, obj):
         return obj.is_weapon() and self.players.match(source, obj)
 
+    def target_kinds(self):
+        return (TARGET_KIND.WEAPON,)
+
     def __to_json__(self):
         return {
             'name': 'weapon',
@@ -1,4 +1,4 @@
-from hearthbreaker.tags.base import Status, Amount
+from hearthbreaker.tags.base import Status, Amount, invalidate_structures
 
 
 class ChangeAttack(Status, metaclass=Amount):
@@ -25,7 +25,11 @@ class ChangeHealth(Status, metaclass=Amount):
         super().__init__()
 
     def act(self, actor, target):
-        self.amount = self.get_amount(actor, target)
+        amount = self.get_amount(actor, target)
+        if amount != self.amount:
+            # The amount is kept for unact, which changes the JSON for this status
+            self.amount = amount
+            invalidate_structures()
         if self.amount > 0:
             target.health_delta += self.amount
             target.health += self.amount
@@ -15,7 +15,7 @@ class TestAgents(unittest.TestCase):
     def setUp(self):
         random.seed(1857)
 
-    def test_RandomAgent(self):
+    def make_decks(self):
         deck1 = Deck([
             GoldshireFootman(),
             GoldshireFootman(),
@@ -82,6 +82,10 @@ class TestAgents(unittest.TestCase):
             NerubianEgg(),
         ], Guldan())
 
+        return [deck1, deck2]
+
+    def test_RandomAgent(self):
+        deck1, deck2 = self.make_decks()
         game = Game([deck1, deck2], [RandomAgent(), RandomAgent()])
         game.pre_game()
         game.current_player = game.players[1]
@@ -115,3 +119,37 @@ class TestAgents(unittest.TestCase):
         self.assertEqual(21, game.other_player.hero.health)
 
         self.assertTrue(game.game_ended)
+
+    def test_seeded_games(self):
+        def play(game, turns=None):
+            history = []
+            while not game.game_ended and turns != 0:
+                game.play_single_turn()
+                history.append([(player.hero.health, [minion.card.ref_name for minion in player.minions])
+                                for player in game.players])
+                turns = turns and turns - 1
+            return history
+
+        random.seed(1)
+        game = Game(self.make_decks(), [RandomAgent(), RandomAgent()], seed=20)
+        game.pre_game()
+        history = play(game)
+        random.seed(2)
+        game = Game(self.make_decks(), [RandomAgent(), RandomAgent()], seed=20)
+        game.pre_game()
+        self.assertEqual(history, play(game))
+
+        # a copy carries on with the same random numbers, unless it is given its own seed
+        game = Game(self.make_decks(), [RandomAgent(), RandomAgent()], seed=20)
+        game.pre_game()
+        play(game, 6)
+        self.assertEqual(game.child_seed(0), game.child_seed(0))
+        self.assertNotEqual(game.child_seed(0), game.child_seed(1))
+        children = [game.copy(seed=game.child_seed(0)), game.copy(seed=game.child_seed(0)),
+                    game.copy(seed=game.child_seed(1))]
+        copied = game.copy()
+        self.assertEqual(history[6:], play(copied))
+        self.assertEqual(history[6:], play(game))
+        child_history = play(children[0])
+        self.assertEqual(child_history, play(children[1]))
+        self.assertNotEqual(child_history, play(children[2]))
@@ -4,7 +4,7 @@ import unittest
 from hearthbreaker.agents.basic_agents import PredictableAgent, DoNothingAgent
 from hearthbreaker.cards.minions.neutral import V07TR0N, Poultryizer, Nightmare
 from hearthbreaker.constants import CARD_RARITY, MINION_TYPE, CHARACTER_CLASS
-from hearthbreaker.engine import Player
+from hearthbreaker.engine import Player, card_lookup
 from tests.agents.testing_agents import OneCardPlayingAgent, CardTestingAgent, SelfSpellTestingAgent, \
     PlayAndAttackAgent, EnemyMinionSpellTestingAgent, SelfMinionSpellTestingAgent, InspireTestingAgent
 from tests.card_tests.card_tests import TestUtilities
@@ -2256,6 +2256,26 @@ class TestCommon(unittest.TestCase, TestUtilities):
         game.play_single_turn()
         self.assertEqual(1, len(game.players[0].minions))
 
+    def test_MillhouseManastorm_played_by_both_players(self):
+        # Copies of a card share its battlecry, so each must give out its own aura
+        game = generate_game_for(Fireball, Fireball, DoNothingAgent, DoNothingAgent)
+        for turn in range(0, 4):
+            game.play_single_turn()
+
+        costs = []
+        for turn in range(0, 3):
+            game._start_turn()
+            costs.append([card.mana_cost() for card in game.current_player.hand if card.name == "Fireball"][0])
+            millhouse = card_lookup("Millhouse Manastorm")
+            millhouse.player = game.current_player
+            game.current_player.hand.append(millhouse)
+            game.play_card(millhouse)
+            game._end_turn()
+
+        # Each player's spells are free on the turn after the other plays Millhouse
+        self.assertEqual([4, 0, 0], costs)
+        self.assertEqual(3, len(game.players[0].minions) + len(game.players[1].minions))
+
     def test_PintSizedSummoner(self):
         game = generate_game_for(PintSizedSummoner, SiphonSoul, CardTestingAgent, CardTestingAgent)
         for turn in range(0, 4):
@@ -600,6 +600,29 @@ class TestPaladin(unittest.TestCase):
         self.assertEqual(3, game.other_player.minions[0].calculate_max_health())
         self.assertEqual(0, len(game.other_player.secrets))
 
+    def test_Avenge_after_CultMaster(self):
+        # A secret is revealed after the handlers bound before the opponent's turn started, including those bound
+        # after the secret was played
+        game = generate_game_for([Avenge, StonetuskBoar, CultMaster], Wisp, DoNothingAgent, DoNothingAgent)
+        for turn in range(0, 10):
+            game.play_single_turn()
+
+        game._start_turn()
+        player = game.current_player
+        for name in ["Avenge", "Stonetusk Boar", "Cult Master"]:
+            game.play_card([card for card in player.hand if card.name == name][0])
+        game._end_turn()
+
+        order = []
+        player.bind("card_drawn", lambda card: order.append("Cult Master"))
+        player.bind("secret_revealed", lambda secret: order.append(secret.name))
+        game._start_turn()
+        player.minions[1].die(None)
+        game.check_delayed()
+
+        self.assertEqual(["Cult Master", "Avenge"], order)
+        self.assertEqual(0, len(player.secrets))
+
     def test_AvengewithAoE(self):
         game = generate_game_for(Flamestrike, [Avenge, Shieldbearer, IronfurGrizzly, Deathwing],
                                  OneCardPlayingAgent, OneCardPlayingAgent)
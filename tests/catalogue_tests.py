@@ -0,0 +1,131 @@
+import io
+import os
+import tempfile
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.cards import ArgentSquire, FieryWarAxe, Fireball, IceBarrier, MurlocRaider, Wisp
+from hearthbreaker.catalogue import get_catalogue, load_catalogue, source_hash, CardCatalogue
+from hearthbreaker.constants import CARD_TYPE, CHARACTER_CLASS, KEYWORD, MINION_TYPE, CARD_RARITY
+from hearthbreaker.engine import card_lookup, card_table, get_cards
+from hearthbreaker.tags.card_source import CollectionSource
+from hearthbreaker.tags.condition import IsType, ManaCost, IsMinion, IsWeapon, IsRarity, IsSpell, IsClass, Not
+from hearthbreaker.tags.selector import Attribute, HeroSelector, EnemyPlayer
+from tests.testing_utils import generate_game_for, mock
+
+
+class TestCatalogue(unittest.TestCase):
+    def setUp(self):
+        self.catalogue = get_catalogue()
+
+    def test_every_card(self):
+        self.assertEqual(list(card_table), self.catalogue.ref_names)
+        self.assertIs(self.catalogue, get_catalogue())
+
+    def test_attributes(self):
+        catalogue = self.catalogue
+        squire = catalogue.id_of(ArgentSquire().ref_name)
+        self.assertEqual(CARD_TYPE.MINION, catalogue.card_type[squire])
+        self.assertEqual(1, catalogue.mana[squire])
+        self.assertEqual(1, catalogue.attack[squire])
+        self.assertEqual(1, catalogue.health[squire])
+        self.assertEqual(KEYWORD.DIVINE_SHIELD, catalogue.keywords[squire])
+
+        axe = catalogue.id_of(FieryWarAxe().ref_name)
+        self.assertEqual(CARD_TYPE.WEAPON, catalogue.card_type[axe])
+        self.assertEqual(CHARACTER_CLASS.WARRIOR, catalogue.character_class[axe])
+        self.assertEqual(3, catalogue.attack[axe])
+        self.assertEqual(2, catalogue.health[axe])
+
+        self.assertEqual(CARD_TYPE.SPELL, catalogue.card_type[catalogue.id_of(Fireball().ref_name)])
+        self.assertEqual(CARD_TYPE.SECRET, catalogue.card_type[catalogue.id_of(IceBarrier().ref_name)])
+        self.assertIsNone(catalogue.id_of("Not a card"))
+
+    def test_select_matches_cards(self):
+        catalogue = self.catalogue
+        cards = [card_lookup(card_name) for card_name in card_table]
+
+        murlocs = catalogue.select(collectible=True, minion_type=MINION_TYPE.MURLOC)
+        self.assertIn(catalogue.id_of(MurlocRaider().ref_name), murlocs)
+        self.assertEqual([card.ref_name for card in cards if card.is_minion() and card.collectible and
+                          card.minion_type == MINION_TYPE.MURLOC],
+                         [catalogue.ref_names[card_id] for card_id in murlocs])
+
+        common = catalogue.select(rarity=CARD_RARITY.COMMON, mana=0)
+        self.assertIn(catalogue.id_of(Wisp().ref_name), common)
+        self.assertEqual([card.ref_name for card in cards if card.rarity == CARD_RARITY.COMMON and card.mana == 0],
+                         [catalogue.ref_names[card_id] for card_id in common])
+
+        # keywords must all be present, and selections can be narrowed further
+        both = catalogue.select(keywords=KEYWORD.TAUNT | KEYWORD.DIVINE_SHIELD)
+        self.assertEqual(both, catalogue.select(keywords=KEYWORD.DIVINE_SHIELD,
+                                                ids=catalogue.select(keywords=KEYWORD.TAUNT)))
+
+    def test_get_cards(self):
+        self.assertEqual([card.ref_name for card in map(card_lookup, card_table) if card.collectible],
+                         [card.ref_name for card in get_cards()])
+
+    def test_collection_source(self):
+        game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+        player = game.players[0]
+        all_cards = [card_lookup(card_name) for card_name in card_table]
+        collectible = [card for card in all_cards if card.collectible]
+
+        for conditions in [[IsType(MINION_TYPE.MURLOC)], [ManaCost(2), IsMinion()], [IsWeapon()],
+                           [IsRarity(CARD_RARITY.LEGENDARY), IsMinion()], [IsSpell(), IsMinion()],
+                           [IsClass(Attribute("character_class", HeroSelector(EnemyPlayer()))), IsSpell()],
+                           [IsMinion(), Not(IsType(MINION_TYPE.BEAST)), ManaCost(3)]]:
+            expected = collectible
+            for condition in conditions:
+                expected = [card for card in expected if condition.evaluate(player, card)]
+            choices = []
+
+            def choose(options):
+                choices.extend(options)
+                return options[-1]
+
+            game.random_choice = choose
+            card = CollectionSource(conditions).get_card(player, player, player)
+            if len(expected) > 1:
+                # the indexed conditions choose between ids, and any others between cards
+                self.assertEqual([card.ref_name for card in expected],
+                                 [self.catalogue.ref_names[option] if isinstance(option, int) else option.ref_name
+                                  for option in choices])
+            if expected:
+                self.assertEqual(expected[-1].ref_name, card.ref_name)
+            else:
+                self.assertIsNone(card)
+
+    def test_database(self):
+        columns = ["ref_names", "names", "mana", "character_class", "rarity", "card_type", "minion_type",
+                   "collectible", "attack", "health", "keywords"]
+        digest = source_hash()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cards.db")
+            self.assertIsNone(CardCatalogue.open(path, digest))
+
+            self.catalogue.save(path, digest)
+            loaded = CardCatalogue.open(path, digest)
+            for column in columns:
+                self.assertEqual(list(getattr(self.catalogue, column)), list(getattr(loaded, column)), column)
+            self.assertEqual(self.catalogue.select(collectible=True, keywords=KEYWORD.TAUNT),
+                             loaded.select(collectible=True, keywords=KEYWORD.TAUNT))
+            self.assertEqual(self.catalogue.id_of("Wisp"), loaded.id_of("Wisp"))
+
+            # A database built from other sources is rebuilt
+            self.assertIsNone(CardCatalogue.open(path, "0" * 40))
+            CardCatalogue([card_lookup("Wisp")]).save(path, "0" * 40)
+            self.assertEqual(self.catalogue.ref_names, load_catalogue(path).ref_names)
+            self.assertIsNotNone(CardCatalogue.open(path, digest))
+
+        # The database stores values made by these modules, so changing any of them makes it out of date
+        for changed in [("hearthbreaker", "constants.py"), ("hearthbreaker", "game_objects.py"),
+                        ("hearthbreaker", "tags", "base.py"), ("hearthbreaker", "tags", "status.py")]:
+            def changed_open(path, *args, **kwargs):
+                file = open(path, *args, **kwargs)
+                if path.endswith(os.path.join(*changed)):
+                    with file:
+                        return io.BytesIO(file.read() + b"\n")
+                return file
+            with mock.patch("hearthbreaker.catalogue.open", changed_open, create=True):
+                self.assertNotEqual(digest, source_hash())
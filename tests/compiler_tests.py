@@ -0,0 +1,84 @@
+import json
+import random
+import unittest
+
+import hearthbreaker.tags.base
+from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingAgent
+from hearthbreaker.cards import StonetuskBoar, DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, \
+    AbusiveSergeant, ArgentSquire, DefenderOfArgus, NerubianEgg, HarvestGolem, MurlocRaider, BloodfenRaptor, \
+    ShatteredSunCleric, Wisp, FieryWarAxe, ArcaneMissiles, Fireball, Frostbolt, StormwindChampion, RaidLeader, \
+    MurlocWarleader
+from hearthbreaker.constants import MINION_TYPE
+from hearthbreaker.engine import card_lookup
+from hearthbreaker.tags.compiler import compile_condition, compile_selector
+from hearthbreaker.tags.condition import And, Not, IsType, MinionIsNotTarget, Adjacent
+from hearthbreaker.tags.selector import MinionSelector, CharacterSelector, HeroSelector, SelfSelector, \
+    TargetSelector, BothPlayer, EnemyPlayer, PlayerOne, RandomPicker
+from tests.testing_utils import generate_game_for
+
+
+def _to_json(game):
+    return json.dumps(game, default=lambda o: o.__to_json__(), sort_keys=True)
+
+
+class TestCompiler(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+        self.use_compiled = hearthbreaker.tags.base.use_compiled
+
+    def tearDown(self):
+        hearthbreaker.tags.base.use_compiled = self.use_compiled
+
+    def play_game(self, use_compiled, seed):
+        hearthbreaker.tags.base.use_compiled = use_compiled
+        random.seed(seed)
+        game = generate_game_for([DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, AbusiveSergeant,
+                                  ArgentSquire, DefenderOfArgus, NerubianEgg, StormwindChampion],
+                                 [HarvestGolem, MurlocRaider, BloodfenRaptor, ShatteredSunCleric, Wisp,
+                                  FieryWarAxe, ArcaneMissiles, Fireball, Frostbolt, RaidLeader, MurlocWarleader],
+                                 RandomAgent, RandomAgent)
+        while not game.game_ended:
+            game.play_single_turn()
+        return _to_json(game)
+
+    def test_same_games(self):
+        for seed in range(10):
+            self.assertEqual(self.play_game(False, seed), self.play_game(True, seed))
+
+    def test_selectors(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        for player in game.players:
+            for name in ["Stormwind Champion", "Dire Wolf Alpha", "Bloodfen Raptor", "Murloc Raider"]:
+                card_lookup(name).summon(player, game, len(player.minions))
+        game.players[1].minions[2].dead = True
+        source = game.players[0].minions[1]
+        selectors = [MinionSelector(), MinionSelector(None, BothPlayer()), MinionSelector(Adjacent()),
+                     MinionSelector(And(Not(IsType(MINION_TYPE.BEAST)), MinionIsNotTarget()), EnemyPlayer()),
+                     MinionSelector(players=PlayerOne()), CharacterSelector(None, BothPlayer()),
+                     CharacterSelector(IsType(MINION_TYPE.MURLOC), EnemyPlayer()), HeroSelector(EnemyPlayer()),
+                     SelfSelector(), TargetSelector(Not(IsType(MINION_TYPE.BEAST)))]
+        characters = [character for player in game.players for character in [player.hero] + player.minions]
+        for selector in selectors:
+            get_targets, choose_targets, match = compile_selector(selector)
+            for target in characters:
+                self.assertEqual(selector.get_targets(source, target), get_targets(source, target), str(selector))
+                self.assertEqual(selector.choose_targets(source, target), choose_targets(source, target))
+                self.assertEqual(bool(selector.match(source, target)), bool(match(source, target)), str(selector))
+
+        # Pickers other than the one which picks everything are still used
+        random.seed(1857)
+        selector = MinionSelector(picker=RandomPicker(2))
+        expected = list(selector.choose_targets(source))
+        random.seed(1857)
+        self.assertEqual(expected, list(compile_selector(selector)[1](source)))
+
+    def test_conditions(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        card_lookup("Bloodfen Raptor").summon(game.players[0], game, 0)
+        card_lookup("Murloc Raider").summon(game.players[0], game, 1)
+        raptor, murloc = game.players[0].minions
+        for condition in [MinionIsNotTarget(), Not(MinionIsNotTarget()), And(), IsType(MINION_TYPE.BEAST),
+                          And(Not(IsType(MINION_TYPE.BEAST)), MinionIsNotTarget())]:
+            evaluate = compile_condition(condition)
+            for target, obj in [(raptor, raptor), (raptor, murloc), (murloc, raptor)]:
+                self.assertEqual(bool(condition.evaluate(target, obj)), bool(evaluate(target, obj)), str(condition))
@@ -91,6 +91,32 @@ class TestGameCopying(unittest.TestCase):
             game.play_single_turn()
 
 
+class TestCopySharing(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_copy_shares_definitions(self):
+        game = generate_game_for(DireWolfAlpha, StonetuskBoar, OneCardPlayingAgent, DoNothingAgent)
+
+        for turn in range(0, 4):
+            game.play_single_turn()
+
+        new_game = game.copy()
+        minion = game.players[0].minions[0]
+        new_minion = new_game.players[0].minions[0]
+
+        # The aura itself belongs to the copy, but its definition is shared
+        self.assertIsNot(minion.auras[0], new_minion.auras[0])
+        self.assertIs(new_minion, new_minion.auras[0].owner)
+        self.assertIs(minion.auras[0].selector, new_minion.auras[0].selector)
+        self.assertIsNot(minion.card, new_minion.card)
+
+        self.assertIs(game.players[0].hero, game.players[0].hero.power.hero)
+        self.assertIs(new_game.players[0].hero, new_game.players[0].hero.power.hero)
+        self.assertIsNot(game.players[0].deck.cards[0], new_game.players[0].deck.cards[0])
+        self.assertEqual(game.players[0].deck.left, new_game.players[0].deck.left)
+
+
 class TestMinionCopying(unittest.TestCase, TestUtilities):
     def setUp(self):
         random.seed(1857)
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from hearthbreaker.death_speed import death_time, death_times, collectible_cards, card_key, load_cache, save_cache, \
+    write_table
+
+
+class TestDeathSpeed(unittest.TestCase):
+    def test_death_time(self):
+        turns, games = death_time("Flame Imp", runs=30, patience=3)
+        self.assertLess(turns, 10)
+        # A card without random effects takes the same number of turns whichever player goes first, so its games stop
+        # as soon as they are allowed to
+        self.assertLess(games, 30)
+        self.assertEqual((turns, games), death_time("Flame Imp", runs=30, patience=3))
+        # Battlecries are aimed at the enemy hero rather than the minion's own side
+        self.assertLess(death_time("Elven Archer", runs=30, patience=3)[0], 10)
+        self.assertIn("Flame Imp", collectible_cards())
+        self.assertNotIn("Damaged Golem", collectible_cards())
+
+    def test_cache(self):
+        cards = ["Flame Imp", "Mind Blast", "Wisp"]
+        cache = {}
+        played = []
+        times = death_times(cards, runs=4, patience=2, workers=1, cache=cache,
+                            progress=lambda name, turns, games: played.append(name))
+        self.assertEqual(cards, sorted(played))
+        self.assertEqual(set(cards), set(cache))
+        self.assertGreater(times["Mind Blast"], times["Flame Imp"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "cache.json")
+            save_cache(cache_path, cache)
+            cache = load_cache(cache_path)
+            self.assertEqual({}, load_cache(os.path.join(directory, "missing.json")))
+
+            # Only the cards whose key has changed are played again
+            cache["Wisp"]["key"] = "changed"
+            played = []
+            self.assertEqual(times, death_times(cards, runs=4, patience=2, workers=2, cache=cache,
+                                                progress=lambda name, turns, games: played.append(name)))
+            self.assertEqual(["Wisp"], played)
+            self.assertEqual(card_key("Wisp", 4, 2, 0), cache["Wisp"]["key"])
+            self.assertNotEqual(card_key("Wisp", 4, 2, 0), card_key("Wisp", 4, 2, 1))
+
+            table_path = os.path.join(directory, "death_times.csv")
+            write_table(table_path, dict(times, Moonfire=None))
+            with open(table_path) as table_file:
+                lines = table_file.read().splitlines()
+            self.assertEqual(["card,turns", "Flame Imp,{}".format(times["Flame Imp"])], lines[:2])
+            self.assertEqual(4, len(lines))
@@ -1,15 +1,27 @@
+import copy
+import json
 import random
+import subprocess
+import sys
 import unittest
 
 from hearthbreaker.agents.basic_agents import DoNothingAgent, PredictableAgent
-from hearthbreaker.cards.base import SecretCard
+import hearthbreaker.game_objects
+from hearthbreaker.cards.base import SecretCard, MinionCard
 from hearthbreaker.cards.heroes import Malfurion, Jaina
+from hearthbreaker.cards.make_manifest import build_manifest
+from hearthbreaker.cards.manifest import card_classes
 from hearthbreaker.cards.minions.rogue import AnubarAmbusher
-from hearthbreaker.engine import Game, Deck, card_lookup
+from hearthbreaker.engine import Game, Deck, card_lookup, card_table
 from tests.agents.testing_agents import CardTestingAgent, OneCardPlayingAgent, PlayAndAttackAgent
 from tests.testing_utils import generate_game_for, mock
-from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, SylvanasWindrunner
-from hearthbreaker.game_objects import Bindable
+from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, \
+    SylvanasWindrunner, DireWolfAlpha
+from hearthbreaker.game_objects import Bindable, GameException, invalidate_stats
+from hearthbreaker.tags.base import Action, Aura, Buff, Function, Selector, Status
+from hearthbreaker.tags.selector import MinionSelector, Count
+from hearthbreaker.tags.status import ChangeAttack, ChangeHealth, ManaChange
+from hearthbreaker.constants import TARGET_KIND, BOARD_DEPENDENCY
 
 
 class TestGame(unittest.TestCase):
@@ -89,42 +101,24 @@ class TestGame(unittest.TestCase):
             for turn in range(0, secret.mana * 2 - 2):
                 game.play_single_turn()
 
-            def assert_different():
-                new_events = game.events.copy()
-                new_events.update(game.other_player.hero.events)
-                new_events.update(game.other_player.events)
-                new_events.update(game.current_player.hero.events)
-                new_events.update(game.current_player.events)
-                self.assertNotEqual(events, new_events, secret.name)
-
-            def assert_same():
-                new_events = game.events.copy()
-                new_events.update(game.current_player.hero.events)
-                new_events.update(game.current_player.events)
-                new_events.update(game.other_player.hero.events)
-                new_events.update(game.other_player.events)
-                self.assertEqual(events, new_events)
-
-            game.current_player.bind("turn_ended", assert_different)
-            game.other_player.bind("turn_ended", assert_same)
-
             # save the events as they are prior to the secret being played
-            events = game.events.copy()
-            events.update(game.other_player.hero.events)
-            events.update(game.other_player.events)
-            events.update(game.current_player.hero.events)
-            events.update(game.current_player.events)
+            events = dict(game.router.events)
 
-            # The secret is played, but the events aren't updated until the secret is activated
+            # The secret is bound as soon as it is played
             game.play_single_turn()
 
             self.assertEqual(1, len(game.current_player.secrets))
+            self.assertNotEqual(events, game.router.events, secret.name)
+            played = dict(game.router.events)
 
-            # Now the events should be changed
+            # It stays bound as the turns change, rather than being bound and unbound each turn
             game.play_single_turn()
+            self.assertEqual(played, game.router.events, secret.name)
 
             # Now the events should be reset
-            game.play_single_turn()
+            secret = game.other_player.secrets.pop()
+            secret.deactivate(game.other_player)
+            self.assertEqual(events, game.router.events, secret.name)
 
     def test_physical_hero_attacks(self):
         game = generate_game_for(Naturalize, ArcaneIntellect, PredictableAgent, PredictableAgent)
@@ -167,6 +161,233 @@ class TestGame(unittest.TestCase):
 
         self.assertEqual(1, len(game.current_player.minions))
 
+    def test_card_manifest(self):
+        # If this fails, run "python -m hearthbreaker.cards.make_manifest"
+        self.assertEqual(list(build_manifest().items()), list(card_classes.items()))
+        for ref_name, card_type in card_table.items():
+            self.assertEqual(ref_name, card_type().ref_name)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "card modules are imported eagerly before Python 3.7")
+    def test_card_modules_imported_lazily(self):
+        # Other tests have imported every card already, so check in a fresh interpreter
+        script = "import sys, hearthbreaker.engine as engine\n" \
+                 "assert 'hearthbreaker.cards.minions.neutral' not in sys.modules\n" \
+                 "assert engine.card_lookup('Wisp').name == 'Wisp'\n" \
+                 "assert 'hearthbreaker.cards.minions.neutral' in sys.modules\n" \
+                 "assert 'hearthbreaker.cards.spells.mage' not in sys.modules\n" \
+                 "from hearthbreaker.cards import Fireball\n" \
+                 "assert 'hearthbreaker.cards.spells.mage' in sys.modules\n"
+        subprocess.check_call([sys.executable, "-W", "ignore", "-c", script])
+
+    def test_card_lookup_copies_prototype(self):
+        first = card_lookup("Crush")
+        second = card_lookup("Crush")
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.events, second.events)
+        self.assertIsNot(first.buffs[0], second.buffs[0])
+        self.assertIs(first.buffs[0].condition, second.buffs[0].condition)
+
+        first.mana = 0
+        first.buffs.pop()
+        self.assertEqual(7, card_lookup("Crush").mana)
+        self.assertEqual(1, len(card_lookup("Crush").buffs))
+
+        sergeant = card_lookup("Abusive Sergeant")
+        self.assertIs(sergeant.battlecry, card_lookup("Abusive Sergeant").battlecry)
+
+    def test_deck_draw_order(self):
+        cards = [card_lookup("Stonetusk Boar") for index in range(0, 30)]
+        deck = Deck(cards, Malfurion())
+        game = mock.Mock()
+        game.random_amount.side_effect = [3, 3, 0, 2]
+
+        # A random index picks out the same card as it would from the undrawn cards in deck order
+        self.assertIs(cards[3], deck.draw(game))
+        self.assertIs(cards[4], deck.draw(game))
+        game.random_amount.assert_called_with(0, 28)
+
+        deck.put_back(cards[3])
+        self.assertEqual(29, deck.left)
+        self.assertEqual([card for card in cards if not card.drawn], deck.undrawn_cards())
+        self.assertIs(cards[0], deck.draw(game))
+        self.assertIs(cards[3], deck.draw(game))
+
+        deck.remove_card(cards[1])
+        self.assertEqual(26, deck.left)
+        self.assertEqual(cards[2:3] + cards[5:], deck.undrawn_cards())
+
+        # Taking a card out by its flag is picked up the next time the deck is used
+        cards[2].drawn = True
+        deck.left -= 1
+        self.assertEqual(cards[5:], deck.undrawn_cards())
+
+    def test_aura_index(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        player = game.players[0]
+        card_lookup("Stormwind Champion").summon(player, game, 0)
+        card_lookup("Venture Co. Mercenary").summon(player, game, 1)
+        champion_attack, champion_health, venture = player.object_auras
+
+        self.assertEqual([champion_attack], player.auras_for(ChangeAttack, TARGET_KIND.MINION))
+        self.assertEqual([champion_health], player.auras_for(ChangeHealth, TARGET_KIND.MINION))
+        self.assertEqual([], player.auras_for(ChangeAttack, TARGET_KIND.HERO))
+        self.assertEqual([], player.auras_for(ChangeAttack, TARGET_KIND.CARD))
+        self.assertEqual([venture], player.auras_for(ManaChange, TARGET_KIND.CARD))
+        self.assertEqual([], game.players[1].auras_for(ChangeAttack, TARGET_KIND.MINION))
+
+        player.minions[0].die(None)
+        game.check_delayed()
+        self.assertEqual([], player.auras_for(ChangeAttack, TARGET_KIND.MINION))
+        self.assertEqual([venture], player.auras_for(ManaChange, TARGET_KIND.CARD))
+
+        aura = Aura(ChangeAttack(1), MinionSelector())
+        player.add_aura(aura)
+        self.assertEqual([aura], player.auras_for(ChangeAttack, TARGET_KIND.MINION))
+        self.assertEqual(8, player.minions[0].calculate_attack())
+
+    def test_incremental_auras(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        player = game.players[0]
+        card_lookup("Dire Wolf Alpha").summon(player, game, 0)
+        card_lookup("Stormwind Champion").summon(player, game, 1)
+        wolf, champion = player.minions
+        wolf_aura = wolf.auras[0]
+        self.assertEqual(BOARD_DEPENDENCY.ADJACENT, wolf_aura.board_dependency())
+        self.assertEqual(BOARD_DEPENDENCY.NONE, champion.auras[0].board_dependency())
+        self.assertEqual(BOARD_DEPENDENCY.ADJACENT, champion._board_dependency(wolf_aura, 0))
+        self.assertEqual(BOARD_DEPENDENCY.ALL, wolf._board_dependency(wolf_aura, 0))
+        self.assertEqual(3, wolf.calculate_attack())
+        self.assertEqual(7, champion.calculate_attack())
+
+        card_lookup("Bloodfen Raptor").summon(player, game, 0)
+        raptor = player.minions[0]
+        self.assertEqual(5, raptor.calculate_attack())
+        self.assertEqual(3, raptor.health)
+        self.assertEqual(3, wolf.calculate_attack())
+        self.assertEqual(7, champion.calculate_attack())
+
+        card_lookup("Bloodfen Raptor").summon(player, game, 3)
+        self.assertEqual([7, 4], [minion.calculate_attack() for minion in player.minions[2:]])
+        self.assertEqual([6, 3], [minion.health for minion in player.minions[2:]])
+
+        raptor.die(None)
+        game.check_delayed()
+        self.assertEqual([3, 7, 4], [minion.calculate_attack() for minion in player.minions])
+
+        champion.die(None)
+        game.check_delayed()
+        self.assertEqual([2, 4], [minion.calculate_attack() for minion in player.minions])
+        self.assertEqual([2, 2], [minion.health for minion in player.minions])
+
+
+class TestStatCache(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+        hearthbreaker.game_objects.check_stat_cache = True
+
+    def tearDown(self):
+        hearthbreaker.game_objects.check_stat_cache = False
+
+    def test_stat_cache(self):
+        game = generate_game_for(StonetuskBoar, DireWolfAlpha, OneCardPlayingAgent, DoNothingAgent)
+        for turn in range(0, 3):
+            game.play_single_turn()
+
+        boar = game.players[0].minions[0]
+        self.assertEqual(1, boar.calculate_attack())
+        self.assertEqual(1, boar.calculate_attack())
+
+        boar.add_buff(Buff(ChangeAttack(2)))
+        self.assertEqual(3, boar.calculate_attack())
+        aura = Aura(ChangeAttack(1), MinionSelector())
+        game.players[0].add_aura(aura)
+        self.assertEqual(4, boar.calculate_attack())
+        game.players[0].remove_aura(aura)
+        self.assertEqual(3, boar.calculate_attack())
+
+        # The Dire Wolf Alpha joining the board gives the boar next to it +1 attack
+        card_lookup("Dire Wolf Alpha").summon(game.players[0], game, 0)
+        self.assertEqual(4, boar.calculate_attack())
+        game.players[0].minions[0].die(None)
+        game.check_delayed()
+        self.assertEqual(3, boar.calculate_attack())
+
+    def test_stat_cache_checked(self):
+        game = generate_game_for(StonetuskBoar, DireWolfAlpha, OneCardPlayingAgent, DoNothingAgent)
+        for turn in range(0, 3):
+            game.play_single_turn()
+
+        boar = game.players[0].minions[0]
+        self.assertEqual(1, boar.calculate_attack())
+        # A change which isn't followed by invalidate_stats is caught when checking the cache
+        boar.buffs.append(Buff(ChangeAttack(2)))
+        self.assertRaises(GameException, boar.calculate_attack)
+        invalidate_stats()
+        self.assertEqual(3, boar.calculate_attack())
+
+
+class TestTagStructure(unittest.TestCase):
+    def test_structural_equality(self):
+        aura = Aura(ChangeAttack(1), MinionSelector())
+        same = Aura(ChangeAttack(1), MinionSelector())
+        different = Aura(ChangeAttack(2), MinionSelector())
+        self.assertTrue(aura.eq(same))
+        self.assertEqual(hash(aura.structure()), hash(same.structure()))
+        self.assertFalse(aura.eq(different))
+        self.assertFalse(aura.eq(str(aura)))
+        self.assertEqual(2, len({aura.structure(), same.structure(), different.structure()}))
+        self.assertFalse(Buff(ChangeAttack(1)).eq(Buff(ChangeAttack(True))))
+        # Equality itself is left as identity, so that unbinding one tag's handler leaves the others bound
+        self.assertNotEqual(aura, same)
+
+    def test_structure_matches_json(self):
+        tags = []
+        for card_type in card_table.values():
+            card = card_type()
+            if isinstance(card, MinionCard):
+                minion = card.create_minion(None)
+                for minion_tags in [minion.effects, minion.auras, minion.buffs, minion.deathrattle, minion.enrage]:
+                    # Panther passes its minion type where the deathrattles go
+                    if isinstance(minion_tags, list):
+                        tags.extend(minion_tags)
+            for tag in [getattr(card, "battlecry", None), getattr(card, "combo", None)]:
+                if isinstance(tag, tuple):
+                    tags.extend(tag)
+                elif tag:
+                    tags.append(tag)
+        structures = {}
+        for tag in tags:
+            structures.setdefault(str(tag), set()).add(tag.structure())
+        self.assertEqual(len(structures), len({tag.structure() for tag in tags}))
+        for json_form, tag_structures in structures.items():
+            self.assertEqual(1, len(tag_structures), json_form)
+
+    def test_structure_changes(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        status = ChangeHealth(Count(MinionSelector()))
+        buff = Buff(status)
+        copied = copy.copy(buff)
+        self.assertTrue(buff.eq(copied))
+        status.act(game.players[0].hero, game.players[0].hero)
+        self.assertEqual(0, status.amount)
+        self.assertTrue(Buff(ChangeHealth(0)).eq(buff))
+        self.assertFalse(Buff(ChangeHealth(0)).eq(copy.copy(Buff(ChangeHealth(Count(MinionSelector()))))))
+
+    def test_from_json_names(self):
+        self.assertIs(MinionSelector, Selector._classes["MinionSelector"])
+        self.assertIs(Count, Function._classes["Count"])
+        self.assertNotIn("Count", Selector._classes)
+        self.assertNotIn("Aura", Status._classes)
+
+        aura = Aura(ManaChange(-1), MinionSelector())
+        parsed = Aura.from_json(**json.loads(str(aura)))
+        self.assertTrue(aura.eq(parsed))
+        self.assertIs(MinionSelector, type(parsed.selector))
+        self.assertIs(ManaChange, type(parsed.status))
+        self.assertIs(Count, type(Function.from_json(**json.loads(str(Count(MinionSelector()))))))
+        self.assertRaises(AttributeError, Action.from_json, name="not_an_action")
+
 
 class TestBinding(unittest.TestCase):
     def test_bind(self):
@@ -191,3 +412,51 @@ class TestBinding(unittest.TestCase):
         binder.trigger("test")
         event.assert_called_once_with(1, 5, 6)
         self.assertEqual(event2.call_count, 2)
+
+    def test_bind_while_triggering(self):
+        binder = Bindable()
+        called = []
+        added = mock.Mock()
+        removed = mock.Mock()
+
+        def first():
+            called.append("first")
+            binder.bind("test", added)
+            binder.unbind("test", removed)
+
+        binder.bind("test", first)
+        binder.bind_once("test", lambda: called.append("once"))
+        binder.bind("test", removed)
+        handlers = binder.events["test"]
+        binder.trigger("test")
+
+        # Handlers bound while an event is being triggered are only called the next time, and handlers unbound are
+        # still called this time
+        self.assertEqual(["first", "once"], called)
+        self.assertEqual(0, added.call_count)
+        self.assertEqual(1, removed.call_count)
+        self.assertEqual(3, len(handlers))
+        self.assertEqual([first, added], [handler[0] for handler in binder.events["test"]])
+
+        binder.unbind("test", first)
+        binder.trigger("test")
+        self.assertEqual(1, added.call_count)
+        binder.unbind("test", added)
+        self.assertEqual({}, binder.events)
+
+    def test_player_events_are_routed(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        event = mock.Mock()
+        game.players[0].bind("test", event)
+
+        self.assertEqual([(event, False)], game.router.events[("test", game.players[0])])
+        self.assertEqual({"test": [(event, False)]}, game.players[0].events)
+        self.assertEqual({}, game.players[1].events)
+
+        game.players[1].trigger("test", 1)
+        self.assertEqual(0, event.call_count)
+        game.players[0].trigger("test", 1)
+        event.assert_called_once_with(1)
+
+        game.players[0].unbind("test", event)
+        self.assertEqual({}, game.router.events)
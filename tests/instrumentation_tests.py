@@ -0,0 +1,127 @@
+import collections
+import os
+import random
+import tempfile
+import unittest
+
+from hearthbreaker import instrumentation
+from hearthbreaker.agents.basic_agents import DoNothingAgent, RandomAgent
+from hearthbreaker.cards import DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, StonetuskBoar, \
+    HarvestGolem, MurlocRaider, BloodfenRaptor, ShatteredSunCleric, Wisp, Frostbolt
+from hearthbreaker.engine import Game
+from hearthbreaker.game_objects import Bindable, GameException
+from hearthbreaker.sim import read_deck, make_deck, simulate
+from hearthbreaker.tags.base import Action
+from hearthbreaker.tags.status import ChangeAttack
+from tests.testing_utils import generate_game_for, mock
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        random.seed(1857)
+        self.game = generate_game_for([DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, StonetuskBoar],
+                                      [HarvestGolem, MurlocRaider, BloodfenRaptor, ShatteredSunCleric, Wisp, Frostbolt],
+                                      RandomAgent, RandomAgent)
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_counters(self):
+        trigger = Bindable.trigger
+        turns_started = []
+        for player in self.game.players:
+            player.bind("turn_started", turns_started.append)
+        with instrumentation.enabled():
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertIsNot(trigger, Bindable.trigger)
+            self.game.start()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(trigger, Bindable.trigger)
+        self.assertFalse(any(hasattr(vars(cls)["act"], "__wrapped__")
+                             for cls in Action.__subclasses__() if "act" in vars(cls)))
+
+        counters = instrumentation.counters()
+        categories = {category for category, name in counters.calls}
+        self.assertTrue({"trigger", "act", "get_targets", "calculate_stat"} <= categories)
+        turns, seconds = counters.calls[("trigger", "turn_started")]
+        # Players pass their events on to the game's router, but each event is only counted once
+        self.assertEqual(len(turns_started), turns)
+        self.assertGreater(seconds, 0)
+        self.assertTrue(all(count > 0 for count, seconds in counters.calls.values()))
+        rows = counters.rows()
+        self.assertEqual(sorted(rows, key=lambda row: -row[3]), rows)
+        self.assertIn("turn_started", counters.table(limit=100))
+        self.assertEqual(len(rows) + 1, len(counters.table().splitlines()))
+
+        # Nothing is counted while instrumentation is off
+        generate_game_for(Wisp, Wisp, RandomAgent, RandomAgent).start()
+        self.assertEqual(counters.calls, instrumentation.counters().calls)
+        self.assertIs(counters, instrumentation.reset())
+        self.assertEqual({}, instrumentation.counters().calls)
+
+    def test_reentrant_calls(self):
+        # Count every trigger independently, underneath the instrumentation
+        triggered = collections.Counter()
+        trigger = Bindable.trigger
+
+        def counting_trigger(obj, event, *args):
+            triggered[event[0] if isinstance(event, tuple) else event] += 1
+            return trigger(obj, event, *args)
+
+        game = Game([make_deck(read_deck("zoo.hsdeck")), make_deck(read_deck("patron.hsdeck"))],
+                    [RandomAgent(), RandomAgent()], seed=5)
+        with mock.patch.object(Bindable, "trigger", counting_trigger):
+            with instrumentation.enabled():
+                game.start()
+        counted = {name: count for (category, name), (count, seconds) in instrumentation.counters().calls.items()
+                   if category == "trigger"}
+        # Handlers of damage events damage other characters, triggering the same events again while they are running
+        self.assertEqual(dict(triggered), counted)
+
+        # A character's calculate_stat calls the one it overrides, but the call is only counted once
+        hero = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent).players[0].hero
+        instrumentation.reset()
+        with instrumentation.enabled():
+            hero.calculate_stat(ChangeAttack, 0)
+        self.assertEqual({("calculate_stat", "ChangeAttack"): 1},
+                         {key: count for key, (count, seconds) in instrumentation.counters().calls.items()})
+
+    def test_merge(self):
+        first = instrumentation.Counters()
+        first.add("trigger", "died", 0.5)
+        first.add("act", "Damage", 0.25)
+        second = instrumentation.Counters()
+        second.add("trigger", "died", 0.25)
+        second.add("trigger", "died", 0.25)
+        first.merge(second)
+        self.assertEqual({("trigger", "died"): [3, 1.0], ("act", "Damage"): [1, 0.25]}, first.calls)
+        self.assertEqual(first.calls, instrumentation.Counters.from_json(first.__to_json__()).calls)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "counters.json")
+            first.dump(path)
+            self.assertTrue(os.path.getsize(path))
+
+    def test_checkpoint(self):
+        token = self.game.checkpoint()
+        self.assertRaises(GameException, instrumentation.enable)
+        self.game.rollback(token)
+        with instrumentation.enabled():
+            token = self.game.checkpoint()
+            self.game.play_single_turn()
+            self.assertRaises(GameException, instrumentation.disable)
+            self.game.rollback(token)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_simulate(self):
+        deck_lists = [read_deck("zoo.hsdeck"), read_deck("patron.hsdeck")]
+        result = simulate(deck_lists, ["Random", "Random"], 6, workers=1, seed=1, chunk_size=2, instrument=True)
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertGreater(result.counters.calls[("trigger", "turn_started")][0], 6)
+        parallel = simulate(deck_lists, ["Random", "Random"], 6, workers=2, seed=1, chunk_size=2, instrument=True)
+        # The same games make the same calls, whichever processes they are played in
+        self.assertEqual({key: count for key, (count, seconds) in result.counters.calls.items()},
+                         {key: count for key, (count, seconds) in parallel.counters.calls.items()})
+        self.assertIsNone(simulate(deck_lists, ["Random", "Random"], 2, workers=1).counters)
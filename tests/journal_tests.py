@@ -0,0 +1,92 @@
+import json
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.cards import DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, AbusiveSergeant, \
+    ArgentSquire, DefenderOfArgus, NerubianEgg, HarvestGolem, MurlocRaider, BloodfenRaptor, ShatteredSunCleric, \
+    Wisp, FieryWarAxe, ArcaneMissiles, Fireball, Frostbolt
+from hearthbreaker.cards.base import Card
+from hearthbreaker.game_objects import Bindable, Character, GameException
+from tests.testing_utils import generate_game_for
+
+
+def _to_json(game):
+    return json.dumps(game, default=lambda o: o.__to_json__(), sort_keys=True)
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+        self.game = generate_game_for([DireWolfAlpha, KnifeJuggler, Soulfire, Voidwalker, FlameImp, AbusiveSergeant,
+                                       ArgentSquire, DefenderOfArgus, NerubianEgg],
+                                      [HarvestGolem, MurlocRaider, BloodfenRaptor, ShatteredSunCleric, Wisp,
+                                       FieryWarAxe, ArcaneMissiles, Fireball, Frostbolt],
+                                      RandomAgent, RandomAgent)
+
+    def play_turns(self, game, turns):
+        for turn in range(turns):
+            if game.game_ended:
+                return
+            game.play_single_turn()
+
+    def test_rollback(self):
+        for turn in range(8):
+            before = _to_json(self.game)
+            token = self.game.checkpoint()
+            self.play_turns(self.game, 3)
+            self.game.rollback(token)
+            self.assertEqual(before, _to_json(self.game))
+            self.play_turns(self.game, 1)
+
+    def test_replay_after_rollback(self):
+        self.play_turns(self.game, 6)
+        token = self.game.checkpoint()
+        random.seed(4)
+        self.play_turns(self.game, 6)
+        first = _to_json(self.game)
+        self.game.rollback(token)
+
+        random.seed(4)
+        self.play_turns(self.game, 6)
+        self.assertEqual(first, _to_json(self.game))
+
+    def test_nested_checkpoints(self):
+        self.play_turns(self.game, 4)
+        start = _to_json(self.game)
+        outer = self.game.checkpoint()
+        self.play_turns(self.game, 1)
+        middle = _to_json(self.game)
+
+        inner = self.game.checkpoint()
+        self.play_turns(self.game, 2)
+        self.game.rollback(inner)
+        self.assertEqual(middle, _to_json(self.game))
+
+        inner = self.game.checkpoint()
+        self.play_turns(self.game, 2)
+        self.game.commit(inner)
+        self.assertNotEqual(middle, _to_json(self.game))
+
+        self.game.rollback(outer)
+        self.assertEqual(start, _to_json(self.game))
+        self.assertRaises(GameException, self.game.rollback, outer)
+
+    def test_hooks_removed(self):
+        token = self.game.checkpoint()
+        self.assertIn("__setattr__", Character.__dict__)
+        self.assertIn("drawn", Card.__dict__)
+        self.play_turns(self.game, 2)
+        self.game.commit(token)
+
+        self.assertNotIn("__setattr__", Character.__dict__)
+        self.assertNotIn("drawn", Card.__dict__)
+        self.assertIs(Bindable.trigger, Bindable.__dict__["trigger"])
+        self.assertEqual([], self.game._journal.log)
+
+    def test_one_game_at_a_time(self):
+        copied_game = self.game.copy()
+        token = self.game.checkpoint()
+        self.assertRaises(GameException, copied_game.checkpoint)
+        self.game.rollback(token)
+        copied_game.rollback(copied_game.checkpoint())
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from hearthbreaker.matchups import z_score, wilson_interval, run_matchups, load_results, win_rate_matrix, \
+    format_matrix, write_csv
+from hearthbreaker.sim import read_deck
+
+
+class TestMatchups(unittest.TestCase):
+    def setUp(self):
+        self.deck_names = ["zoo.hsdeck", "patron.hsdeck", "example.hsdeck"]
+        self.deck_lists = [read_deck(deck) for deck in self.deck_names]
+
+    def test_interval(self):
+        self.assertAlmostEqual(1.96, z_score(0.95), places=2)
+        self.assertAlmostEqual(2.576, z_score(0.99), places=3)
+        low, high = wilson_interval(50, 100, 1.96)
+        self.assertAlmostEqual(0.404, low, places=3)
+        self.assertAlmostEqual(0.596, high, places=3)
+        low, high = wilson_interval(10, 10, 1.96)
+        self.assertLess(low, 1)
+        self.assertEqual(1, high)
+        self.assertEqual((0, 1), wilson_interval(0, 0, 1.96))
+
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            results_path = os.path.join(directory, "matchups.jsonl")
+            progress = []
+            matchups = run_matchups(self.deck_names, self.deck_lists, ["Random", "Random"], results_path, width=0.5,
+                                    min_games=10, max_games=40, batch_size=5, workers=1,
+                                    progress=lambda matchups: progress.append(len(matchups)))
+            self.assertEqual([(0, 1), (0, 2), (1, 2)], sorted(matchups))
+            z = z_score(0.95)
+            for matchup in matchups.values():
+                self.assertTrue(matchup.settled(z, 0.5, 10, 40))
+                self.assertGreaterEqual(matchup.result.games + matchup.result.errors, 10)
+                self.assertLessEqual(matchup.result.games + matchup.result.errors, 40)
+                self.assertEqual(0, matchup.playing)
+            batches = load_results(results_path)
+            self.assertEqual(len(progress), len(batches))
+            self.assertEqual(sum(matchup.result.games for matchup in matchups.values()),
+                             sum(result.games for key, start, count, result in batches))
+
+            # Running again carries on from the results file, which already has every game needed
+            resumed = run_matchups(self.deck_names, self.deck_lists, ["Random", "Random"], results_path, width=0.5,
+                                   min_games=10, max_games=40, batch_size=5, workers=2)
+            self.assertEqual(len(batches), len(load_results(results_path)))
+            self.assertEqual({key: matchup.result.wins for key, matchup in matchups.items()},
+                             {key: matchup.result.wins for key, matchup in resumed.items()})
+
+            # The games are the same however many workers play them, though more workers may play a few more of them
+            # before a matchup is settled
+            parallel_path = os.path.join(directory, "parallel.jsonl")
+            run_matchups(self.deck_names, self.deck_lists, ["Random", "Random"], parallel_path, width=0.5,
+                         min_games=10, max_games=40, batch_size=5, workers=2)
+            parallel_batches = {(key, start): result.wins for key, start, count, result in load_results(parallel_path)}
+            for key, start, count, result in batches:
+                self.assertEqual(result.wins, parallel_batches[(key, start)])
+
+            # A narrower interval needs more games, which are added to those already played
+            narrower = run_matchups(self.deck_names, self.deck_lists, ["Random", "Random"], results_path, width=0.3,
+                                    min_games=10, max_games=40, batch_size=5, workers=1)
+            self.assertGreater(sum(matchup.result.games for matchup in narrower.values()),
+                               sum(matchup.result.games for matchup in matchups.values()))
+
+            matrix = win_rate_matrix(matchups, 3, z)
+            self.assertIsNone(matrix[1][1])
+            rate, low, high, games = matrix[0][1]
+            self.assertLessEqual(low, rate)
+            self.assertLessEqual(rate, high)
+            self.assertAlmostEqual(1 - rate, matrix[1][0][0])
+            self.assertAlmostEqual(1 - high, matrix[1][0][1])
+            self.assertEqual(4, len(format_matrix(matrix, self.deck_names).splitlines()))
+
+            csv_path = os.path.join(directory, "matrix.csv")
+            write_csv(csv_path, matrix, self.deck_names)
+            with open(csv_path) as csv_file:
+                lines = csv_file.read().splitlines()
+            self.assertEqual("deck,opponent,win_rate,low,high,games", lines[0])
+            self.assertEqual(7, len(lines))
@@ -0,0 +1,124 @@
+import os
+import random
+import tempfile
+import unittest
+
+from hearthbreaker import instrumentation, profiler
+from hearthbreaker.agents.basic_agents import DoNothingAgent, RandomAgent
+from hearthbreaker.cards import KnifeJuggler, HarvestGolem, Wisp, Flamestrike, DireWolfAlpha, Soulfire, Voidwalker, \
+    MurlocRaider, BloodfenRaptor, ShatteredSunCleric
+from hearthbreaker.game_objects import GameException
+from hearthbreaker.sim import read_deck, simulate
+from hearthbreaker.tags.base import Aura, Effect
+from tests.testing_utils import generate_game_for
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+        profiler.reset()
+
+    def tearDown(self):
+        profiler.disable()
+        profiler.reset()
+
+    def test_cascade(self):
+        find_target = Effect._find_target
+        with profiler.enabled():
+            self.assertIsNot(find_target, Effect._find_target)
+            game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+            player = game.players[0]
+            KnifeJuggler().summon(player, game, 0)
+            HarvestGolem().summon(player, game, 1)
+            player.minions[1].die(None)
+            game.check_delayed()
+        self.assertIs(find_target, Effect._find_target)
+        self.assertEqual(["Knife Juggler", "Damaged Golem"], [minion.card.ref_name for minion in player.minions])
+
+        costs = profiler.costs()
+        # Knife Juggler threw a knife when each golem was summoned, and the second time was set off by the deathrattle
+        calls, seconds, cascade_seconds, events, depth = costs.cards["Knife Juggler"]
+        self.assertEqual(2, calls)
+        self.assertEqual(3, depth)
+        self.assertGreater(events, 0)
+        calls, seconds, cascade_seconds, events, depth = costs.cards["Harvest Golem"]
+        self.assertEqual(1, calls)
+        self.assertEqual(1, depth)
+        self.assertGreater(cascade_seconds, seconds)
+        self.assertEqual(0, costs.games)
+
+    def test_games(self):
+        with profiler.enabled():
+            for game in range(3):
+                generate_game_for([Flamestrike, DireWolfAlpha, Soulfire, Voidwalker],
+                                  [MurlocRaider, BloodfenRaptor, ShatteredSunCleric, KnifeJuggler],
+                                  RandomAgent, RandomAgent).start()
+        self.assertFalse(profiler.is_enabled())
+        self.assertFalse(any(hasattr(vars(cls)[method], "__wrapped__") for cls in [Aura] + Aura.__subclasses__()
+                             for method in ["apply", "unapply", "match"] if method in vars(cls)))
+
+        costs = profiler.costs()
+        self.assertEqual(3, costs.games)
+        for card in ["Flamestrike", "Dire Wolf Alpha", "Shattered Sun Cleric", "Knife Juggler"]:
+            self.assertIn(card, costs.cards)
+        rows = costs.rows()
+        self.assertEqual(sorted(rows, key=lambda row: -row[2]), rows)
+        self.assertTrue(all(depth >= 1 for name, calls, seconds, cascade, events, depth in rows))
+        self.assertEqual(len(rows) + 1, len(costs.table().splitlines()))
+        self.assertIs(costs, profiler.reset())
+        self.assertEqual({}, profiler.costs().cards)
+
+    def test_after_disable(self):
+        with profiler.enabled():
+            game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+            player = game.players[0]
+            KnifeJuggler().summon(player, game, 0)
+            Wisp().summon(player, game, 1)
+        costs = profiler.reset()
+        self.assertEqual(1, costs.cards["Knife Juggler"][0])
+
+        # Knife Juggler's effect still has the profiled method bound, but it no longer counts anything
+        Wisp().summon(player, game, 2)
+        self.assertEqual(28, game.players[1].hero.health)
+        self.assertEqual(1, costs.cards["Knife Juggler"][0])
+        self.assertEqual({}, profiler.costs().cards)
+        game.start()
+        self.assertEqual({}, profiler.costs().cards)
+
+    def test_merge(self):
+        first = profiler.CardCosts()
+        first.games = 2
+        first.add("Knife Juggler", 0.25, 0.5, 3, 1)
+        second = profiler.CardCosts()
+        second.games = 1
+        second.add("Knife Juggler", 0.25, 0.25, 1, 2)
+        second.add("Wisp", 0.5, 0.5, 0, 1)
+        first.merge(second)
+        self.assertEqual(3, first.games)
+        self.assertEqual({"Knife Juggler": [2, 0.5, 0.75, 4, 3], "Wisp": [1, 0.5, 0.5, 0, 1]}, first.cards)
+        self.assertEqual(first.cards, profiler.CardCosts.from_json(**first.__to_json__()).cards)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "costs.json")
+            first.dump(path)
+            self.assertTrue(os.path.getsize(path))
+
+    def test_exclusive(self):
+        with instrumentation.enabled():
+            self.assertRaises(GameException, profiler.enable)
+        with profiler.enabled():
+            self.assertRaises(GameException, instrumentation.enable)
+        game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+        token = game.checkpoint()
+        self.assertRaises(GameException, profiler.enable)
+        game.rollback(token)
+
+    def test_simulate(self):
+        deck_lists = [read_deck("zoo.hsdeck"), read_deck("patron.hsdeck")]
+        result = simulate(deck_lists, ["Random", "Random"], 4, workers=1, seed=2, chunk_size=2, profile=True)
+        self.assertFalse(profiler.is_enabled())
+        self.assertEqual(4, result.card_costs.games)
+        parallel = simulate(deck_lists, ["Random", "Random"], 4, workers=2, seed=2, chunk_size=1, profile=True)
+        # The same games run the same cards' code, whichever processes they are played in
+        self.assertEqual({name: values[0] for name, values in result.card_costs.cards.items()},
+                         {name: values[0] for name, values in parallel.card_costs.cards.items()})
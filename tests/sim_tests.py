@@ -0,0 +1,56 @@
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.cards import Wisp
+from hearthbreaker.engine import derive_seed
+from hearthbreaker.sim import read_deck, make_deck, simulate, play_games, SimulationResult
+from tests.testing_utils import generate_game_for
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self.deck_lists = [read_deck("zoo.hsdeck"), read_deck("patron.hsdeck")]
+
+    def test_read_deck(self):
+        self.assertEqual(30, len(self.deck_lists[0]))
+        self.assertEqual(["Shieldbearer", "Shieldbearer", "Flame Imp"], self.deck_lists[0][:3])
+        self.assertEqual("Gul'dan", make_deck(self.deck_lists[0]).hero.name)
+        self.assertEqual("Garrosh Hellscream", make_deck(self.deck_lists[1]).hero.name)
+
+    def test_simulate(self):
+        progress = []
+        result = simulate(self.deck_lists, ["Random", "Random"], 30, workers=1, seed=3, chunk_size=7,
+                          progress=lambda results, elapsed: progress.append(results.games + results.errors))
+        self.assertEqual([7, 14, 21, 28, 30], progress)
+        self.assertEqual(30, result.games + result.errors)
+        self.assertEqual(result.games, sum(result.wins) + result.draws)
+        self.assertEqual(result.games, sum(result.lengths.values()))
+
+        # Each game has its own seed, so the games are the same however they are split up
+        parallel = simulate(self.deck_lists, ["Random", "Random"], 30, workers=2, seed=3, chunk_size=4)
+        self.assertEqual(result.__dict__, parallel.__dict__)
+        games = play_games([make_deck(card_names) for card_names in self.deck_lists], ["Random", "Random"], 3, 10, 5)
+        self.assertEqual(5, games.games + games.errors)
+
+    def test_results(self):
+        first = SimulationResult()
+        game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+        game.players[0].hero.dead = True
+        game._turns_passed = 4
+        first.add_game(game)
+        self.assertEqual([0, 1] if game.first_player == 0 else [1, 0], first.wins)
+        first.add_error(7, derive_seed(0, 7), ValueError("Broken"))
+
+        second = SimulationResult()
+        game.players[1].hero.dead = True
+        game._turns_passed = 50
+        second.add_game(game)
+        second.add_error(2, derive_seed(0, 2), KeyError("Missing"))
+
+        first.merge(second)
+        self.assertEqual(2, first.games)
+        self.assertEqual(1, first.draws)
+        self.assertEqual(27, first.mean_length())
+        self.assertEqual(2, first.errors)
+        self.assertEqual([(2, derive_seed(0, 2), "KeyError: 'Missing'"), (7, derive_seed(0, 7), "ValueError: Broken")],
+                         first.error_details)
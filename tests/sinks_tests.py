@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+
+from hearthbreaker.agents.basic_agents import PredictableAgent
+from hearthbreaker.cards import Wisp, StonetuskBoar
+from hearthbreaker.sim import read_deck, simulate
+from hearthbreaker.sinks import GameRecorder, JSONLSink, NumpySink, ResultSink
+from tests.testing_utils import generate_game_for
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class ListSink(ResultSink):
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def make_record(index):
+    return {'game': index, 'seed': index * 3, 'winner': index % 2, 'turns': 10 + index, 'first_player': 1,
+            'damage': [index, 40], 'cards_played': [12, index], 'error': "ValueError: Broken" if index == 3 else None}
+
+
+class TestSinks(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_game_recorder(self):
+        game = generate_game_for(StonetuskBoar, Wisp, PredictableAgent, PredictableAgent)
+        sink = ListSink()
+        recorder = GameRecorder(game, 5, sink=sink)
+        game.start()
+        self.assertEqual(1, len(sink.records))
+        record = sink.records[0]
+        self.assertEqual(recorder.record(), record)
+        self.assertEqual(5, record['game'])
+        self.assertEqual(0, record['winner'])
+        self.assertEqual(game._turns_passed, record['turns'])
+        self.assertEqual(None, record['error'])
+        # The boars' hero took no damage but its minions did, while the wisps' hero took all 30
+        self.assertLess(30, record['damage'][1])
+        self.assertEqual(record['cards_played'][0] + record['cards_played'][1], len(game._all_cards_played))
+        self.assertEqual(-1, recorder.record(ValueError("Broken"))['winner'])
+
+    def test_jsonl(self):
+        with JSONLSink(self.directory.name, records_per_file=4, buffer_size=64) as sink:
+            for index in range(10):
+                sink.write(make_record(index))
+        self.assertEqual(["games-00000.jsonl", "games-00001.jsonl", "games-00002.jsonl"],
+                         sorted(os.listdir(self.directory.name)))
+        records = []
+        for path in sink.paths:
+            with open(path) as file:
+                records.extend(json.loads(line) for line in file)
+        self.assertEqual([make_record(index) for index in range(10)], records)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        with NumpySink(self.directory.name, records_per_file=4, buffer_size=3) as sink:
+            for index in range(10):
+                sink.write(make_record(index))
+        self.assertEqual(["games-00000.npy", "games-00001.npy", "games-00002.npy"],
+                         sorted(os.listdir(self.directory.name)))
+        records = numpy.concatenate([numpy.load(path, mmap_mode="r") for path in sink.paths])
+        self.assertEqual(list(range(10)), list(records['game']))
+        self.assertEqual([index * 3 for index in range(10)], list(records['seed']))
+        self.assertEqual([[index, 40] for index in range(10)], records['damage'].tolist())
+        self.assertEqual([index == 3 for index in range(10)], list(records['error']))
+
+    def test_simulation(self):
+        deck_lists = [read_deck("zoo.hsdeck"), read_deck("patron.hsdeck")]
+        sink = ListSink()
+        result = simulate(deck_lists, ["Random", "Random"], 12, workers=1, chunk_size=5, sinks=[sink])
+        self.assertEqual(list(range(12)), [record['game'] for record in sink.records])
+        self.assertEqual(result.wins, [sum(1 for record in sink.records if record['winner'] == deck)
+                                       for deck in range(2)])
+        self.assertEqual(result.draws, sum(1 for record in sink.records if record['winner'] == -1))